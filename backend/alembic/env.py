@@ -11,6 +11,7 @@ import modules.participants.model  # noqa: F401
 import modules.registration.models  # noqa: F401
 import modules.matches.model  # noqa: F401
 import modules.users.model  # noqa: F401
+import modules.outbox.model  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,32 @@
+"""add keyset pagination index to announcements
+
+Revision ID: 5b1f0c7d2a91
+Revises: d086e319d9c3
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1f0c7d2a91"
+down_revision: Union[str, Sequence[str], None] = "d086e319d9c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_announcements_created_at_id",
+        "announcements",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_announcements_created_at_id", table_name="announcements")
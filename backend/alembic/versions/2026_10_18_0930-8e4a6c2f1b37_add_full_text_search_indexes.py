@@ -0,0 +1,88 @@
+"""add full text search vector to announcements and trigram index to games
+
+Revision ID: 8e4a6c2f1b37
+Revises: 5b1f0c7d2a91
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4a6c2f1b37"
+down_revision: Union[str, Sequence[str], None] = "5b1f0c7d2a91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Existing rows keep a NULL search_vector until `make search-backfill` runs,
+    so the migration itself never rewrites the announcements table.
+    """
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    op.add_column(
+        "announcements",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    op.execute(
+        sa.text(
+            "CREATE OR REPLACE FUNCTION announcements_search_vector("
+            "title text, content text) RETURNS tsvector "
+            "LANGUAGE sql IMMUTABLE AS $$ "
+            "SELECT setweight(to_tsvector('simple', coalesce(title, '')), 'A') "
+            "|| setweight(to_tsvector('simple', coalesce(content, '')), 'B') $$"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE OR REPLACE FUNCTION announcements_search_vector_update() "
+            "RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+            "NEW.search_vector := announcements_search_vector(NEW.title, NEW.content); "
+            "RETURN NEW; END $$"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_announcements_search_vector "
+            "BEFORE INSERT OR UPDATE OF title, content ON announcements "
+            "FOR EACH ROW EXECUTE FUNCTION announcements_search_vector_update()"
+        )
+    )
+    op.create_index(
+        "ix_announcements_search_vector",
+        "announcements",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_games_name_trgm",
+        "games",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_games_name_trgm", table_name="games")
+    op.drop_index("ix_announcements_search_vector", table_name="announcements")
+    op.execute(
+        sa.text(
+            "DROP TRIGGER IF EXISTS trg_announcements_search_vector ON announcements"
+        )
+    )
+    op.execute(sa.text("DROP FUNCTION IF EXISTS announcements_search_vector_update()"))
+    op.execute(
+        sa.text("DROP FUNCTION IF EXISTS announcements_search_vector(text, text)")
+    )
+    op.drop_column("announcements", "search_vector")
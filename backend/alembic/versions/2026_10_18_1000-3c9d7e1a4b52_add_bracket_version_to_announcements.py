@@ -0,0 +1,36 @@
+"""add bracket_version to announcements
+
+Revision ID: 3c9d7e1a4b52
+Revises: 8e4a6c2f1b37
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9d7e1a4b52"
+down_revision: Union[str, Sequence[str], None] = "8e4a6c2f1b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "announcements",
+        sa.Column(
+            "bracket_version",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("announcements", "bracket_version")
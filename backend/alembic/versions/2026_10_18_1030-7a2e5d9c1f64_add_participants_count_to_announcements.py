@@ -0,0 +1,81 @@
+"""add participants_count to announcements
+
+Revision ID: 7a2e5d9c1f64
+Revises: 3c9d7e1a4b52
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2e5d9c1f64"
+down_revision: Union[str, Sequence[str], None] = "3c9d7e1a4b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The counter is kept by a row trigger on announcement_participants, so every
+    insert and delete, including cascades from deleted users, updates it in the
+    same transaction.
+    """
+    op.add_column(
+        "announcements",
+        sa.Column(
+            "participants_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.execute(
+        sa.text(
+            "UPDATE announcements SET participants_count = counts.total "
+            "FROM (SELECT announcement_id, count(*) AS total "
+            "FROM announcement_participants GROUP BY announcement_id) AS counts "
+            "WHERE announcements.id = counts.announcement_id"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE OR REPLACE FUNCTION announcements_participants_count_update() "
+            "RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+            "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+            "UPDATE announcements SET participants_count = participants_count + 1 "
+            "WHERE id = NEW.announcement_id; "
+            "END IF; "
+            "IF TG_OP IN ('DELETE', 'UPDATE') THEN "
+            "UPDATE announcements SET participants_count = participants_count - 1 "
+            "WHERE id = OLD.announcement_id; "
+            "END IF; "
+            "RETURN NULL; END $$"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER trg_announcement_participants_count "
+            "AFTER INSERT OR DELETE OR UPDATE OF announcement_id "
+            "ON announcement_participants "
+            "FOR EACH ROW EXECUTE FUNCTION announcements_participants_count_update()"
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        sa.text(
+            "DROP TRIGGER IF EXISTS trg_announcement_participants_count "
+            "ON announcement_participants"
+        )
+    )
+    op.execute(
+        sa.text("DROP FUNCTION IF EXISTS announcements_participants_count_update()")
+    )
+    op.drop_column("announcements", "participants_count")
@@ -0,0 +1,47 @@
+"""add partial indexes for announcement status transitions
+
+Revision ID: 4f8b2d6e9a13
+Revises: 7a2e5d9c1f64
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8b2d6e9a13"
+down_revision: Union[str, Sequence[str], None] = "7a2e5d9c1f64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Each index only holds announcements waiting for one transition, so the
+    reconciliation run of update_announcement_statuses reads the few due rows
+    instead of scanning the table.
+    """
+    op.create_index(
+        "ix_announcements_pre_registration_start",
+        "announcements",
+        ["registration_start_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PRE_REGISTRATION'"),
+    )
+    op.create_index(
+        "ix_announcements_registration_open_end",
+        "announcements",
+        ["registration_end_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'REGISTRATION_OPEN'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_announcements_registration_open_end", table_name="announcements")
+    op.drop_index("ix_announcements_pre_registration_start", table_name="announcements")
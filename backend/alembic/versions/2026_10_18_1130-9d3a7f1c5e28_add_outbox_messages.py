@@ -0,0 +1,47 @@
+"""add outbox_messages
+
+Revision ID: 9d3a7f1c5e28
+Revises: 4f8b2d6e9a13
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3a7f1c5e28"
+down_revision: Union[str, Sequence[str], None] = "4f8b2d6e9a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox_messages",
+        sa.Column("task_name", sa.String(length=255), nullable=False),
+        sa.Column("kwargs", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_outbox_messages")),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("outbox_messages")
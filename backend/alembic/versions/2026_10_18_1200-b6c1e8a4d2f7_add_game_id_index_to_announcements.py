@@ -0,0 +1,44 @@
+"""add game_id index to announcements
+
+Revision ID: b6c1e8a4d2f7
+Revises: 9d3a7f1c5e28
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6c1e8a4d2f7"
+down_revision: Union[str, Sequence[str], None] = "9d3a7f1c5e28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes game_id for the game-name branch of the search. The index is built
+    CONCURRENTLY outside the migration transaction, so writes to announcements
+    are not blocked while it builds.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_announcements_game_id",
+            "announcements",
+            ["game_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_announcements_game_id",
+            table_name="announcements",
+            postgresql_concurrently=True,
+        )
@@ -1,4 +1,14 @@
-from fastapi import APIRouter, UploadFile, File, Depends, Query
+from fastapi import (
+    APIRouter,
+    UploadFile,
+    File,
+    Depends,
+    Header,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 
 from exceptions import AppException
 from modules.users.model import User
@@ -9,9 +19,17 @@ from modules.registration.schemas import (
     RegistrationRequestResponse,
 )
 from modules.registration.search import RegistrationRequestSearch
-from core.deps import SessionDep
+from core.cache import ANNOUNCEMENT, get_response_cache
+from core.deps import ReadSessionDep, SessionDep
+from core.responses import FastJSONResponse
+from core.live import LiveSubscription, bracket_channel, versioned_event_stream
+from core.utils import etag_matches, strong_etag
 from core.users import current_user, current_user_or_none
-from core.permissions import authorize_action, get_permissions, get_batch_permissions
+from core.permissions import (
+    authorize_action,
+    get_batch_permissions,
+    get_payload_permissions,
+)
 
 from modules.announcements.model import Announcement
 from modules.announcements.queries import AnnouncementQueries
@@ -45,9 +63,15 @@ from operations.generate_announcement_bracket.contract import (
 from operations.generate_announcement_bracket.scenario import (
     GenerateAnnouncementBracketScenario,
 )
+from operations.submit_match_results.contract import SubmitMatchResultsContract
+from operations.submit_match_results.scenario import SubmitMatchResultsScenario
 from modules.announcements.utils.bracket import get_bracket
 from modules.matches.queries import MatchQueries
-from modules.matches.schemas import BracketResponse, MatchResponse
+from modules.matches.schemas import (
+    BracketResponse,
+    MatchResponse,
+    MatchResultsBatchUpdate,
+)
 
 from modules.participants.queries import ParticipantQueries
 
@@ -65,35 +89,88 @@ async def get_announcement_dependency(
     return announcement
 
 
+async def get_minimal_announcement_dependency(
+    session: SessionDep,
+    announcement_id: int,
+) -> Announcement:
+    """Load the announcement's columns only, for routes that just authorize on it."""
+    queries = AnnouncementQueries(session)
+    announcement = await queries.find_by_id(announcement_id, profile="minimal")
+    if not announcement:
+        raise AppException("Announcement not found", status_code=404)
+    return announcement
+
+
+async def get_bracket_etag(session: SessionDep, announcement_id: int) -> str:
+    """
+    Return the strong ETag of an announcement's bracket and match list.
+
+    Reads only ``announcements.bracket_version``, which every match write
+    bumps in the same transaction, so no match rows are loaded.
+    """
+    version = await AnnouncementQueries(session).find_bracket_version(announcement_id)
+    if version is None:
+        raise AppException("Announcement not found", status_code=404)
+    return strong_etag(announcement_id, version)
+
+
 @router.get("", response_model=PaginatedResponse[AnnouncementResponse])
 async def get_announcements(
-    session: SessionDep,
+    session: ReadSessionDep,
     filters: AnnouncementFilter = Depends(),
     user: User | None = Depends(current_user_or_none),
     skip: int = 0,
     limit: int = 10,
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "Keyset pagination cursor. Pass an empty value to start from the first "
+            "page, then the `next_cursor` of the previous response; `skip` is ignored. "
+            "Later pages repeat the first page's `filtered_count`."
+        ),
+    ),
 ) -> PaginatedResponse[AnnouncementResponse]:
     search = AnnouncementSearch(session=session, filters=filters)
-    announcements = await search.results(skip=skip, limit=limit)
-    filtered_announcements_count = await search.filtered_count()
-    total_announcements_count = await search.total_count()
-    get_batch_permissions(user, announcements)
+    if cursor is None:
+        page = await search.paginate(skip=skip, limit=limit)
+        get_batch_permissions(user, page.items, Announcement)
+        return PaginatedResponse(
+            data=page.items,
+            skip=skip,
+            limit=limit,
+            filtered_count=page.filtered_count,
+            total_count=page.total_count,
+        )
+
+    page = await search.cursor_paginate(cursor=cursor, limit=limit)
+    get_batch_permissions(user, page.items, Announcement)
     return PaginatedResponse(
-        data=announcements,
-        skip=skip,
+        data=page.items,
+        skip=0,
         limit=limit,
-        filtered_count=filtered_announcements_count,
-        total_count=total_announcements_count,
+        filtered_count=page.filtered_count,
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
     )
 
 
 @router.get("/{announcement_id}", response_model=DataResponse[AnnouncementResponse])
 async def get_announcement(
-    announcement: Announcement = Depends(get_announcement_dependency),
+    session: SessionDep,
+    announcement_id: int,
     user: User | None = Depends(current_user_or_none),
-) -> DataResponse[AnnouncementResponse]:
-    announcement.permissions = get_permissions(user, announcement)
-    return DataResponse(data=announcement)
+) -> FastJSONResponse:
+    async def build() -> dict:
+        announcement = await get_announcement_dependency(session, announcement_id)
+        return AnnouncementResponse.model_validate(announcement).model_dump(
+            mode="json", exclude={"permissions"}
+        )
+
+    data = await get_response_cache().get_or_build(
+        ANNOUNCEMENT, announcement_id, "detail", build
+    )
+    data["permissions"] = get_payload_permissions(user, Announcement, data)
+    return FastJSONResponse({"data": data})
 
 
 @router.get(
@@ -102,20 +179,29 @@ async def get_announcement(
 )
 async def get_announcement_participants(
     session: SessionDep,
+    announcement_id: int,
     skip: int = 0,
     limit: int = 10,
-    announcement: Announcement = Depends(get_announcement_dependency),
-) -> PaginatedResponse[AnnouncementParticipantResponse]:
-    queries = ParticipantQueries(session)
-    participants, total = await queries.find_all_by_announcement_id(
-        announcement_id=announcement.id, skip=skip, limit=limit
-    )
-    return PaginatedResponse(
-        data=participants,
-        skip=skip,
-        limit=limit,
-        filtered_count=total,
-        total_count=total,
+) -> FastJSONResponse:
+    async def build() -> dict:
+        announcement = await get_announcement_dependency(session, announcement_id)
+        participants, total = await ParticipantQueries(
+            session
+        ).find_all_by_announcement_id(
+            announcement_id=announcement.id, skip=skip, limit=limit
+        )
+        return PaginatedResponse[AnnouncementParticipantResponse](
+            data=participants,
+            skip=skip,
+            limit=limit,
+            filtered_count=total,
+            total_count=total,
+        ).model_dump(mode="json")
+
+    return FastJSONResponse(
+        await get_response_cache().get_or_build(
+            ANNOUNCEMENT, announcement_id, f"participants:{skip}:{limit}", build
+        )
     )
 
 
@@ -165,16 +251,14 @@ async def get_announcement_registration_requests(
         filters=filters,
         scope=announcement,
     )
-    registration_requests = await search.results(skip=skip, limit=limit)
-    filtered_count = await search.filtered_count()
-    total_count = await search.total_count()
+    page = await search.paginate(skip=skip, limit=limit)
 
     return PaginatedResponse(
-        data=registration_requests,
+        data=page.items,
         skip=skip,
         limit=limit,
-        filtered_count=filtered_count,
-        total_count=total_count,
+        filtered_count=page.filtered_count,
+        total_count=page.total_count,
     )
 
 
@@ -287,30 +371,110 @@ async def generate_bracket(
 )
 async def get_announcement_matches(
     session: SessionDep,
+    announcement_id: int,
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
-    announcement: Announcement = Depends(get_announcement_dependency),
+    etag: str = Depends(get_bracket_etag),
+    if_none_match: str | None = Header(default=None),
 ) -> PaginatedResponse[MatchResponse]:
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     queries = MatchQueries(session)
     matches, total = await queries.find_all_by_announcement_id(
-        announcement_id=announcement.id, skip=skip, limit=limit
+        announcement_id=announcement_id, skip=skip, limit=limit
     )
+    response.headers["ETag"] = etag
     return PaginatedResponse(
         data=matches, skip=skip, limit=limit, filtered_count=total, total_count=total
     )
 
 
+@router.post(
+    "/{announcement_id}/matches/results",
+    response_model=DataResponse[list[MatchResponse]],
+)
+async def submit_match_results(
+    session: SessionDep,
+    results_in: MatchResultsBatchUpdate,
+    announcement: Announcement = Depends(get_minimal_announcement_dependency),
+    user: User = Depends(current_user),
+) -> DataResponse[list[MatchResponse]]:
+    """
+    Set the winners of several matches and advance the bracket.
+
+    Results are applied in bracket order, so a batch may contain a match
+    together with the matches that feed it. All results are written in one
+    transaction; if any is invalid, none is applied.
+    Requires organizer or admin privileges on the announcement.
+    """
+    authorize_action(user, announcement, "manage_lifecycle")
+    scenario = SubmitMatchResultsScenario(session)
+    matches = await scenario.run(
+        SubmitMatchResultsContract(
+            announcement_id=announcement.id,
+            results_in=results_in,
+        )
+    )
+    await session.commit()
+    return DataResponse(data=matches)
+
+
 @router.get(
     "/{announcement_id}/bracket",
     response_model=DataResponse[BracketResponse],
 )
 async def get_announcement_bracket(
     session: SessionDep,
-    announcement: Announcement = Depends(get_announcement_dependency),
-) -> DataResponse[BracketResponse]:
-    data = await get_bracket(announcement, session)
+    announcement_id: int,
+    etag: str = Depends(get_bracket_etag),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    async def build() -> dict:
+        announcement = await get_announcement_dependency(session, announcement_id)
+        data = await get_bracket(announcement, session)
+        return DataResponse(data=data).model_dump(mode="json")
+
+    payload = await get_response_cache().get_or_build(
+        ANNOUNCEMENT, announcement_id, f"bracket:{etag}", build
+    )
+    return FastJSONResponse(payload, headers={"ETag": etag})
+
+
+@router.get("/{announcement_id}/bracket/stream", response_class=StreamingResponse)
+async def stream_announcement_bracket(
+    session: SessionDep,
+    request: Request,
+    announcement_id: int,
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of the bracket.
 
-    return DataResponse(data=data)
+    Sends one ``snapshot`` event (the bracket plus its ``version``), then a
+    ``delta`` event per submitted match result with the changed matches (in
+    the snapshot's match shape), new placements and the announcement status.
+    """
+    subscription = await LiveSubscription.open(bracket_channel(announcement_id))
+    try:
+        announcement = await get_announcement_dependency(session, announcement_id)
+        version = announcement.bracket_version
+        snapshot = await get_bracket(announcement, session)
+    except BaseException:
+        await subscription.close()
+        raise
+    await session.close()
+
+    return StreamingResponse(
+        versioned_event_stream(
+            request, subscription, snapshot.model_dump(mode="json"), version
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post(
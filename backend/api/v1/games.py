@@ -8,10 +8,16 @@ from modules.games.search import GameSearch
 from modules.users.model import User
 from exceptions import AppException
 from core.services.avatar_uploader import upload_avatar
-from core.deps import SessionDep
+from core.cache import GAME, get_response_cache
+from core.deps import ReadSessionDep, SessionDep
+from core.responses import FastJSONResponse
 from core.schemas.base import PaginatedResponse, DataResponse
 from core.users import current_user, current_user_or_none
-from core.permissions import authorize_action, get_permissions, get_batch_permissions
+from core.permissions import (
+    authorize_action,
+    get_batch_permissions,
+    get_payload_permissions,
+)
 
 router = APIRouter(prefix="/games", tags=["games"])
 
@@ -29,33 +35,39 @@ async def get_game_dependency(
 
 @router.get("", response_model=PaginatedResponse[GameResponse])
 async def get_games(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: User | None = Depends(current_user_or_none),
     filters: GameFilter = Depends(),
     skip: int = 0,
     limit: int = 10,
 ) -> PaginatedResponse[GameResponse]:
     search = GameSearch(session=session, filters=filters)
-    games = await search.results(skip=skip, limit=limit)
-    filtered_games_count = await search.filtered_count()
-    total_games_count = await search.total_count()
-    get_batch_permissions(user, games)
+    page = await search.paginate(skip=skip, limit=limit)
+    get_batch_permissions(user, page.items)
     return PaginatedResponse(
-        data=games,
+        data=page.items,
         skip=skip,
         limit=limit,
-        filtered_count=filtered_games_count,
-        total_count=total_games_count,
+        filtered_count=page.filtered_count,
+        total_count=page.total_count,
     )
 
 
 @router.get("/{game_id}", response_model=DataResponse[GameResponse])
 async def get_game(
-    game: Game = Depends(get_game_dependency),
+    session: SessionDep,
+    game_id: int,
     user: User | None = Depends(current_user_or_none),
-) -> DataResponse[GameResponse]:
-    game.permissions = get_permissions(user, game)
-    return DataResponse(data=game)
+) -> FastJSONResponse:
+    async def build() -> dict:
+        game = await get_game_dependency(session, game_id)
+        return GameResponse.model_validate(game).model_dump(
+            mode="json", exclude={"permissions"}
+        )
+
+    data = await get_response_cache().get_or_build(GAME, game_id, "detail", build)
+    data["permissions"] = get_payload_permissions(user, Game, data)
+    return FastJSONResponse({"data": data})
 
 
 @router.post("", response_model=DataResponse[GameResponse])
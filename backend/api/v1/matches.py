@@ -32,7 +32,7 @@ async def get_announcement_for_match_dependency(
 ) -> Announcement:
     """Load the announcement that owns the match, or raise 404."""
     queries = AnnouncementQueries(session)
-    announcement = await queries.find_by_id(match.announcement_id)
+    announcement = await queries.find_by_id(match.announcement_id, profile="minimal")
     if not announcement:
         raise AppException("Announcement not found", status_code=404)
     return announcement
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 
 from core.schemas.base import PaginatedResponse
 from modules.users.model import User
-from core.deps import SessionDep
+from core.deps import ReadSessionDep, SessionDep
 from core.users import current_user
 
 from modules.announcements.queries import AnnouncementQueries
@@ -78,16 +78,14 @@ async def get_my_registration_requests(
         filters=filters,
         scope=user,
     )
-    registration_requests = await search.results(skip=skip, limit=limit)
-    filtered_count = await search.filtered_count()
-    total_count = await search.total_count()
+    page = await search.paginate(skip=skip, limit=limit)
 
     return PaginatedResponse(
-        data=registration_requests,
+        data=page.items,
         skip=skip,
         limit=limit,
-        filtered_count=filtered_count,
-        total_count=total_count,
+        filtered_count=page.filtered_count,
+        total_count=page.total_count,
     )
 
 
@@ -97,7 +95,7 @@ async def get_my_registration_requests(
 )
 async def get_user_organized_announcements(
     user_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     skip: int = 0,
     limit: int = 10,
 ) -> PaginatedResponse[AnnouncementResponse]:
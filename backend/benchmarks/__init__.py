@@ -0,0 +1 @@
+"""Micro-benchmarks run against the configured database: ``python -m benchmarks.<name>``."""
@@ -0,0 +1,84 @@
+"""
+Compare ORM hydration with the projection read model for one announcement page.
+
+Both paths fetch the same page and validate it into ``AnnouncementResponse``;
+each round uses a fresh session so the identity map never serves the ORM path.
+Run against a database holding at least ``limit`` announcements:
+
+    python -m benchmarks.read_models [limit] [rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import desc, select
+from core.db.container import get_db
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
+from modules.announcements.model import Announcement
+from modules.announcements.read_models import (
+    select_announcement_list,
+    to_announcement_responses,
+)
+from modules.announcements.schemas import AnnouncementResponse
+
+
+async def orm_page(session, limit: int) -> list[AnnouncementResponse]:
+    result = await session.execute(
+        select(Announcement)
+        .options(*ANNOUNCEMENT_LOADERS.options("list"))
+        .order_by(desc(Announcement.created_at), desc(Announcement.id))
+        .limit(limit)
+    )
+    return [AnnouncementResponse.model_validate(a) for a in result.scalars().all()]
+
+
+async def projection_page(session, limit: int) -> list[AnnouncementResponse]:
+    result = await session.execute(
+        select_announcement_list()
+        .order_by(desc(Announcement.created_at), desc(Announcement.id))
+        .limit(limit)
+    )
+    return to_announcement_responses(result.scalars().all())
+
+
+async def measure(
+    session_factory,
+    page: Callable[..., Awaitable[list[AnnouncementResponse]]],
+    limit: int,
+    rounds: int,
+) -> tuple[list[float], int]:
+    timings = []
+    size = 0
+    for _ in range(rounds):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            items = await page(session, limit)
+            timings.append((time.perf_counter() - started) * 1000)
+            size = len(items)
+    return timings, size
+
+
+async def main(limit: int = 100, rounds: int = 50):
+    db = get_db()
+    try:
+        for page in (orm_page, projection_page):
+            await measure(db.session_factory, page, limit, 3)
+        results = {
+            page.__name__: await measure(db.session_factory, page, limit, rounds)
+            for page in (orm_page, projection_page)
+        }
+    finally:
+        await db.dispose()
+
+    for name, (timings, size) in results.items():
+        print(
+            f"{name:<16} {size} rows  median {statistics.median(timings):.2f} ms  "
+            f"p95 {statistics.quantiles(timings, n=20)[-1]:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:3])))
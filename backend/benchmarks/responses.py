@@ -0,0 +1,121 @@
+"""
+Measure JSON encoding of the announcements list response.
+
+Loads one page the way ``GET /api/v1/announcements`` does, then times each
+encoder on it, and finally the endpoint itself through the ASGI app:
+
+- ``stdlib``: ``model_dump(mode="json")`` plus ``json.dumps`` (``JSONResponse``)
+- ``response_model``: FastAPI's path for the route, validating the returned
+  model and dumping it straight to bytes
+- ``fast_json``: ``model_dump(mode="json")`` plus ``FastJSONResponse``
+- ``*_cached``: encoding an already dumped payload, as cache hits do
+
+Run against a database holding at least ``limit`` announcements:
+
+    python -m benchmarks.responses [limit] [rounds]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from api import router
+from api.v1 import announcements
+from core.db.container import get_db
+from core.responses import FastJSONResponse
+from core.schemas.base import PaginatedResponse
+from modules.announcements.schemas import AnnouncementFilter, AnnouncementResponse
+from modules.announcements.search import AnnouncementSearch
+
+LIST_PATH = "/api/v1/announcements"
+
+
+def list_response_field():
+    for route in announcements.router.routes:
+        if (
+            isinstance(route, APIRoute)
+            and route.endpoint is announcements.get_announcements
+        ):
+            return route.response_field
+    raise LookupError(LIST_PATH)
+
+
+async def load_page(session, limit: int) -> PaginatedResponse[AnnouncementResponse]:
+    search = AnnouncementSearch(session=session, filters=AnnouncementFilter())
+    page = await search.paginate(skip=0, limit=limit)
+    return PaginatedResponse(
+        data=page.items,
+        skip=0,
+        limit=limit,
+        filtered_count=page.filtered_count,
+        total_count=page.total_count,
+    )
+
+
+def measure(encode: Callable[[], bytes], rounds: int) -> tuple[list[float], int]:
+    timings = []
+    size = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        size = len(encode())
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, size
+
+
+async def measure_endpoint(app: FastAPI, limit: int, rounds: int) -> list[float]:
+    timings = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            response = await c.get(LIST_PATH, params={"limit": limit})
+            response.raise_for_status()
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float], detail: str = "") -> None:
+    print(
+        f"{name:<22} {detail:<12} median {statistics.median(timings):.3f} ms  "
+        f"p95 {statistics.quantiles(timings, n=20)[-1]:.3f} ms"
+    )
+
+
+async def main(limit: int = 100, rounds: int = 200):
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    field = list_response_field()
+
+    db = get_db()
+    try:
+        async with db.session_factory() as session:
+            page = await load_page(session, limit)
+        await measure_endpoint(app, limit, 3)
+        endpoint = await measure_endpoint(app, limit, rounds)
+    finally:
+        await db.dispose()
+
+    payload = page.model_dump(mode="json")
+    encoders = {
+        "stdlib": lambda: JSONResponse(page.model_dump(mode="json")).body,
+        "response_model": lambda: field.serialize_json(field.validate(page)[0]),
+        "fast_json": lambda: FastJSONResponse(page.model_dump(mode="json")).body,
+        "stdlib_cached": lambda: JSONResponse(payload).body,
+        "fast_json_cached": lambda: FastJSONResponse(payload).body,
+    }
+    for name, encode in encoders.items():
+        measure(encode, 10)
+        timings, size = measure(encode, rounds)
+        report(name, timings, f"{size} B")
+    report("endpoint", endpoint, f"{len(page.data)} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:3])))
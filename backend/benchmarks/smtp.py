@@ -0,0 +1,78 @@
+"""
+Measure email throughput against a local SMTP server.
+
+Starts an ``aiosmtpd`` server that accepts and drops every message, then sends
+the same verification email through each path and reports messages per second:
+
+- ``per_message``: a new connection per message, as ``EmailService`` did
+  before pooling
+- ``pooled``: ``SMTPPool`` with ``concurrency`` connections
+
+``aiosmtpd`` is not a project dependency; run with:
+
+    uv run --with aiosmtpd python -m benchmarks.smtp [messages] [concurrency]
+"""
+
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+
+from core.services.email import EmailService, SMTPPool
+from mailers.user_mailer import UserMailer
+
+HOST = "127.0.0.1"
+PORT = 8025
+
+
+class DropHandler:
+    async def handle_DATA(self, server, session, envelope) -> str:
+        return "250 OK"
+
+
+async def send_per_message(message) -> None:
+    async with aiosmtplib.SMTP(hostname=HOST, port=PORT) as server:
+        await server.send_message(message)
+
+
+async def measure(
+    send: Callable[[object], Awaitable[None]],
+    message,
+    messages: int,
+    concurrency: int,
+) -> float:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send_one() -> None:
+        async with slots:
+            await send(message)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send_one() for _ in range(messages)))
+    return messages / (time.perf_counter() - started)
+
+
+async def main(messages: int = 1000, concurrency: int = 4):
+    mailer = UserMailer()
+    mail = mailer.verification_email("bench@example.com", "token", "Bench")
+    message = EmailService._build_message(mail)
+
+    controller = Controller(DropHandler(), hostname=HOST, port=PORT)
+    controller.start()
+    pool = SMTPPool(HOST, PORT, size=concurrency)
+    try:
+        paths = {"per_message": send_per_message, "pooled": pool.send_message}
+        for name, send in paths.items():
+            await measure(send, message, concurrency * 5, concurrency)
+            rate = await measure(send, message, messages, concurrency)
+            print(f"{name:<12} {messages} messages x{concurrency}  {rate:.0f} msg/s")
+    finally:
+        await pool.close()
+        controller.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:3])))
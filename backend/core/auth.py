@@ -1,17 +1,81 @@
+import time
+
+import jwt
+from fastapi_users import BaseUserManager, exceptions
 from fastapi_users.authentication import (
     BearerTransport,
     JWTStrategy,
     AuthenticationBackend,
 )
+from fastapi_users.jwt import decode_jwt, generate_jwt
+
+from core.cache.user_cache import get_user_cache
 from core.config import get_settings
+from modules.users.model import User
 
 bearer_transport = BearerTransport(tokenUrl="/api/auth/login")
 
 
+class CachedJWTStrategy(JWTStrategy[User, int]):
+    """
+    Access-token strategy that serves the token's user from the user cache.
+
+    Tokens carry their issue time (``iat``); a user is cached per id and
+    ``iat``, so authenticated requests normally run without a users query.
+    Tokens issued without ``iat`` always load the user.
+    """
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[User, int]
+    ) -> User | None:
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+        except jwt.PyJWTError:
+            return None
+        if data.get("sub") is None:
+            return None
+
+        try:
+            user_id = user_manager.parse_id(data["sub"])
+        except exceptions.InvalidID:
+            return None
+
+        issued_at = data.get("iat")
+        cache = get_user_cache()
+        if issued_at is not None:
+            user = await cache.get(user_id, issued_at)
+            if user is not None:
+                return user
+
+        try:
+            user = await user_manager.get(user_id)
+        except exceptions.UserNotExists:
+            return None
+
+        if issued_at is not None:
+            await cache.set(user, issued_at)
+        return user
+
+    async def write_token(self, user: User) -> str:
+        data = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "iat": int(time.time()),
+        }
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm
+        )
+
+
 def get_jwt_strategy() -> JWTStrategy:
     settings = get_settings()
 
-    return JWTStrategy(
+    return CachedJWTStrategy(
         secret=settings.auth.secret_key,
         lifetime_seconds=settings.auth.access_token_expire_minutes * 60,
         token_audience=["gameannouncer:auth"],
@@ -0,0 +1,20 @@
+"""Redis-backed caches of public read payloads and of authenticated users."""
+
+from core.cache.invalidation import mark_stale
+from core.cache.response_cache import (
+    ANNOUNCEMENT,
+    GAME,
+    ResponseCache,
+    get_response_cache,
+)
+from core.cache.user_cache import UserCache, get_user_cache
+
+__all__ = [
+    "ANNOUNCEMENT",
+    "GAME",
+    "ResponseCache",
+    "UserCache",
+    "get_response_cache",
+    "get_user_cache",
+    "mark_stale",
+]
@@ -0,0 +1,36 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.cache.response_cache import get_response_cache
+from core.db.commit_hooks import (
+    collect_for_commit,
+    pending_for_commit,
+    register_commit_hook,
+)
+
+_STALE_KEY = "response_cache_stale"
+
+
+def mark_stale(session: AsyncSession | Session, entity: str, entity_id: int) -> None:
+    """
+    Record that a cached entity changes when ``session`` commits.
+
+    Write paths call this next to their flush. The cache is only invalidated
+    after the transaction commits, so readers never cache a payload built from
+    data that is later rolled back, and a rollback discards the marks.
+    """
+    if entity_id is None:
+        return
+    collect_for_commit(session, _STALE_KEY, (entity, entity_id))
+
+
+def pending_stale(session: AsyncSession | Session) -> set[tuple[str, int]]:
+    """Return the entities marked stale in the current transaction."""
+    return set(pending_for_commit(session, _STALE_KEY))
+
+
+async def _invalidate(entries: list[tuple[str, int]]) -> None:
+    await get_response_cache().invalidate(set(entries))
+
+
+register_commit_hook(_STALE_KEY, _invalidate)
@@ -0,0 +1,115 @@
+import json
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import get_settings
+from core.logger import logger
+
+ANNOUNCEMENT = "announcement"
+GAME = "game"
+
+_MIN_VERSION_TTL_SECONDS = 24 * 60 * 60
+
+
+def version_key(entity: str, entity_id: int) -> str:
+    return f"cache:{entity}:{entity_id}:version"
+
+
+def payload_key(entity: str, entity_id: int, version: int, variant: str) -> str:
+    return f"cache:{entity}:{entity_id}:v{version}:{variant}"
+
+
+class ResponseCache:
+    """Shared cache of serialized public read payloads.
+
+    Every cached entity has a version counter. Payloads are stored under the
+    version that was current when they were built, so invalidation is a single
+    ``INCR``: older payloads stop being addressable and expire on their TTL.
+    A payload built from data read before a concurrent write therefore can
+    never be served after that write's invalidation.
+
+    Version counters live much longer than payloads, so an expired counter
+    can never address a stale payload again. Redis failures are logged and
+    treated as cache misses; the cache never makes a read fail.
+    """
+
+    def __init__(self, redis: Redis | None, ttl_seconds: int = 300) -> None:
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._version_ttl_seconds = max(_MIN_VERSION_TTL_SECONDS, ttl_seconds * 10)
+
+    @property
+    def enabled(self) -> bool:
+        return self._redis is not None
+
+    async def get_or_build(
+        self,
+        entity: str,
+        entity_id: int,
+        variant: str,
+        build: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached payload for ``variant`` of an entity, building it on a miss.
+
+        ``build`` must return a JSON-compatible dict (``model_dump(mode="json")``).
+        Exceptions raised by ``build`` (e.g. a 404) propagate and nothing is cached.
+        """
+        if self._redis is None:
+            return await build()
+
+        try:
+            version = int(await self._redis.get(version_key(entity, entity_id)) or 0)
+            key = payload_key(entity, entity_id, version, variant)
+            cached = await self._redis.get(key)
+        except RedisError as e:
+            logger.warning(f"Response cache unavailable, serving uncached: {e}")
+            return await build()
+
+        if cached is not None:
+            return json.loads(cached)
+
+        payload = await build()
+        try:
+            await self._redis.set(
+                key, json.dumps(payload, separators=(",", ":")), ex=self._ttl_seconds
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to store response cache entry {key}: {e}")
+        return payload
+
+    async def invalidate(self, entries: Iterable[tuple[str, int]]) -> None:
+        """Bump the version of every ``(entity, entity_id)`` in ``entries``."""
+        if self._redis is None:
+            return
+
+        keys = {version_key(entity, entity_id) for entity, entity_id in entries}
+        if not keys:
+            return
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                    pipe.expire(key, self._version_ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate response cache: {e}")
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache configured from settings."""
+    settings = get_settings()
+    if not settings.cache.enabled:
+        return ResponseCache(redis=None)
+
+    redis = Redis.from_url(
+        settings.redis.url,
+        socket_timeout=settings.cache.socket_timeout,
+        socket_connect_timeout=settings.cache.socket_timeout,
+    )
+    return ResponseCache(redis=redis, ttl_seconds=settings.cache.ttl_seconds)
@@ -0,0 +1,181 @@
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, TypedDict
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from core.config import get_settings
+from core.logger import logger
+from modules.users.model import User
+
+_UNCACHED_COLUMNS = frozenset({"hashed_password"})
+
+
+def user_key(user_id: int) -> str:
+    return f"auth:user:{user_id}"
+
+
+def _python_type(column: Any) -> Any:
+    try:
+        return column.columns[0].type.python_type
+    except NotImplementedError:
+        return Any
+
+
+_USER_VALUES = TypeAdapter(
+    TypedDict(
+        "CachedUserValues",
+        {
+            column.key: _python_type(column) | None
+            for column in inspect(User).column_attrs
+            if column.key not in _UNCACHED_COLUMNS
+        },
+        total=False,
+    )
+)
+"""JSON codec of cached column values, restoring datetimes and other types."""
+
+
+def _user_values(user: User) -> dict[str, Any]:
+    return {
+        column.key: getattr(user, column.key)
+        for column in inspect(User).column_attrs
+        if column.key not in _UNCACHED_COLUMNS
+    }
+
+
+def _detached_user(values: dict[str, Any]) -> User:
+    """
+    Build a fresh ``User`` for one request from cached column values.
+
+    The instance is detached rather than new, so adding it to a session (as
+    ``UserManager.update`` does) updates the existing row. The password hash is
+    never cached; it loads from the database if a session ever needs it.
+    """
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+class UserCache:
+    """Short-lived cache of authenticated users, keyed by user id and token ``iat``.
+
+    Entries live in an in-process LRU and, when ``redis`` is given, in one Redis
+    hash per user shared by all processes. ``invalidate`` drops every token's
+    entry of a user from this process and from Redis; other processes may
+    serve their local copy until it expires, so ``ttl_seconds`` (per layer)
+    bounds how long a change to a user, such as deactivation, can go unnoticed.
+
+    Each hit returns a new ``User`` instance, never one shared between
+    requests. Redis failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 30,
+        max_entries: int = 10_000,
+        redis: Redis | None = None,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._redis = redis
+        self._local: OrderedDict[int, dict[int, tuple[float, dict[str, Any]]]] = (
+            OrderedDict()
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 or self._redis is not None
+
+    async def get(self, user_id: int, issued_at: int) -> User | None:
+        """Return the cached user for a token issued at ``issued_at``, if any."""
+        values = self._get_local(user_id, issued_at)
+        if values is None and self._redis is not None:
+            try:
+                cached = await self._redis.hget(user_key(user_id), str(issued_at))
+            except RedisError as e:
+                logger.warning(f"User cache unavailable, loading user: {e}")
+                return None
+            if cached is not None:
+                values = _USER_VALUES.validate_json(cached)
+                self._set_local(user_id, issued_at, values)
+        return None if values is None else _detached_user(values)
+
+    async def set(self, user: User, issued_at: int) -> None:
+        """Cache ``user`` for the token issued at ``issued_at``."""
+        if not self.enabled:
+            return
+
+        values = _user_values(user)
+        self._set_local(user.id, issued_at, values)
+        if self._redis is None:
+            return
+
+        key = user_key(user.id)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, str(issued_at), _USER_VALUES.dump_json(values))
+                pipe.expire(key, self._ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to store user cache entry {key}: {e}")
+
+    async def invalidate(self, user_id: int) -> None:
+        """Drop every cached token entry of ``user_id``."""
+        self._local.pop(user_id, None)
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.delete(user_key(user_id))
+        except RedisError as e:
+            logger.warning(f"Failed to invalidate user cache for {user_id}: {e}")
+
+    def _get_local(self, user_id: int, issued_at: int) -> dict[str, Any] | None:
+        entries = self._local.get(user_id)
+        if entries is None or issued_at not in entries:
+            return None
+
+        expires_at, values = entries[issued_at]
+        if expires_at <= time.monotonic():
+            del entries[issued_at]
+            return None
+        self._local.move_to_end(user_id)
+        return values
+
+    def _set_local(self, user_id: int, issued_at: int, values: dict[str, Any]) -> None:
+        if self._max_entries <= 0:
+            return
+
+        entries = self._local.setdefault(user_id, {})
+        entries[issued_at] = (time.monotonic() + self._ttl_seconds, values)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+
+@lru_cache()
+def get_user_cache() -> UserCache:
+    """Return the process-wide user cache configured from settings."""
+    settings = get_settings()
+    config = settings.user_cache
+    if not config.enabled:
+        return UserCache(max_entries=0)
+
+    redis = None
+    if config.redis:
+        redis = Redis.from_url(
+            settings.redis.url,
+            socket_timeout=settings.cache.socket_timeout,
+            socket_connect_timeout=settings.cache.socket_timeout,
+        )
+    return UserCache(
+        ttl_seconds=config.ttl_seconds,
+        max_entries=config.max_entries,
+        redis=redis,
+    )
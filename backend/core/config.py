@@ -26,6 +26,11 @@ class DatabaseConfig(BaseModel):
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow: int = 10
+    n_plus_one_threshold: int = 5
+    replicas: list[PostgresDsn] = []
+    replica_max_lag_seconds: float = 5.0
+    replica_check_interval_seconds: float = 5.0
+    replica_check_timeout_seconds: float = 1.0
 
     @computed_field
     @property
@@ -98,6 +103,45 @@ class RedisConfig(BaseModel):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    ttl_seconds: int = 300
+    socket_timeout: float = 0.25
+
+
+class UserCacheConfig(BaseModel):
+    enabled: bool = True
+    ttl_seconds: int = 30
+    max_entries: int = 10_000
+    redis: bool = False
+
+
+class LiveConfig(BaseModel):
+    enabled: bool = True
+    heartbeat_seconds: float = 15.0
+
+
+class ScheduleConfig(BaseModel):
+    transitions_enabled: bool = True
+    reconcile_cron: str = "*/15 * * * *"
+    locks_enabled: bool = True
+    lock_ttl_seconds: float = 60.0
+
+
+class LogConfig(BaseModel):
+    json_format: bool = False
+    sampling: dict[str, float] = {
+        "gameannouncer.access": 1.0,
+        "sqlalchemy.engine": 1.0,
+    }
+    rate_limits: dict[str, float] = {"sqlalchemy.engine": 100.0}
+
+
+class MetricsConfig(BaseModel):
+    enabled: bool = True
+    worker_port: int = 9000
+
+
 class EmailConfig(BaseModel):
     smtp_host: str = "mailpit"
     smtp_port: int = 1025
@@ -105,6 +149,8 @@ class EmailConfig(BaseModel):
     smtp_password: str = ""
     from_email: str = "noreply@gameannouncer.com"
     from_name: str = "GameAnnouncer"
+    pool_size: int = 4
+    pool_idle_seconds: float = 60.0
 
 
 class Settings(BaseSettings):
@@ -119,7 +165,13 @@ class Settings(BaseSettings):
     cors: CORSConfig = CORSConfig()
     auth: AuthConfig
     redis: RedisConfig = RedisConfig()
+    cache: CacheConfig = CacheConfig()
+    user_cache: UserCacheConfig = UserCacheConfig()
+    live: LiveConfig = LiveConfig()
+    schedule: ScheduleConfig = ScheduleConfig()
     email: EmailConfig = EmailConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    log: LogConfig = LogConfig()
 
     @property
     def is_production(self) -> bool:
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from core.logger import logger
+
+CommitHandler = Callable[[list[Any]], Awaitable[None]]
+
+_handlers: dict[str, CommitHandler] = {}
+
+_pending_tasks: set[asyncio.Task] = set()
+"""Strong references keeping in-flight commit handlers alive until they finish."""
+
+
+def register_commit_hook(key: str, handler: CommitHandler) -> None:
+    """
+    Run ``handler`` with the items collected under ``key`` after each commit.
+
+    Handlers run as background tasks on the running event loop once the
+    transaction is durable, so they must not touch the session.
+    """
+    _handlers[key] = handler
+
+
+def collect_for_commit(session: AsyncSession | Session, key: str, item: Any) -> None:
+    """Queue ``item`` for the ``key`` handler; discarded if the session rolls back."""
+    _sync_session(session).info.setdefault(key, []).append(item)
+
+
+def pending_for_commit(session: AsyncSession | Session, key: str) -> list[Any]:
+    """Return the items queued under ``key`` in the current transaction."""
+    return list(_sync_session(session).info.get(key, ()))
+
+
+async def wait_for_commit_hooks() -> None:
+    """Wait until every scheduled commit handler has finished (tests, shutdown)."""
+    while _pending_tasks:
+        await asyncio.gather(*list(_pending_tasks), return_exceptions=True)
+
+
+def _sync_session(session: AsyncSession | Session) -> Session:
+    return session.sync_session if isinstance(session, AsyncSession) else session
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    batches = [
+        (handler, session.info.pop(key))
+        for key, handler in _handlers.items()
+        if session.info.get(key)
+    ]
+    if not batches:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop, commit hooks skipped")
+        return
+
+    for handler, items in batches:
+        task = loop.create_task(handler(items))
+        _pending_tasks.add(task)
+        task.add_done_callback(_pending_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(
+    session: Session, previous_transaction: SessionTransaction
+) -> None:
+    if previous_transaction.parent is None:
+        for key in _handlers:
+            session.info.pop(key, None)
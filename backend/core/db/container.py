@@ -1,6 +1,7 @@
 from functools import lru_cache
 
 from .database import Database
+from .replicas import ReplicaSet
 from core.config import get_settings
 
 
@@ -16,3 +17,27 @@ def get_db() -> Database:
         pool_size=settings.db.pool_size,
         max_overflow=settings.db.max_overflow,
     )
+
+
+@lru_cache(maxsize=1)
+def get_replicas() -> ReplicaSet:
+    """Return the process-wide read replicas; empty unless ``DB__REPLICAS`` is set."""
+    settings = get_settings()
+
+    return ReplicaSet(
+        primary=get_db(),
+        replicas=[
+            Database(
+                url=str(url),
+                echo=settings.db.echo,
+                echo_pool=settings.db.echo_pool,
+                pool_size=settings.db.pool_size,
+                max_overflow=settings.db.max_overflow,
+                name=f"replica_{index}",
+            )
+            for index, url in enumerate(settings.db.replicas)
+        ],
+        max_lag_seconds=settings.db.replica_max_lag_seconds,
+        check_interval_seconds=settings.db.replica_check_interval_seconds,
+        check_timeout_seconds=settings.db.replica_check_timeout_seconds,
+    )
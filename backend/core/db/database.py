@@ -1,6 +1,10 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from typing import AsyncGenerator
 
+from core.db.query_stats import instrument_engine
+from core.logger import set_sql_echo
+from core.metrics.db import MeteredAsyncQueuePool
+
 
 class Database:
     def __init__(
@@ -10,14 +14,18 @@ class Database:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        name: str = "primary",
     ):
+        self.name = name
+        set_sql_echo(echo, echo_pool)
         self.engine = create_async_engine(
             url=url,
-            echo=echo,
-            echo_pool=echo_pool,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            poolclass=MeteredAsyncQueuePool,
+            pool_logging_name=name,
         )
+        instrument_engine(self.engine)
         self.session_factory = async_sessionmaker(
             bind=self.engine, autoflush=False, autocommit=False, expire_on_commit=False
         )
@@ -0,0 +1,72 @@
+"""
+Loader profiles: named eager-loading option sets picked explicitly per query.
+
+Relationships never load eagerly by default. Each module declares the options
+its aggregate needs for the four access patterns in a ``LoaderProfiles`` and
+every query, repository and gateway passes the profile it wants, so loading an
+entity costs exactly the statements its caller asked for.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+
+LoaderProfile = Literal["minimal", "list", "detail", "write"]
+
+STRICT_LOADING_ENV = "DB_STRICT_LOADING"
+"""Environment flag turning unprofiled relationship access into an error."""
+
+
+def relationship_default_lazy() -> Literal["raise_on_sql", "select"]:
+    """
+    Return the default loader strategy for profiled relationships.
+
+    ``raise_on_sql`` when ``DB_STRICT_LOADING`` is set (the test suite sets it),
+    so touching a relationship its query's profile did not load fails with the
+    relationship's name instead of silently emitting SQL. ``select`` otherwise.
+    Read once, when the models are imported.
+    """
+    if os.environ.get(STRICT_LOADING_ENV, "").lower() in ("1", "true"):
+        return "raise_on_sql"
+    return "select"
+
+
+RELATIONSHIP_LAZY = relationship_default_lazy()
+"""The ``lazy=`` value of relationships that are loaded through profiles."""
+
+
+@dataclass(frozen=True)
+class LoaderProfiles:
+    """
+    Loader options of one aggregate, by access pattern.
+
+    - ``minimal``: columns only, for checks and writes that touch scalars.
+    - ``list``: what list responses render.
+    - ``detail``: what detail responses and their policies read.
+    - ``write``: what a write path validates against or replaces, plus what the
+      response it returns renders.
+    """
+
+    minimal: tuple[ORMOption, ...] = ()
+    list: tuple[ORMOption, ...] = ()
+    detail: tuple[ORMOption, ...] = ()
+    write: tuple[ORMOption, ...] = ()
+
+    def options(self, profile: LoaderProfile) -> tuple[ORMOption, ...]:
+        return getattr(self, profile)
+
+
+async def refresh_columns(session: AsyncSession, instance: object) -> None:
+    """
+    Reload the column attributes of ``instance``, e.g. server defaults after a flush.
+
+    ``session.refresh(instance)`` expires every attribute, relationships
+    included, which would then need loading again; this keeps the relationships
+    already loaded through a profile.
+    """
+    column_keys = [attr.key for attr in inspect(instance).mapper.column_attrs]
+    await session.refresh(instance, column_keys)
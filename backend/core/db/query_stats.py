@@ -0,0 +1,93 @@
+"""
+Per-request SQL statistics collected from engine cursor events.
+
+``instrument_engine`` hooks ``before_cursor_execute``/``after_cursor_execute``
+on an engine; while a ``track_queries()`` block is active every statement the
+engine runs in that context is counted, timed and grouped by its SQL text, so
+the same statement run over and over (the shape of an N+1) stands out.
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_active_stats: ContextVar[tuple["QueryStats", ...]] = ContextVar(
+    "query_stats", default=()
+)
+"""Stats of every enclosing ``track_queries`` block, outermost first."""
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statements, DB time and rows of one tracked block."""
+
+    statements: int = 0
+    duration_ms: float = 0.0
+    rows: int = 0
+    by_statement: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_ms: float, rows: int) -> None:
+        self.statements += 1
+        self.duration_ms += duration_ms
+        self.rows += max(rows, 0)
+        self.by_statement[statement] += 1
+
+    def repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Return statements run at least ``threshold`` times, most frequent first."""
+        return {
+            statement: count
+            for statement, count in self.by_statement.most_common()
+            if count >= threshold
+        }
+
+    def server_timing(self) -> str:
+        """Format the stats as a ``Server-Timing`` metric."""
+        return (
+            f'db;dur={self.duration_ms:.2f};desc="{self.statements} queries, '
+            f'{self.rows} rows"'
+        )
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect the statements run by instrumented engines inside the block.
+
+    The stats object lives in a context variable, so it follows the request
+    into tasks and into the greenlets the async engine runs its driver calls in.
+    Blocks nest: a statement counts towards every enclosing block, so a test's
+    budget still sees what the request middleware tracks.
+    """
+    stats = QueryStats()
+    token = _active_stats.set((*_active_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - context._query_stats_started) * 1000
+    rows = getattr(cursor, "rowcount", -1)
+    for stats in _active_stats.get():
+        stats.record(statement, duration_ms, rows)
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """Attach the query counters to ``engine``; safe to call more than once."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,150 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import AsyncGenerator
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.db.database import Database
+from core.logger import logger
+
+READ_ONLY = "read_only"
+"""``Session.info`` flag of sessions handed out by ``ReplicaSet``."""
+
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """)
+"""
+Seconds the server's data is behind its primary; NULL before the first replay.
+
+A standby that has replayed everything it received counts as current, since
+``pg_last_xact_replay_timestamp`` keeps aging while the primary is idle.
+"""
+
+
+class ReadOnlySessionError(RuntimeError):
+    """A session from ``ReadSessionDep`` tried to write."""
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_writes(session: Session, flush_context, instances) -> None:
+    if session.info.get(READ_ONLY):
+        raise ReadOnlySessionError(
+            "Read sessions cannot write; use SessionDep for write paths"
+        )
+
+
+class ReplicaSet:
+    """Read-only replicas of the primary database, checked for health and lag.
+
+    Read sessions go to the healthy replicas in turn and fall back to the
+    primary when none is usable. A replica is usable when its last check
+    answered within ``check_timeout_seconds`` and reported at most
+    ``max_lag_seconds`` of replication lag. Checks run at most every
+    ``check_interval_seconds``, on the request that finds them due; a replica
+    whose connection fails mid-request is skipped until its next check.
+
+    Every read session, including the primary fallback, rejects flushes, so
+    write paths cannot end up on a replica by accident.
+    """
+
+    def __init__(
+        self,
+        primary: Database,
+        replicas: list[Database],
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 5.0,
+        check_timeout_seconds: float = 1.0,
+    ) -> None:
+        self.primary = primary
+        self.replicas = replicas
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._check_timeout_seconds = check_timeout_seconds
+        self._healthy: list[Database] = []
+        self._turn = itertools.count()
+        self._checked_at: float | None = None
+        self._check_lock = asyncio.Lock()
+
+    async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        replica = await self.pick()
+        database = replica or self.primary
+        async with database.session_factory(info={READ_ONLY: True}) as session:
+            try:
+                yield session
+            except (OperationalError, InterfaceError):
+                if replica is not None:
+                    self._mark_down(replica)
+                raise
+
+    async def pick(self) -> Database | None:
+        """Return the next healthy replica, or ``None`` to read from the primary."""
+        if not self.replicas:
+            return None
+        if self._check_due():
+            await self.check()
+        if not self._healthy:
+            return None
+        return self._healthy[next(self._turn) % len(self._healthy)]
+
+    async def check(self) -> None:
+        """Re-check every replica's health and lag, at most one check at a time."""
+        async with self._check_lock:
+            if self._checked_at is not None and not self._check_due():
+                return
+            lags = await asyncio.gather(
+                *(self._lag_seconds(replica) for replica in self.replicas)
+            )
+            healthy = [
+                replica
+                for replica, lag in zip(self.replicas, lags)
+                if lag is not None and lag <= self._max_lag_seconds
+            ]
+            if self._checked_at is None or len(healthy) != len(self._healthy):
+                logger.log(
+                    (
+                        logging.INFO
+                        if len(healthy) == len(self.replicas)
+                        else logging.WARNING
+                    ),
+                    "Read replicas usable: %d of %d%s",
+                    len(healthy),
+                    len(self.replicas),
+                    "" if healthy else "; reading from the primary",
+                )
+            self._healthy = healthy
+            self._checked_at = time.monotonic()
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.dispose()
+
+    def _check_due(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self._check_interval_seconds
+        )
+
+    async def _lag_seconds(self, replica: Database) -> float | None:
+        """Return the replica's lag, or ``None`` when it is unreachable or unknown."""
+        try:
+            async with asyncio.timeout(self._check_timeout_seconds):
+                async with replica.engine.connect() as connection:
+                    lag = await connection.scalar(REPLICATION_LAG_QUERY)
+        except (OSError, TimeoutError, DBAPIError) as e:
+            logger.warning(f"Read replica {replica.name} failed its check: {e}")
+            return None
+        return None if lag is None else float(lag)
+
+    def _mark_down(self, replica: Database) -> None:
+        if replica in self._healthy:
+            self._healthy = [r for r in self._healthy if r is not replica]
+            logger.warning(f"Read replica {replica.name} failed; skipping it")
@@ -1,10 +1,10 @@
 from typing import Annotated
-from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from core.user_manager import UserManager
-from core.db.container import get_db
+from core.db.container import get_db, get_replicas
 from core.config import get_settings, Settings
+from modules.users.database import UserDatabase
 
 
 async def _session_getter_dep():
@@ -15,13 +15,27 @@ async def _session_getter_dep():
 SessionDep = Annotated[AsyncSession, Depends(_session_getter_dep)]
 
 
+async def _read_session_getter_dep():
+    async for session in get_replicas().session_getter():
+        yield session
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(_read_session_getter_dep)]
+"""
+Session for read-only endpoints, served by a read replica when one is usable.
+
+Replicas may lag the primary by up to ``DB__REPLICA_MAX_LAG_SECONDS``, so use
+it only where a slightly stale read is fine and nothing is written or cached.
+"""
+
+
 async def get_user_db(session: SessionDep):
     from modules.users.model import User
 
     yield User.get_db(session=session)
 
 
-UserDbDep = Annotated[SQLAlchemyUserDatabase, Depends(get_user_db)]
+UserDbDep = Annotated[UserDatabase, Depends(get_user_db)]
 
 
 async def get_user_manager(user_db: UserDbDep):
@@ -0,0 +1,24 @@
+"""Live updates pushed to clients through Redis pub/sub and Server-Sent Events."""
+
+from core.live.channel import (
+    LiveHub,
+    LiveSubscription,
+    bracket_channel,
+    close_live_hub,
+    get_live_hub,
+    get_live_redis,
+    publish_on_commit,
+)
+from core.live.sse import sse_event, versioned_event_stream
+
+__all__ = [
+    "LiveHub",
+    "LiveSubscription",
+    "bracket_channel",
+    "close_live_hub",
+    "get_live_hub",
+    "get_live_redis",
+    "publish_on_commit",
+    "sse_event",
+    "versioned_event_stream",
+]
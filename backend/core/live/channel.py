@@ -0,0 +1,264 @@
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
+from fastapi import status
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from core.db.commit_hooks import collect_for_commit, register_commit_hook
+from core.logger import logger
+from exceptions import AppException
+
+_LIVE_KEY = "live_messages"
+
+
+def bracket_channel(announcement_id: int) -> str:
+    return f"live:announcement:{announcement_id}:bracket"
+
+
+@lru_cache()
+def get_live_redis() -> Redis | None:
+    """Return the Redis client used for live pub/sub, or None when disabled."""
+    settings = get_settings()
+    if not settings.live.enabled:
+        return None
+    return Redis.from_url(
+        settings.redis.url, socket_connect_timeout=1, health_check_interval=30
+    )
+
+
+def publish_on_commit(
+    session: AsyncSession | Session, channel: str, message: dict[str, Any]
+) -> None:
+    """
+    Publish ``message`` to ``channel`` once ``session`` commits.
+
+    Subscribers therefore only ever see changes that are durable, and a rolled
+    back transaction publishes nothing.
+    """
+    collect_for_commit(session, _LIVE_KEY, (channel, message))
+
+
+async def _publish(messages: list[tuple[str, dict[str, Any]]]) -> None:
+    redis = get_live_redis()
+    if redis is None:
+        return
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, json.dumps(message, separators=(",", ":")))
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to publish live updates: {e}")
+
+
+register_commit_hook(_LIVE_KEY, _publish)
+
+
+VIEWER_QUEUE_SIZE = 100
+"""Deltas buffered per viewer; a viewer this far behind drops newer ones."""
+
+_CLOSED = object()
+
+
+class LiveHub:
+    """
+    One Redis pub/sub connection per process, fanned out to every viewer.
+
+    The first viewer of a channel subscribes the shared connection to it and
+    the last one to leave unsubscribes, so a worker holds one Redis connection
+    however many SSE clients it serves. A single reader task decodes each
+    message once and puts it on the queue of every viewer of its channel. A
+    viewer whose queue is full misses the message; the version gap tells its
+    client to reconnect. If the connection fails, every viewer's stream ends
+    so clients reconnect and resubscribe.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+        self._pubsub: PubSub | None = None
+        self._reader: asyncio.Task | None = None
+        self._queues: dict[str, set[asyncio.Queue]] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        """Return a new viewer queue receiving the messages of ``channel``."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=VIEWER_QUEUE_SIZE)
+        async with self._lock:
+            if self._pubsub is None:
+                self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            if channel not in self._queues:
+                await self._pubsub.subscribe(channel)
+                self._queues[channel] = set()
+            self._queues[channel].add(queue)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read(self._pubsub))
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            queues = self._queues.get(channel)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if queues or self._pubsub is None:
+                return
+            del self._queues[channel]
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except RedisError as e:
+                logger.warning(f"Failed to unsubscribe from {channel}: {e}")
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._reset()
+
+    async def _read(self, pubsub: PubSub) -> None:
+        """
+        Dispatch messages until the connection fails.
+
+        A message that cannot be decoded or delivered is logged and skipped. Any
+        error reading from the connection resets the hub, ending every stream so
+        that reconnecting viewers resubscribe and start a new reader.
+        """
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except Exception as e:
+                if isinstance(e, RedisError):
+                    logger.warning(f"Live subscriber connection failed: {e}")
+                else:
+                    logger.exception("Live subscriber stopped unexpectedly")
+                async with self._lock:
+                    if self._pubsub is pubsub:
+                        self._reader = None
+                        await self._reset()
+                return
+            if message is None or message["type"] != "message":
+                continue
+
+            try:
+                self._dispatch(message)
+            except Exception:
+                logger.exception("Skipped a live message that could not be dispatched")
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        data = json.loads(message["data"])
+        for queue in self._queues.get(channel, ()):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                logger.warning(f"Dropped a live message for a slow {channel} viewer")
+
+    async def _reset(self) -> None:
+        queues, self._queues = self._queues, {}
+        for channel_queues in queues.values():
+            for queue in channel_queues:
+                _end_stream(queue)
+        pubsub, self._pubsub = self._pubsub, None
+        reader, self._reader = self._reader, None
+        if reader is not None and reader is not asyncio.current_task():
+            reader.cancel()
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except RedisError as e:
+                logger.warning(f"Failed to close live subscriber: {e}")
+
+
+def _end_stream(queue: asyncio.Queue) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(_CLOSED)
+
+
+@lru_cache()
+def get_live_hub() -> LiveHub | None:
+    """Return the process's shared live subscriber, or None when disabled."""
+    redis = get_live_redis()
+    if redis is None:
+        return None
+    return LiveHub(redis)
+
+
+async def close_live_hub() -> None:
+    """Close the shared live subscriber, ending all open streams."""
+    if get_live_hub.cache_info().currsize:
+        hub = get_live_hub()
+        if hub is not None:
+            await hub.close()
+        get_live_hub.cache_clear()
+
+
+class LiveSubscription:
+    """
+    One viewer's subscription to a pub/sub channel, shared by every worker via Redis.
+
+    Open it before loading the snapshot that the messages apply to, so that no
+    message published in between is lost.
+    """
+
+    def __init__(
+        self, hub: LiveHub, channel: str, queue: asyncio.Queue, heartbeat_seconds: float
+    ) -> None:
+        self._hub = hub
+        self._channel = channel
+        self._queue = queue
+        self._heartbeat_seconds = heartbeat_seconds
+
+    @classmethod
+    async def open(cls, channel: str) -> "LiveSubscription":
+        """
+        Subscribe to ``channel``.
+
+        Raises:
+            AppException: 503 if live updates are disabled or Redis is unreachable.
+        """
+        hub = get_live_hub()
+        if hub is None:
+            raise AppException(
+                "Live updates are disabled",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        try:
+            queue = await hub.subscribe(channel)
+        except RedisError as e:
+            logger.warning(f"Failed to subscribe to {channel}: {e}")
+            raise AppException(
+                "Live updates are temporarily unavailable",
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        return cls(hub, channel, queue, get_settings().live.heartbeat_seconds)
+
+    async def messages(self) -> AsyncIterator[dict[str, Any] | None]:
+        """
+        Yield decoded messages, or None after each idle heartbeat interval.
+
+        Stops when the shared subscriber loses its Redis connection.
+        """
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    self._queue.get(), timeout=self._heartbeat_seconds
+                )
+            except TimeoutError:
+                yield None
+                continue
+            if message is _CLOSED:
+                return
+            yield message
+
+    async def close(self) -> None:
+        await self._hub.unsubscribe(self._channel, self._queue)
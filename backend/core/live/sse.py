@@ -0,0 +1,41 @@
+import json
+from typing import Any, AsyncIterator
+
+from fastapi import Request
+
+from core.live.channel import LiveSubscription
+
+SSE_HEARTBEAT = ": ping\n\n"
+"""SSE comment line keeping idle connections open through proxies."""
+
+
+def sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def versioned_event_stream(
+    request: Request,
+    subscription: LiveSubscription,
+    snapshot: dict[str, Any],
+    version: int,
+) -> AsyncIterator[str]:
+    """
+    Stream a ``snapshot`` event followed by ``delta`` events.
+
+    Deltas carry the version they produce. Those not newer than the snapshot
+    are already reflected in it and are skipped. A client that sees a gap
+    (``delta.version > last + 1``) missed an update and should reconnect to
+    get a fresh snapshot.
+    """
+    try:
+        yield sse_event("snapshot", {**snapshot, "version": version})
+        async for message in subscription.messages():
+            if await request.is_disconnected():
+                break
+            if message is None:
+                yield SSE_HEARTBEAT
+            elif message["version"] > version:
+                yield sse_event("delta", message)
+    finally:
+        await subscription.close()
@@ -0,0 +1,79 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from core.config import get_settings
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class LeaseLostError(RuntimeError):
+    """The lease expired or was taken over by a newer holder."""
+
+
+class LeaseLock:
+    """Redis lease with a fencing token, held by at most one process at a time.
+
+    ``acquire`` draws the next value of a per-lock counter as the fencing token
+    and stores it as the lease value, so every holder has a larger token than
+    all holders before it. The lease expires after ``ttl_seconds`` unless
+    ``extend`` renews it; ``release`` and ``extend`` only act while the stored
+    token is still ours, so a holder whose lease expired can never release or
+    prolong its successor's lease.
+    """
+
+    def __init__(self, redis: Redis, name: str, ttl_seconds: float) -> None:
+        self._redis = redis
+        self._key = f"lock:{name}"
+        self._fence_key = f"lock:{name}:fence"
+        self._ttl_ms = int(ttl_seconds * 1000)
+        self.token: int | None = None
+
+    async def acquire(self) -> bool:
+        token = await self._redis.incr(self._fence_key)
+        if not await self._redis.set(self._key, token, nx=True, px=self._ttl_ms):
+            return False
+        self.token = token
+        return True
+
+    async def extend(self) -> bool:
+        """Renew the lease for another ``ttl_seconds``; False once it is lost."""
+        if self.token is None:
+            return False
+        return bool(
+            await self._redis.eval(
+                _EXTEND_SCRIPT, 1, self._key, self.token, self._ttl_ms
+            )
+        )
+
+    async def is_held(self) -> bool:
+        if self.token is None:
+            return False
+        value = await self._redis.get(self._key)
+        return value is not None and int(value) == self.token
+
+    async def release(self) -> None:
+        if self.token is None:
+            return
+        await self._redis.eval(_RELEASE_SCRIPT, 1, self._key, self.token)
+        self.token = None
+
+
+@lru_cache()
+def get_lock_redis() -> Redis:
+    """Return the Redis client that holds leases."""
+    return Redis.from_url(
+        get_settings().redis.url, socket_timeout=1, socket_connect_timeout=1
+    )
@@ -1,10 +1,124 @@
+import atexit
+import json
 import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
 from logging.config import dictConfig
+from logging.handlers import QueueHandler
 from rich.logging import RichHandler
 from rich.console import Console
 
 console = Console(color_system="auto")
 
+ACCESS_LOGGER = "gameannouncer.access"
+
+QUEUE_HANDLERS = ("app_queue", "access_queue")
+"""Handlers the application loggers write to; their listeners do the I/O."""
+
+
+def _policy_for(policies: dict[str, float], name: str) -> float | None:
+    """Return the value of the longest logger-name prefix of ``name`` in ``policies``."""
+    while True:
+        if name in policies:
+            return policies[name]
+        if "." not in name:
+            return None
+        name = name.rsplit(".", 1)[0]
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Structured fields passed as ``extra={"fields": {...}}`` become top-level
+    keys next to ``time``, ``level``, ``logger`` and ``message``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of the records below WARNING, per logger.
+
+    ``rates`` maps logger names to the fraction kept; a record uses the entry
+    of its closest configured ancestor (``sqlalchemy.engine`` covers
+    ``sqlalchemy.engine.Engine``) and is kept when none matches. Warnings and
+    errors always pass.
+    """
+
+    def __init__(self, rates: dict[str, float] | None = None) -> None:
+        super().__init__()
+        self.rates = rates or {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = _policy_for(self.rates, record.name)
+        return rate is None or random.random() < rate
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Cap records per second, per configured logger, with a token bucket.
+
+    ``limits`` maps logger names to records per second (burst of one second);
+    records of unconfigured loggers pass. The first record let through after
+    a drop reports how many were suppressed.
+    """
+
+    def __init__(self, limits: dict[str, float] | None = None) -> None:
+        super().__init__()
+        self.limits = limits or {}
+        self._buckets: dict[str, tuple[float, float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        limit = _policy_for(self.limits, record.name)
+        if limit is None:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, dropped = self._buckets.get(
+                record.name, (limit, now, 0)
+            )
+            tokens = min(limit, tokens + (now - updated_at) * limit)
+            if tokens < 1:
+                self._buckets[record.name] = (tokens, now, dropped + 1)
+                return False
+            self._buckets[record.name] = (tokens - 1, now, 0)
+
+        if dropped:
+            record.msg = f"[{dropped} suppressed] {record.msg}"
+        return True
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    ``QueueHandler`` that enqueues records untouched.
+
+    The stock handler formats the message on the logging thread so records can
+    cross process boundaries; these queues stay in-process, so formatting is
+    left entirely to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 LOGGING_CONFIG = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -17,10 +131,16 @@ LOGGING_CONFIG = {
             "format": "%(levelname)s %(asctime)s | %(name)s | %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
-        "json": {
-            "format": '{"time": "%(asctime)s", "level": "%(levelname)s", "name": "%(name)s", "message": "%(message)s"}',
+        "json": {"()": JsonFormatter},
+        "access": {
+            "format": "%(asctime)s | %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
         },
     },
+    "filters": {
+        "sampling": {"()": SamplingFilter},
+        "rate_limit": {"()": RateLimitFilter},
+    },
     "handlers": {
         "rich": {
             "()": RichHandler,
@@ -38,35 +158,123 @@ LOGGING_CONFIG = {
             "formatter": "default",
             "stream": "ext://sys.stdout",
         },
+        "json": {
+            "class": "logging.StreamHandler",
+            "formatter": "json",
+            "stream": "ext://sys.stdout",
+        },
+        "access_stream": {
+            "class": "logging.StreamHandler",
+            "formatter": "access",
+            "stream": "ext://sys.stdout",
+        },
+        "app_queue": {
+            "class": "core.logger.LocalQueueHandler",
+            "handlers": ["rich"],
+            "filters": ["sampling", "rate_limit"],
+        },
+        "access_queue": {
+            "class": "core.logger.LocalQueueHandler",
+            "handlers": ["access_stream"],
+            "filters": ["sampling", "rate_limit"],
+        },
     },
     "loggers": {
         "uvicorn": {"handlers": ["default"], "level": "INFO", "propagate": False},
         "uvicorn.error": {"level": "INFO", "propagate": False},
         "uvicorn.access": {
             "handlers": ["default"],
-            "level": "INFO",
+            "level": "WARNING",
             "propagate": False,
         },
-        "fastapi": {"handlers": ["rich"], "level": "INFO", "propagate": False},
+        "fastapi": {"handlers": ["app_queue"], "level": "INFO", "propagate": False},
         "sqlalchemy.engine": {
-            "handlers": ["rich"],
-            "level": "INFO",
+            "handlers": ["app_queue"],
+            "level": "WARNING",
             "propagate": False,
         },
         "sqlalchemy.pool": {
-            "handlers": ["rich"],
+            "handlers": ["app_queue"],
             "level": "WARNING",
             "propagate": False,
         },
-        "alembic": {"handlers": ["rich"], "level": "INFO", "propagate": False},
-        "gameannouncer": {"handlers": ["rich"], "level": "DEBUG", "propagate": False},
+        "alembic": {"handlers": ["app_queue"], "level": "INFO", "propagate": False},
+        "gameannouncer": {
+            "handlers": ["app_queue"],
+            "level": "DEBUG",
+            "propagate": False,
+        },
+        ACCESS_LOGGER: {
+            "handlers": ["access_queue"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
     "root": {"level": "INFO", "handlers": []},
 }
 
 
-def setup_logging():
-    dictConfig(LOGGING_CONFIG)
+def logging_config(
+    json_format: bool = False,
+    sampling: dict[str, float] | None = None,
+    rate_limits: dict[str, float] | None = None,
+) -> dict:
+    """
+    Return ``LOGGING_CONFIG`` for an environment.
+
+    Loggers only enqueue records (``app_queue``, ``access_queue``); each
+    queue's listener thread formats and writes them, as JSON when
+    ``json_format`` is set (production). Sampling and rate limits are applied
+    before a record is enqueued, per logger.
+    """
+    handlers = LOGGING_CONFIG["handlers"]
+    return {
+        **LOGGING_CONFIG,
+        "filters": {
+            "sampling": {"()": SamplingFilter, "rates": sampling or {}},
+            "rate_limit": {"()": RateLimitFilter, "limits": rate_limits or {}},
+        },
+        "handlers": {
+            **handlers,
+            "app_queue": {
+                **handlers["app_queue"],
+                "handlers": ["json" if json_format else "rich"],
+            },
+            "access_stream": {
+                **handlers["access_stream"],
+                "formatter": "json" if json_format else "access",
+            },
+        },
+    }
+
+
+def setup_logging(
+    json_format: bool = False,
+    sampling: dict[str, float] | None = None,
+    rate_limits: dict[str, float] | None = None,
+):
+    dictConfig(logging_config(json_format, sampling, rate_limits))
+
+    for name in QUEUE_HANDLERS:
+        listener = logging.getHandlerByName(name).listener
+        listener.start()
+        atexit.register(listener.stop)
+
+
+def set_sql_echo(echo: bool, echo_pool: bool = False) -> None:
+    """
+    Log SQL statements (and pool events) through ``app_queue``.
+
+    Used instead of the engine's ``echo`` flags, which attach a synchronous
+    stdout handler of their own to the engine's logger.
+    """
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO if echo else logging.WARNING
+    )
+    logging.getLogger("sqlalchemy.pool").setLevel(
+        logging.INFO if echo_pool else logging.WARNING
+    )
 
 
 logger = logging.getLogger("gameannouncer")
+access_logger = logging.getLogger(ACCESS_LOGGER)
@@ -0,0 +1,21 @@
+"""Prometheus metrics of the API, the database pool, the task queue and SMTP."""
+
+from core.metrics.db import MeteredAsyncQueuePool
+from core.metrics.http import MetricsMiddleware, metrics_endpoint, route_template
+from core.metrics.registry import (
+    SMTP_SEND_DURATION,
+    mark_process_dead,
+    render_metrics,
+)
+from core.metrics.tasks import TaskMetricsMiddleware
+
+__all__ = [
+    "MeteredAsyncQueuePool",
+    "MetricsMiddleware",
+    "SMTP_SEND_DURATION",
+    "TaskMetricsMiddleware",
+    "mark_process_dead",
+    "metrics_endpoint",
+    "render_metrics",
+    "route_template",
+]
@@ -0,0 +1,46 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from core.metrics.registry import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_WAIT,
+)
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    ``AsyncAdaptedQueuePool`` that reports its usage to Prometheus.
+
+    Exposes checked-out and overflow connections after every checkout and
+    return, and the time each checkout took, which includes waiting for a
+    free connection once ``pool_size + max_overflow`` are in use. Series are
+    labelled with the pool's ``logging_name`` (``pool_logging_name`` on the
+    engine).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._metrics_label = self.logging_name or "default"
+        DB_POOL_SIZE.labels(self._metrics_label).set(self.size())
+        self._report_usage()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(self._metrics_label).observe(
+                time.perf_counter() - started
+            )
+            self._report_usage()
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        DB_POOL_CHECKED_OUT.labels(self._metrics_label).set(self.checkedout())
+        DB_POOL_OVERFLOW.labels(self._metrics_label).set(max(self.overflow(), 0))
@@ -0,0 +1,72 @@
+import time
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics.registry import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    render_metrics,
+)
+
+UNMATCHED_ROUTE = "unmatched"
+"""Route label of requests no route matched, keeping label cardinality bounded."""
+
+
+def route_template(scope: Scope) -> str | None:
+    """
+    Return the full path template of the route that served ``scope``.
+
+    FastAPI keeps included routers nested, so ``scope["route"].path`` lacks the
+    include prefixes (``/health`` for ``/api/health``); the effective route
+    context it records holds the joined template. Falls back to the route's
+    own path for plain Starlette routes.
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path", None) or getattr(scope.get("route"), "path", None)
+
+
+class MetricsMiddleware:
+    """
+    Record request latency per route template and the requests in flight.
+
+    Labels use the matched route's path (``/api/v1/announcements/{announcement_id}``),
+    never the raw URL, so one series exists per endpoint.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            HTTP_REQUEST_DURATION.labels(
+                method,
+                route_template(scope) or UNMATCHED_ROUTE,
+                str(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve the Prometheus exposition of all processes."""
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
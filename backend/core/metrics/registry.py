@@ -0,0 +1,129 @@
+"""
+Prometheus metrics of the API, the database pool, the task queue and SMTP.
+
+Metrics are module-level and shared by every process that imports them. When
+``PROMETHEUS_MULTIPROC_DIR`` is set (uvicorn with several workers, taskiq
+workers), prometheus_client keeps each process's values in files under that
+directory and ``render_metrics`` aggregates them, so any worker can answer a
+scrape. The directory must exist and be empty when the processes start.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests by route template.",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured persistent connections of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (up to max_overflow).",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to obtain a connection from the pool, connecting included.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+
+_TASK_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+TASK_ENQUEUE_DURATION = Histogram(
+    "taskiq_enqueue_duration_seconds",
+    "Time to hand a task message to the broker.",
+    ["task"],
+    buckets=_TASK_BUCKETS,
+)
+TASK_QUEUE_WAIT = Histogram(
+    "taskiq_queue_wait_seconds",
+    "Time from enqueueing a task until a worker starts it.",
+    ["task"],
+    buckets=_TASK_BUCKETS,
+)
+TASK_EXECUTION_DURATION = Histogram(
+    "taskiq_execution_duration_seconds",
+    "Execution time of tasks.",
+    ["task"],
+    buckets=_TASK_BUCKETS,
+)
+TASK_FAILURES = Counter(
+    "taskiq_task_failures",
+    "Tasks that raised.",
+    ["task"],
+)
+TASK_LEASE_HELD = Histogram(
+    "taskiq_lease_held_seconds",
+    "Time single-flight tasks held their lease, i.e. their actual run time.",
+    ["task"],
+    buckets=_TASK_BUCKETS,
+)
+TASK_SKIPPED = Counter(
+    "taskiq_task_skipped",
+    "Single-flight task runs skipped because another run held the lease.",
+    ["task"],
+)
+
+SMTP_SEND_DURATION = Histogram(
+    "smtp_send_duration_seconds",
+    "Time to send one email over SMTP, connecting first if no pooled one is idle.",
+    ["outcome"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+
+def is_multiprocess() -> bool:
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Return the registry to expose: all processes' files or this process."""
+    if not is_multiprocess():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition payload and its content type."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this process's live gauges from the aggregate on shutdown."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,75 @@
+import time
+from typing import Any
+
+from prometheus_client import start_http_server
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from core.logger import logger
+from core.metrics.registry import (
+    TASK_ENQUEUE_DURATION,
+    TASK_EXECUTION_DURATION,
+    TASK_FAILURES,
+    TASK_QUEUE_WAIT,
+    mark_process_dead,
+    metrics_registry,
+)
+
+ENQUEUED_AT_LABEL = "enqueued_at"
+"""Message label carrying the wall-clock time the task was sent."""
+
+
+def _task_label(message: TaskiqMessage) -> str:
+    """``tasks.email_tasks:send_verification_email_task`` → ``send_verification_email_task``."""
+    return message.task_name.rsplit(":", 1)[-1]
+
+
+class TaskMetricsMiddleware(TaskiqMiddleware):
+    """
+    Record enqueue latency, queue wait, execution time and failures per task.
+
+    The sending process (API, scheduler) records the enqueue side; workers
+    record the rest and, being separate processes without an HTTP app, serve
+    their metrics on ``metrics.worker_port``.
+    """
+
+    def __init__(self, worker_port: int) -> None:
+        super().__init__()
+        self.worker_port = worker_port
+
+    def startup(self) -> None:
+        if not self.broker.is_worker_process:
+            return
+        try:
+            start_http_server(self.worker_port, registry=metrics_registry())
+        except OSError:
+            logger.debug(
+                f"Metrics server already listening on {self.worker_port} "
+                "(another worker process)"
+            )
+
+    def shutdown(self) -> None:
+        if self.broker.is_worker_process:
+            mark_process_dead()
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels[ENQUEUED_AT_LABEL] = str(time.time())
+        return message
+
+    def post_send(self, message: TaskiqMessage) -> None:
+        TASK_ENQUEUE_DURATION.labels(_task_label(message)).observe(
+            time.time() - float(message.labels[ENQUEUED_AT_LABEL])
+        )
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        enqueued_at = message.labels.get(ENQUEUED_AT_LABEL)
+        if enqueued_at is not None:
+            TASK_QUEUE_WAIT.labels(_task_label(message)).observe(
+                max(time.time() - float(enqueued_at), 0.0)
+            )
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        task = _task_label(message)
+        TASK_EXECUTION_DURATION.labels(task).observe(result.execution_time)
+        if result.is_err:
+            TASK_FAILURES.labels(task).inc()
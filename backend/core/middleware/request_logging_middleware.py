@@ -1,35 +1,101 @@
+import logging
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from core.logger import logger
 
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+from core.config import get_settings
+from core.db.query_stats import QueryStats, track_queries
+from core.logger import access_logger, logger
+from core.metrics import route_template
 
-        client_ip = request.client.host if request.client else "unknown"
 
-        logger.info(
-            f"📥 {request.method} {request.url.path} | IP: {client_ip} | User-Agent: {request.headers.get('user-agent', 'unknown')[:50]}..."
-        )
+class RequestLoggingMiddleware:
+    """
+    Write one access record per HTTP request and time its SQL.
 
-        try:
-            response = await call_next(request)
+    A plain ASGI middleware: it wraps ``send`` instead of buffering the
+    response through ``BaseHTTPMiddleware``'s extra task and stream. The record
+    goes to the ``gameannouncer.access`` logger, whose queue handler leaves
+    sampling, formatting and I/O to a listener thread; its structured fields
+    are in ``record.fields``. Responses carry the request's DB time in a
+    ``Server-Timing`` header.
+    """
 
-            duration = round((time.time() - start_time) * 1000, 2)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.n_plus_one_threshold = get_settings().db.n_plus_one_threshold
 
-            logger.info(
-                f"📤 {request.method} {request.url.path} | Status: {response.status_code} | Duration: {duration}ms"
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter_ns()
+        status_code = 500
+
+        with track_queries() as stats:
 
-            return response
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", stats.server_timing()
+                    )
+                await send(message)
 
-        except Exception as e:
-            duration = round((time.time() - start_time) * 1000, 2)
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                self._log(scope, 500, started, stats, error=e)
+                raise
+            self._log(scope, status_code, started, stats)
 
-            logger.error(
-                f"💥 {request.method} {request.url.path} | ERROR: {str(e)} | Duration: {duration}ms"
+    def _log(
+        self,
+        scope: Scope,
+        status_code: int,
+        started: int,
+        stats: QueryStats,
+        error: Exception | None = None,
+    ) -> None:
+        duration_ms = (time.perf_counter_ns() - started) / 1_000_000
+        method = scope["method"]
+        path = scope["path"]
+        level = logging.ERROR if status_code >= 500 else logging.INFO
+        if access_logger.isEnabledFor(level):
+            client = scope.get("client")
+            user_agent = (
+                dict(scope["headers"]).get(b"user-agent", b"").decode("latin-1")
+            )
+            access_logger.log(
+                level,
+                f"{method} {path} {status_code} {duration_ms:.2f}ms "
+                f"queries={stats.statements} db_ms={stats.duration_ms:.2f}",
+                extra={
+                    "fields": {
+                        "method": method,
+                        "path": path,
+                        "route": route_template(scope),
+                        "status": status_code,
+                        "duration_ms": round(duration_ms, 2),
+                        "client_ip": client[0] if client else None,
+                        "user_agent": user_agent[:200],
+                        "queries": stats.statements,
+                        "db_ms": round(stats.duration_ms, 2),
+                        "db_rows": stats.rows,
+                        "error": str(error) if error else None,
+                    }
+                },
             )
 
-            raise
+        repeated = stats.repeated_statements(self.n_plus_one_threshold)
+        if repeated:
+            candidates = "; ".join(
+                f"{count}x {' '.join(statement.split())[:200]}"
+                for statement, count in repeated.items()
+            )
+            logger.warning(
+                f"🗄️ {method} {path} | n_plus_one={len(repeated)} | {candidates}"
+            )
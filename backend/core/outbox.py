@@ -0,0 +1,37 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db.commit_hooks import collect_for_commit
+from modules.outbox.repository import OutboxRepository
+
+OUTBOX_MESSAGES = "outbox_messages"
+"""Commit hook key; ``tasks.outbox_tasks`` registers the handler waking the relay."""
+
+REGISTRATION_STATUS_EMAIL_TASK = "tasks.email_tasks:send_registration_status_email_task"
+"""Name of the task emailing a registration request's approval or rejection."""
+
+
+def task_name_of(task: Any) -> str:
+    """``module:function`` name taskiq registers ``task`` under."""
+    task_name = getattr(task, "task_name", None)
+    if task_name is not None:
+        return task_name
+    return f"{task.__module__}:{task.__name__}"
+
+
+def add_to_outbox(session: AsyncSession, task_name: str, **kwargs: Any) -> None:
+    """
+    Send task ``task_name`` with ``kwargs`` once ``session`` commits, at least once.
+
+    The message is written to the outbox in the caller's transaction, so it
+    exists exactly when the change that caused it does. After the commit the
+    relay is woken to send it right away; the periodic relay run sends
+    whatever that wake-up missed. ``kwargs`` must be JSON-serializable, and the
+    task must tolerate running twice.
+
+    Takes the task's name rather than the task, so operations and modules can
+    queue work without importing ``tasks``.
+    """
+    OutboxRepository(session).add(task_name, kwargs)
+    collect_for_commit(session, OUTBOX_MESSAGES, task_name)
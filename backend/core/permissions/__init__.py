@@ -4,6 +4,7 @@ from core.permissions.facade import (
     authorize_action,
     get_permissions,
     get_batch_permissions,
+    get_payload_permissions,
     get_user_permissions,
     initialize_policies_cache,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "authorize_action",
     "get_permissions",
     "get_batch_permissions",
+    "get_payload_permissions",
     "get_user_permissions",
     "initialize_policies_cache",
 ]
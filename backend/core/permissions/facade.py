@@ -17,9 +17,16 @@ def get_permissions(user, record):
     return _permissions_service.get_record_permissions(user, record)
 
 
-def get_batch_permissions(user, records: list[object]) -> None:
-    """Get batch permissions for user on list of records."""
-    return _permissions_service.get_batch_permissions(user, records)
+def get_payload_permissions(user, model: type, payload: dict) -> dict[str, bool]:
+    """Get permissions for user on a serialized record of ``model``."""
+    return _permissions_service.get_payload_permissions(user, model, payload)
+
+
+def get_batch_permissions(
+    user, records: list[object], model: type | None = None
+) -> None:
+    """Get batch permissions for user on list of records (of ``model``, if given)."""
+    return _permissions_service.get_batch_permissions(user, records, model)
 
 
 def get_user_permissions(user):
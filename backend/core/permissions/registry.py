@@ -7,6 +7,7 @@ from typing import Any
 
 from core.logger import logger
 from core.permissions.base_policy import BasePolicy as _BasePolicy
+from core.permissions.rules import compile_policy
 from exceptions import AppException
 from fastapi import status
 
@@ -119,3 +120,4 @@ class PoliciesRegistry:
         with self._lock:
             self._cache = None
             PoliciesRegistry.get_policy_methods.cache_clear()
+            compile_policy.cache_clear()
@@ -0,0 +1,153 @@
+"""
+Declarative permission rules that compile into per-page checks.
+
+A policy method built with ``allow_if`` evaluates like any ``can_*`` method,
+but also exposes its rule, so list endpoints can resolve it once per request
+instead of instantiating the policy for every record:
+
+    class AnnouncementPolicy(BasePolicy):
+        can_edit = allow_if(ADMIN | Owner("organizer_id"))
+
+Compilation happens in two steps. ``resolve(role)`` folds away everything that
+depends only on the user's role (``ADMIN`` is ``True`` for superusers), which is
+cached per policy and role by ``compile_policy``. What remains, if anything,
+becomes a plain ``record -> bool`` predicate for the current user.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
+
+from core.permissions.constants import GLOBAL_PERMISSIONS
+
+ANONYMOUS = "anonymous"
+MEMBER = "member"
+ADMIN_ROLE = "admin"
+
+
+def role_of(user: Any) -> str:
+    """Return the role a user's permissions are compiled for."""
+    if user is None:
+        return ANONYMOUS
+    return ADMIN_ROLE if getattr(user, "is_superuser", False) else MEMBER
+
+
+class Rule(ABC):
+    """Condition on a user and a record."""
+
+    @abstractmethod
+    def resolve(self, role: str) -> "bool | Rule":
+        """Return the outcome for ``role``, or the rule still needing the record."""
+
+    @abstractmethod
+    def predicate(self, user: Any) -> Callable[[Any], bool]:
+        """Return the record check of a rule ``resolve`` left unresolved."""
+
+    def __call__(self, user: Any, record: Any) -> bool:
+        resolved = self.resolve(role_of(user))
+        if isinstance(resolved, bool):
+            return resolved
+        return resolved.predicate(user)(record)
+
+    def __or__(self, other: "Rule") -> "Rule":
+        return AnyOf(self, other)
+
+
+class RoleRule(Rule):
+    """Rule decided by the user's role alone; ``resolve`` always returns a bool."""
+
+    def predicate(self, user: Any) -> Callable[[Any], bool]:
+        granted = self.resolve(role_of(user))
+        return lambda record: granted
+
+
+class Always(RoleRule):
+    """Granted to everyone."""
+
+    def resolve(self, role: str) -> bool:
+        return True
+
+
+class IsAdmin(RoleRule):
+    """Granted to superusers."""
+
+    def resolve(self, role: str) -> bool:
+        return role == ADMIN_ROLE
+
+
+class Owner(Rule):
+    """Granted when the record attribute at ``path`` is the user's id."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._get = attrgetter(path)
+
+    def resolve(self, role: str) -> "bool | Rule":
+        return False if role == ANONYMOUS else self
+
+    def predicate(self, user: Any) -> Callable[[Any], bool]:
+        user_id = user.id
+        get = self._get
+        return lambda record: get(record) == user_id
+
+
+class AnyOf(Rule):
+    """Granted when any of ``rules`` is."""
+
+    def __init__(self, *rules: Rule) -> None:
+        self.rules = tuple(
+            part
+            for rule in rules
+            for part in (rule.rules if isinstance(rule, AnyOf) else (rule,))
+        )
+
+    def resolve(self, role: str) -> "bool | Rule":
+        remaining = []
+        for rule in self.rules:
+            resolved = rule.resolve(role)
+            if resolved is True:
+                return True
+            if resolved is not False:
+                remaining.append(resolved)
+        if not remaining:
+            return False
+        return remaining[0] if len(remaining) == 1 else AnyOf(*remaining)
+
+    def predicate(self, user: Any) -> Callable[[Any], bool]:
+        predicates = [rule.predicate(user) for rule in self.rules]
+        return lambda record: any(check(record) for check in predicates)
+
+
+ADMIN = IsAdmin()
+ANYONE = Always()
+
+
+def allow_if(rule: Rule) -> Callable[[Any], bool]:
+    """Build a ``can_*`` policy method that grants the action when ``rule`` holds."""
+
+    def check(self) -> bool:
+        return rule(self.user, self.record)
+
+    check.rule = rule
+    return check
+
+
+@lru_cache(maxsize=None)
+def compile_policy(policy_class: type, role: str) -> dict[str, "bool | Rule"]:
+    """
+    Return the record-level rules of ``policy_class`` resolved for ``role``.
+
+    Only ``can_*`` methods built with ``allow_if`` are included; actions of
+    hand-written methods are missing and must be evaluated per record.
+    """
+    compiled = {}
+    for name in dir(policy_class):
+        action = name.removeprefix("can_")
+        if action == name or action in GLOBAL_PERMISSIONS:
+            continue
+        rule = getattr(getattr(policy_class, name), "rule", None)
+        if rule is not None:
+            compiled[action] = rule.resolve(role)
+    return compiled
@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    ``JSONResponse`` encoded by pydantic-core instead of the stdlib ``json``.
+
+    For handlers that build their payload themselves (cached dicts, ETag
+    responses): encoding runs in Rust and also accepts models, datetimes and
+    UUIDs. NaN and infinity become ``null`` rather than raising.
+
+    Routes returning their ``response_model`` should keep the default response
+    class: FastAPI then validates an instance of the exact model by reference
+    and dumps it to bytes in one pass, which a custom class would disable.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
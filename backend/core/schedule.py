@@ -0,0 +1,35 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import get_settings
+from core.db.commit_hooks import collect_for_commit
+from modules.announcements.model import Announcement
+
+ANNOUNCEMENT_TRANSITIONS = "announcement_transitions"
+"""Commit hook key of announcements whose transitions need (re)scheduling.
+
+The handler writing the schedules is registered by ``tasks.announcement_tasks``.
+"""
+
+
+def schedule_status_transitions(
+    session: AsyncSession | Session, announcement: Announcement
+) -> None:
+    """
+    Schedule the announcement's registration transitions once ``session`` commits.
+
+    Write paths that set registration times call this next to their flush.
+    Each transition gets one schedule per announcement, replaced whenever the
+    times change, so the status flips at the exact time without a sweep.
+    """
+    if not get_settings().schedule.transitions_enabled:
+        return
+    collect_for_commit(
+        session,
+        ANNOUNCEMENT_TRANSITIONS,
+        (
+            announcement.id,
+            announcement.registration_start_at,
+            announcement.registration_end_at,
+        ),
+    )
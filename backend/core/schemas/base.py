@@ -18,3 +18,4 @@ class PaginatedResponse(BaseModel, Generic[T]):
     limit: int
     filtered_count: int
     total_count: int
+    next_cursor: str | None = None
@@ -1,9 +1,35 @@
+from collections.abc import Hashable
+from dataclasses import dataclass
 from enum import Enum as PyEnum
 from typing import Type
 
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import String, func, select
 
+from core.search.count_cache import total_count_cache
+from exceptions import ValidationException
+from core.search.cursor import (
+    CursorKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+
+@dataclass(frozen=True)
+class SearchPage:
+    items: list
+    filtered_count: int
+    total_count: int
+
+
+@dataclass(frozen=True)
+class CursorPage:
+    items: list
+    next_cursor: str | None
+    filtered_count: int
+    total_count: int
+
 
 class BaseSearch:
     model: Type
@@ -18,6 +44,15 @@ class BaseSearch:
 
         return self.apply_filters(query)
 
+    def to_items(self, values: list) -> list:
+        """
+        Turn the first column of each result row into page items.
+
+        ORM searches return the entities as they are; searches whose
+        ``base_query`` selects a projection validate it into responses here.
+        """
+        return values
+
     @staticmethod
     def _normalize_filter_value(value: object) -> object:
         if isinstance(value, PyEnum):
@@ -53,18 +88,148 @@ class BaseSearch:
         query = self.base_query().offset(skip).limit(limit)
         result = await self.session.execute(query)
 
-        return result.scalars().all()
+        return self.to_items(result.scalars().all())
+
+    def cursor_keys(self) -> list[CursorKey]:
+        """Keyset ordering used by ``cursor_results``; must end with a unique column."""
+        return [CursorKey(self.model.created_at), CursorKey(self.model.id)]
+
+    async def cursor_results(
+        self, cursor: str | None = None, limit: int = 10
+    ) -> tuple[list, str | None]:
+        """
+        Return one keyset page and the cursor of the following page.
+
+        Unlike ``results`` no rows are skipped server-side: the cursor encodes the
+        sort-key values of the last returned row, so the page is read straight
+        from that position whatever its depth. ``next_cursor`` is None on the
+        last page.
+        """
+        query = self.base_query()
+        keys = self.cursor_keys()
+
+        query = (
+            query.add_columns(*(key.expression for key in keys))
+            .order_by(None)
+            .order_by(*(key.order_by() for key in keys))
+        )
+        if cursor:
+            values = decode_cursor(cursor, size=len(keys))
+            query = query.where(keyset_condition(keys, values))
+
+        result = await self.session.execute(query.limit(limit + 1))
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1:])
+
+        return self.to_items([row[0] for row in rows]), next_cursor
+
+    async def cursor_paginate(self, cursor: str = "", limit: int = 10) -> CursorPage:
+        """
+        Return one keyset page together with its filtered and total counts.
+
+        The filtered ``COUNT(*)`` runs on the first page only (empty cursor), or
+        not at all when that page is the last one. ``next_cursor`` carries the
+        count along with the ``cursor_results`` position, so later pages report
+        the count taken at the first page instead of recounting the whole
+        filtered set. The total comes from ``cached_total_count``.
+
+        Raises:
+            ValidationException: If ``cursor`` was not returned by this method.
+        """
+        filtered = None
+        position = ""
+        if cursor:
+            filtered, position = decode_cursor(cursor, size=2)
+            if not isinstance(filtered, int) or not isinstance(position, str):
+                raise ValidationException("Invalid cursor")
+
+        items, next_position = await self.cursor_results(cursor=position, limit=limit)
+        if filtered is None and next_position is None:
+            filtered = len(items)
+        elif filtered is None:
+            filtered = await self.filtered_count()
+
+        return CursorPage(
+            items=items,
+            next_cursor=(
+                encode_cursor([filtered, next_position]) if next_position else None
+            ),
+            filtered_count=filtered,
+            total_count=await self.cached_total_count(),
+        )
+
+    async def paginate(self, skip: int = 0, limit: int = 10) -> SearchPage:
+        """
+        Return one offset page together with its filtered and total counts.
+
+        The filtered count rides along each row as ``count(*) OVER ()`` and the
+        total count as a scalar subquery, so the page costs one statement
+        instead of three. The total is then served from ``total_count_cache``
+        until it expires. An out-of-range page has no rows to carry the
+        window count, so only that case falls back to ``filtered_count``.
+        """
+        cache_key = self.total_count_cache_key()
+        total = total_count_cache.get(cache_key)
+
+        query = self.base_query().add_columns(
+            func.count().over().label("filtered_count")
+        )
+        if total is None:
+            query = query.add_columns(
+                self._total_count_query()
+                .correlate(None)
+                .scalar_subquery()
+                .label("total_count")
+            )
+
+        result = await self.session.execute(query.offset(skip).limit(limit))
+        rows = result.all()
+
+        if rows:
+            filtered = rows[0].filtered_count
+            if total is None:
+                total = rows[0].total_count
+        else:
+            filtered = await self.filtered_count() if skip else 0
+            if total is None:
+                total = await self.total_count()
+        total_count_cache.set(cache_key, total)
+
+        return SearchPage(
+            items=self.to_items([row[0] for row in rows]),
+            filtered_count=filtered,
+            total_count=total,
+        )
+
+    async def cached_total_count(self) -> int:
+        """Return ``total_count`` through ``total_count_cache``."""
+        cache_key = self.total_count_cache_key()
+        total = total_count_cache.get(cache_key)
+        if total is None:
+            total = await self.total_count()
+            total_count_cache.set(cache_key, total)
+        return total
+
+    def total_count_cache_key(self) -> Hashable:
+        """Identify the unfiltered population counted by ``total_count``."""
+        return self.model.__tablename__
 
     async def filtered_count(self) -> int:
-        filtered_subquery = self.base_query().subquery()
+        filtered_subquery = self.base_query().order_by(None).subquery()
 
         count_query = select(func.count()).select_from(filtered_subquery)
         result = await self.session.execute(count_query)
 
         return result.scalar_one()
 
+    def _total_count_query(self):
+        return select(func.count()).select_from(self.model)
+
     async def total_count(self) -> int:
         """Return total count of all records without any filters applied."""
-        count_query = select(func.count()).select_from(self.model)
-        result = await self.session.execute(count_query)
+        result = await self.session.execute(self._total_count_query())
         return result.scalar_one()
@@ -0,0 +1,40 @@
+import threading
+import time
+from collections.abc import Hashable
+
+
+class TotalCountCache:
+    """Process-local cache for unfiltered list totals.
+
+    Totals of a table or scope change rarely compared to how often list
+    endpoints are read, so a few seconds of staleness is acceptable and saves
+    a ``COUNT(*)`` on every page request.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._values: dict[Hashable, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> int | None:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            with self._lock:
+                self._values.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: int) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self) -> None:
+        """Drop all cached totals (for testing)."""
+        with self._lock:
+            self._values.clear()
+
+
+total_count_cache = TotalCountCache()
@@ -0,0 +1,87 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import and_, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from exceptions import ValidationException
+
+
+@dataclass(frozen=True)
+class CursorKey:
+    """One column of a keyset ordering.
+
+    The full list of keys must be unique per row (end with the primary key)
+    so that every row has exactly one position in the ordering.
+    """
+
+    expression: ColumnElement
+    descending: bool = True
+
+    def order_by(self) -> ColumnElement:
+        return self.expression.desc() if self.descending else self.expression.asc()
+
+    def after(self, value: Any) -> ColumnElement:
+        """Condition selecting rows strictly after ``value`` in this key's direction."""
+        return self.expression < value if self.descending else self.expression > value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row into an opaque URL-safe token."""
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a token produced by ``encode_cursor``.
+
+    Raises:
+        ValidationException: If the token is malformed or was produced for a
+            different ordering (e.g. the ``q`` filter was added or removed).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [
+            datetime.fromisoformat(item["dt"]) if isinstance(item, dict) else item
+            for item in payload
+        ]
+    except (ValueError, TypeError, KeyError):
+        raise ValidationException("Invalid cursor")
+
+    if not isinstance(payload, list) or len(values) != size:
+        raise ValidationException("Invalid cursor")
+    return values
+
+
+def keyset_condition(keys: Sequence[CursorKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    Build the WHERE clause selecting rows that come after ``values``.
+
+    Keys sharing one direction collapse into a row comparison
+    ``(created_at, id) < (:c, :i)`` that a composite btree index can seek on.
+    Mixed directions (relevance ASC, created_at DESC, id DESC) expand to
+    ``k1 > v1 OR (k1 = v1 AND <rest>)``.
+    """
+    key, *rest_keys = keys
+    value, *rest_values = values
+    if not rest_keys:
+        return key.after(value)
+
+    if all(other.descending == key.descending for other in rest_keys):
+        row = tuple_(*(k.expression for k in keys))
+        position = tuple_(*values)
+        return row < position if key.descending else row > position
+
+    return or_(
+        key.after(value),
+        and_(key.expression == value, keyset_condition(rest_keys, rest_values)),
+    )
@@ -0,0 +1,72 @@
+import re
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.logger import logger
+
+SEARCH_CONFIG = "simple"
+"""Text search configuration shared by the tsvector columns and query parsing.
+
+``simple`` lowercases without stemming, so names, tags and mixed-language
+titles match the way users type them.
+"""
+
+ANNOUNCEMENT_SEARCH_VECTOR_FUNCTION = "announcements_search_vector"
+"""SQL function (created by migration) building the weighted announcement vector."""
+
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def prefix_tsquery(value: str) -> ColumnElement | None:
+    """
+    Build a ``to_tsquery`` matching every word of ``value`` as a prefix.
+
+    ``"dota tourn"`` becomes ``dota:* & tourn:*`` so partially typed words still
+    match. Punctuation is dropped instead of being passed to the tsquery parser.
+    Returns None when ``value`` has no searchable words.
+    """
+    words = _WORD.findall(value.lower())
+    if not words:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words))
+
+
+async def backfill_announcement_search_vectors(
+    session_factory: async_sessionmaker[AsyncSession], batch_size: int = 1000
+) -> int:
+    """
+    Fill ``announcements.search_vector`` for rows written before the trigger existed.
+
+    Works in batches with a commit per batch so a large table is never locked
+    in one long transaction. Returns the number of updated rows.
+    """
+    from modules.announcements.model import Announcement
+
+    total = 0
+    while True:
+        async with session_factory() as session:
+            batch_ids = (
+                select(Announcement.id)
+                .where(Announcement.search_vector.is_(None))
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                update(Announcement)
+                .where(Announcement.id.in_(batch_ids))
+                .values(
+                    search_vector=getattr(func, ANNOUNCEMENT_SEARCH_VECTOR_FUNCTION)(
+                        Announcement.title, Announcement.content
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+        updated = result.rowcount or 0
+        total += updated
+        logger.info(f"Backfilled search vectors for {updated} announcements")
+        if updated < batch_size:
+            return total
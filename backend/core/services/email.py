@@ -1,9 +1,120 @@
+import asyncio
+import time
+from functools import lru_cache
+
 import aiosmtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from core.config import get_settings
 from core.logger import logger
+from core.metrics import SMTP_SEND_DURATION
+
+
+class SMTPPool:
+    """Logged-in SMTP connections reused across messages.
+
+    At most ``size`` connections are open; a send waits for a free one. After a
+    send its connection goes back to the pool instead of closing, so only the
+    first messages pay for connecting, STARTTLS and login. Connections idle
+    longer than ``idle_seconds`` are closed rather than reused, before the
+    server times them out. A reused connection the server has dropped anyway
+    is replaced by a new one and the message is sent again once.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        size: int = 4,
+        idle_seconds: float = 60.0,
+    ) -> None:
+        self._hostname = hostname
+        self._port = port
+        self._username = username
+        self._password = password
+        self._idle_seconds = idle_seconds
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    async def send_message(self, message: MIMEMultipart) -> None:
+        """Send ``message`` over a pooled connection."""
+        async with self._slots:
+            server, reused = await self._checkout()
+            try:
+                await server.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                await self._discard(server)
+                if not reused:
+                    raise
+                logger.info("SMTP connection was dropped, reconnecting")
+                server = await self._connect()
+                try:
+                    await server.send_message(message)
+                except Exception:
+                    await self._discard(server)
+                    raise
+            except Exception:
+                await self._discard(server)
+                raise
+            self._idle.append((server, time.monotonic()))
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for server, _ in idle:
+            await self._discard(server)
+
+    async def _checkout(self) -> tuple[aiosmtplib.SMTP, bool]:
+        while self._idle:
+            server, released_at = self._idle.pop()
+            if (
+                server.is_connected
+                and time.monotonic() - released_at < self._idle_seconds
+            ):
+                return server, True
+            await self._discard(server)
+        return await self._connect(), False
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        server = aiosmtplib.SMTP(hostname=self._hostname, port=self._port)
+        await server.connect()
+        try:
+            if self._username and self._password:
+                await server.login(self._username, self._password)
+        except Exception:
+            await self._discard(server)
+            raise
+        return server
+
+    async def _discard(self, server: aiosmtplib.SMTP) -> None:
+        try:
+            await server.quit()
+        except Exception:
+            server.close()
+
+
+@lru_cache()
+def get_smtp_pool() -> SMTPPool:
+    """Return the process-wide SMTP connection pool."""
+    settings = get_settings().email
+    return SMTPPool(
+        hostname=settings.smtp_host,
+        port=settings.smtp_port,
+        username=settings.smtp_user,
+        password=settings.smtp_password,
+        size=settings.pool_size,
+        idle_seconds=settings.pool_idle_seconds,
+    )
+
+
+async def close_smtp_pool() -> None:
+    """Close the pooled SMTP connections, if the pool was ever used."""
+    if get_smtp_pool.cache_info().currsize:
+        await get_smtp_pool().close()
+        get_smtp_pool.cache_clear()
 
 
 class EmailService:
@@ -12,26 +123,19 @@ class EmailService:
     @staticmethod
     async def send_email(mail) -> bool:
         """Send email via SMTP asynchronously."""
-        settings = get_settings()
+        started = time.perf_counter()
 
         try:
             msg = EmailService._build_message(mail)
 
-            async with aiosmtplib.SMTP(
-                hostname=settings.email.smtp_host,
-                port=settings.email.smtp_port,
-            ) as server:
-                if settings.email.smtp_user and settings.email.smtp_password:
-                    await server.login(
-                        settings.email.smtp_user, settings.email.smtp_password
-                    )
-
-                await server.send_message(msg)
+            await get_smtp_pool().send_message(msg)
 
+            SMTP_SEND_DURATION.labels("sent").observe(time.perf_counter() - started)
             logger.info(f"📧 Email sent to {mail.to}")
             return True
 
         except Exception as e:
+            SMTP_SEND_DURATION.labels("failed").observe(time.perf_counter() - started)
             logger.error(f"❌ Failed to send email: {e}")
             return False
 
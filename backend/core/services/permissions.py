@@ -1,7 +1,10 @@
+from collections.abc import Callable
+from types import SimpleNamespace
 from typing import Any
 
 from core.logger import logger
 from core.permissions.registry import PoliciesRegistry
+from core.permissions.rules import compile_policy, role_of
 from exceptions import AppException
 from modules.users.model import User
 
@@ -32,16 +35,56 @@ class PermissionsService:
                 permissions[action] = False
                 continue
 
-            try:
-                method = getattr(policy_instance, f"can_{action}")
-                if callable(method):
-                    permissions[action] = method()
-            except (AttributeError, TypeError, ValueError) as e:
-                logger.error(f"Error checking permission '{action}': {e}")
-                permissions[action] = False
+            permissions[action] = self._evaluate(policy_instance, action)
 
         return permissions
 
+    @staticmethod
+    def _evaluate(policy_instance: Any, action: str) -> bool:
+        try:
+            return getattr(policy_instance, f"can_{action}")()
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Error checking permission '{action}': {e}")
+            return False
+
+    def compile_record_checks(
+        self, user: User | None, policy_class: type
+    ) -> dict[str, bool | Callable[[Any], bool]]:
+        """
+        Return each record-level action of ``policy_class`` as a constant or a check.
+
+        Rule-backed actions come from ``compile_policy``, cached per policy and
+        role, so an admin's page needs no per-record work and an organizer's is
+        one attribute comparison per record. Hand-written ``can_*`` methods fall
+        back to a policy instance per record.
+        """
+        actions = [
+            action
+            for action, is_global in self.registry.get_policy_methods(
+                policy_class
+            ).items()
+            if not is_global
+        ]
+        if not user:
+            return dict.fromkeys(actions, False)
+
+        compiled = compile_policy(policy_class, role_of(user))
+        checks = {}
+        for action in actions:
+            rule = compiled.get(action)
+            if rule is None:
+                checks[action] = self._method_check(user, policy_class, action)
+            elif isinstance(rule, bool):
+                checks[action] = rule
+            else:
+                checks[action] = rule.predicate(user)
+        return checks
+
+    def _method_check(
+        self, user: User, policy_class: type, action: str
+    ) -> Callable[[Any], bool]:
+        return lambda record: self._evaluate(policy_class(user, record), action)
+
     def get_record_permissions(self, user: User | None, record: Any) -> dict[str, bool]:
         """Get permissions for specific record."""
         try:
@@ -56,19 +99,35 @@ class PermissionsService:
             user, record, policy_class, include_global=False
         )
 
-    def get_batch_permissions(self, user: User | None, records: list[Any]) -> None:
+    def get_payload_permissions(
+        self, user: User | None, model: type, payload: dict[str, Any]
+    ) -> dict[str, bool]:
+        """Get record permissions from a serialized record (e.g. a cached response)."""
+        policy_class = self.registry.get_policy_for_record(model)
+        return self.get_permissions_from_policy(
+            user, SimpleNamespace(**payload), policy_class, include_global=False
+        )
+
+    def get_batch_permissions(
+        self, user: User | None, records: list[Any], model: type | None = None
+    ) -> None:
+        """
+        Assign ``permissions`` on each record.
+
+        The policy is looked up by ``model`` when given, so records that are not
+        model instances (e.g. projected responses) can share the model's policy.
+        """
         if not records:
             return
 
-        policy_class = self.registry.get_policy_for_record(records[0])
+        policy_class = self.registry.get_policy_for_record(model or records[0])
+        checks = list(self.compile_record_checks(user, policy_class).items())
 
         for record in records:
-            record.permissions = self.get_permissions_from_policy(
-                user=user,
-                record=record,
-                policy_class=policy_class,
-                include_global=False,
-            )
+            record.permissions = {
+                action: check if isinstance(check, bool) else check(record)
+                for action, check in checks
+            }
 
     def get_global_permissions(self, user: User | None) -> dict[str, dict[str, bool]]:
         """Get global permissions (not tied to objects)."""
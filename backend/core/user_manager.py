@@ -1,14 +1,24 @@
 from core.logger import logger
 from typing import Optional
 from core.config import get_settings
+from core.cache.user_cache import get_user_cache
+from core.outbox import add_to_outbox, task_name_of
 
 
 from fastapi import Request
-from fastapi_users import BaseUserManager, IntegerIDMixin
+from fastapi_users import BaseUserManager, IntegerIDMixin, schemas
 from modules.users.model import User
 
 
 class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
+    """
+    fastapi-users manager whose emails go through the outbox.
+
+    Registration, verification requests and password resets each run in one
+    ``UserDatabase.unit_of_work``, so the outbox message for the email commits
+    in the same transaction as the user it is about.
+    """
+
     @property
     def reset_password_token_secret(self) -> str:
         return get_settings().auth.reset_password_token_secret
@@ -17,6 +27,27 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     def verification_token_secret(self) -> str:
         return get_settings().auth.verification_token_secret
 
+    async def create(
+        self,
+        user_create: schemas.UC,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        async with self.user_db.unit_of_work():
+            return await super().create(user_create, safe, request)
+
+    async def request_verify(
+        self, user: User, request: Optional[Request] = None
+    ) -> None:
+        async with self.user_db.unit_of_work():
+            await super().request_verify(user, request)
+
+    async def forgot_password(
+        self, user: User, request: Optional[Request] = None
+    ) -> None:
+        async with self.user_db.unit_of_work():
+            await super().forgot_password(user, request)
+
     async def on_after_register(self, user: User, request: Optional[Request] = None):
         logger.info(f"User {user.id} has registered. Generating verification token.")
 
@@ -24,14 +55,30 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
 
         logger.info(f"Verification email queued for user {user.id}.")
 
+    async def on_after_update(
+        self, user: User, update_dict: dict, request: Optional[Request] = None
+    ):
+        await get_user_cache().invalidate(user.id)
+
+    async def on_after_verify(self, user: User, request: Optional[Request] = None):
+        await get_user_cache().invalidate(user.id)
+
+    async def on_after_reset_password(
+        self, user: User, request: Optional[Request] = None
+    ):
+        await get_user_cache().invalidate(user.id)
+
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
     ):
         logger.info(f"User {user.id} has forgot their password. Queueing reset email.")
         from tasks import send_password_reset_email_task
 
-        await send_password_reset_email_task.kiq(
-            email=user.email, token=token, first_name=user.first_name
+        self._queue_email(
+            send_password_reset_email_task,
+            email=user.email,
+            token=token,
+            first_name=user.first_name,
         )
 
     async def on_after_request_verify(
@@ -42,6 +89,13 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
         )
         from tasks import send_verification_email_task
 
-        await send_verification_email_task.kiq(
-            email=user.email, token=token, first_name=user.first_name
+        self._queue_email(
+            send_verification_email_task,
+            email=user.email,
+            token=token,
+            first_name=user.first_name,
         )
+
+    def _queue_email(self, task, **kwargs) -> None:
+        """Write ``task`` to the outbox in the running unit of work."""
+        add_to_outbox(self.user_db.session, task_name_of(task), **kwargs)
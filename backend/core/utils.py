@@ -6,3 +6,23 @@ def as_utc(value: datetime) -> datetime:
     if value.tzinfo is None or value.utcoffset() is None:
         return value.replace(tzinfo=timezone.utc)
     return value.astimezone(timezone.utc)
+
+
+def strong_etag(*parts: object) -> str:
+    """Build a strong ETag header value from version parts, e.g. ``"12-3"``."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Return True if an ``If-None-Match`` header matches ``etag``.
+
+    Handles ``*`` and comma-separated lists and, as RFC 9110 requires for
+    ``If-None-Match``, compares weakly: ``W/"12-3"`` matches ``"12-3"``.
+    """
+    if not if_none_match:
+        return False
+    candidates = [
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    ]
+    return "*" in candidates or etag in candidates
@@ -1,6 +1,7 @@
 from abc import ABC
 from bs4 import BeautifulSoup
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,18 @@ from mjml import mjml_to_html
 from core.config import get_settings
 from core.logger import logger
 
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+@lru_cache()
+def get_jinja_env() -> Environment:
+    """Return the Jinja environment shared by all mailers.
+
+    Jinja caches compiled templates per environment, so sharing one compiles
+    each template once per process instead of once per mailer.
+    """
+    return Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
+
 
 @dataclass
 class Mail:
@@ -43,8 +56,8 @@ class BaseMailer(ABC):
         self.settings = get_settings()
         self.default_from_email = self.settings.email.from_email
         self.default_from_name = self.settings.email.from_name
-        self.templates_dir = Path(__file__).parent / "templates"
-        self.jinja_env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+        self.templates_dir = TEMPLATES_DIR
+        self.jinja_env = get_jinja_env()
 
     def render_template(self, template_name: str, **context) -> tuple[str, str]:
         """Render MJML template to HTML and plain text."""
@@ -0,0 +1,41 @@
+from mailers.base_mailer import BaseMailer, Mail
+from core.config import get_settings
+from enums.registration_status import RegistrationStatus
+
+
+class RegistrationMailer(BaseMailer):
+    """Mailer for registration request emails."""
+
+    def __init__(self):
+        super().__init__()
+        self.settings = get_settings()
+
+    def status_email(
+        self,
+        email: str,
+        announcement_id: int,
+        announcement_title: str,
+        status: RegistrationStatus,
+        first_name: str = None,
+        reason: str | None = None,
+    ) -> Mail:
+        """Tell an applicant their registration was approved or rejected."""
+        announcement_url = (
+            f"{self.settings.cors.frontend_host}/announcements/{announcement_id}"
+        )
+        approved = status == RegistrationStatus.APPROVED
+
+        return self.mail(
+            to=email,
+            subject=(
+                f"You're in: {announcement_title}"
+                if approved
+                else f"Registration declined: {announcement_title}"
+            ),
+            template="registration_status_email",
+            first_name=first_name,
+            announcement_title=announcement_title,
+            announcement_url=announcement_url,
+            approved=approved,
+            reason=reason,
+        )
@@ -7,16 +7,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from tasks.broker import startup_broker, shutdown_broker
 from core.initializers import initialize_all
 from core.middleware.request_logging_middleware import RequestLoggingMiddleware
+from core.metrics import MetricsMiddleware, mark_process_dead, metrics_endpoint
 from exceptions import EXCEPTION_HANDLERS, API_RESPONSES
 from core.config import get_settings
 from core.logger import setup_logging, logger
 from api import router as api_router
-from core.db.container import get_db
-
-setup_logging()
+from core.db.container import get_db, get_replicas
+from core.live import close_live_hub
 
 settings = get_settings()
 
+setup_logging(
+    json_format=settings.log.json_format or settings.is_production,
+    sampling=settings.log.sampling,
+    rate_limits=settings.log.rate_limits,
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,7 +34,10 @@ async def lifespan(app: FastAPI):
 
     await shutdown_broker()
     logger.info("🛑 Shutting down GameAnnouncer API...")
+    await close_live_hub()
+    await get_replicas().dispose()
     await get_db().dispose()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -40,6 +49,11 @@ for exc_class, handler in EXCEPTION_HANDLERS:
     app.add_exception_handler(exc_class, handler)
 
 app.add_middleware(RequestLoggingMiddleware)
+
+if settings.metrics.enabled:
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 if settings.cors.all_cors_origins:
@@ -0,0 +1,21 @@
+from sqlalchemy.orm import selectinload
+
+from core.db.loading import LoaderProfiles
+from modules.announcements.model import Announcement
+from modules.registration.models import RegistrationForm
+
+_RESPONSE_OPTIONS = (
+    selectinload(Announcement.game),
+    selectinload(Announcement.registration_form).selectinload(RegistrationForm.fields),
+)
+"""Relationships rendered by ``AnnouncementResponse``."""
+
+ANNOUNCEMENT_LOADERS = LoaderProfiles(
+    list=_RESPONSE_OPTIONS,
+    detail=(selectinload(Announcement.organizer), *_RESPONSE_OPTIONS),
+    write=_RESPONSE_OPTIONS,
+)
+"""
+Operations that iterate participants (bracket generation, qualification)
+add ``selectinload(Announcement.participants)`` to the ``write`` profile.
+"""
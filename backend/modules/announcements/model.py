@@ -4,8 +4,10 @@ from typing import TYPE_CHECKING
 from datetime import datetime, timezone
 
 from core.db.base import Base
+from core.db.loading import RELATIONSHIP_LAZY
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import ForeignKey, String, Text, DateTime, Enum
+from sqlalchemy import ForeignKey, Index, String, Text, DateTime, Enum, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.associationproxy import association_proxy, AssociationProxy
 from enums import AnnouncementStatus, AnnouncementFormat, SeedMethod
 
@@ -21,9 +23,32 @@ if TYPE_CHECKING:
 class Announcement(Base):
     __tablename__ = "announcements"
 
+    __table_args__ = (
+        Index("ix_announcements_created_at_id", "created_at", "id"),
+        Index("ix_announcements_game_id", "game_id"),
+        Index(
+            "ix_announcements_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_announcements_pre_registration_start",
+            "registration_start_at",
+            postgresql_where=text("status = 'PRE_REGISTRATION'"),
+        ),
+        Index(
+            "ix_announcements_registration_open_end",
+            "registration_end_at",
+            postgresql_where=text("status = 'REGISTRATION_OPEN'"),
+        ),
+    )
+
     title: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, nullable=True, deferred=True
+    )
     start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -50,8 +75,15 @@ class Announcement(Base):
     bracket_size: Mapped[int | None] = mapped_column(nullable=True)
     third_place_match: Mapped[bool] = mapped_column(default=True, nullable=False)
     qualification_finished: Mapped[bool] = mapped_column(default=False, nullable=False)
+    bracket_version: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
 
     max_participants: Mapped[int] = mapped_column(nullable=False)
+    participants_count: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+    """Maintained by a database trigger on announcement_participants."""
 
     game_id: Mapped[int] = mapped_column(
         ForeignKey("games.id", ondelete="CASCADE"), nullable=False
@@ -64,14 +96,17 @@ class Announcement(Base):
         "User", back_populates="organized_announcements", passive_deletes=True
     )
     game: Mapped["Game"] = relationship(
-        "Game", back_populates="announcements", passive_deletes=True, lazy="selectin"
+        "Game",
+        back_populates="announcements",
+        passive_deletes=True,
+        lazy=RELATIONSHIP_LAZY,
     )
 
     participants: Mapped[list["AnnouncementParticipant"]] = relationship(
         "AnnouncementParticipant",
         back_populates="announcement",
         passive_deletes=True,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     participant_users: AssociationProxy[list["User"]] = association_proxy(
@@ -88,7 +123,7 @@ class Announcement(Base):
         cascade="all, delete-orphan",
         passive_deletes=True,
         uselist=False,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     matches: Mapped[list["Match"]] = relationship(
@@ -1,22 +1,19 @@
 from core.permissions.base_policy import BasePolicy
+from core.permissions.rules import ADMIN, Owner, allow_if
 
 
 class AnnouncementPolicy(BasePolicy):
     def can_create(self) -> bool:
         return self.user is not None and self.user.is_active
 
-    def can_edit(self) -> bool:
-        return self.is_admin or self.user.id == self.record.organizer_id
+    can_edit = allow_if(ADMIN | Owner("organizer_id"))
+    can_delete = allow_if(ADMIN | Owner("organizer_id"))
 
-    def can_delete(self) -> bool:
-        return self.is_admin or self.user.id == self.record.organizer_id
+    can_manage_lifecycle = allow_if(ADMIN | Owner("organizer_id"))
+    """
+    Permission to fire lifecycle transitions on the announcement.
 
-    def can_manage_lifecycle(self) -> bool:
-        """
-        Permission to fire lifecycle transitions on the announcement.
-
-        Currently equivalent to can_edit. Defined separately to allow future
-        divergence (e.g. a co-organizer role that can advance lifecycle but not
-        edit metadata).
-        """
-        return self.is_admin or self.user.id == self.record.organizer_id
+    Currently equivalent to can_edit. Defined separately to allow future
+    divergence (e.g. a co-organizer role that can advance lifecycle but not
+    edit metadata).
+    """
@@ -1,20 +1,15 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from core.db.loading import LoaderProfile
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
+from modules.announcements.read_models import (
+    select_announcement_list,
+    to_announcement_responses,
+)
+from modules.announcements.schemas import AnnouncementResponse
 from modules.participants.model import AnnouncementParticipant
-from modules.registration.models import RegistrationForm
-
-
-def _announcement_response_load_options():
-    return (
-        selectinload(Announcement.game),
-        selectinload(Announcement.participants),
-        selectinload(Announcement.registration_form).selectinload(
-            RegistrationForm.fields
-        ),
-    )
 
 
 class AnnouncementQueries:
@@ -23,21 +18,29 @@ class AnnouncementQueries:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def find_by_id(self, announcement_id: int) -> Announcement | None:
-        """Fetch a single announcement with organizer loaded."""
+    async def find_by_id(
+        self, announcement_id: int, profile: LoaderProfile = "detail"
+    ) -> Announcement | None:
+        """Fetch a single announcement with the relationships of ``profile`` loaded."""
         result = await self.session.execute(
             select(Announcement)
-            .options(
-                selectinload(Announcement.organizer),
-                *_announcement_response_load_options(),
-            )
+            .options(*ANNOUNCEMENT_LOADERS.options(profile))
             .where(Announcement.id == announcement_id)
         )
         return result.scalar_one_or_none()
 
+    async def find_bracket_version(self, announcement_id: int) -> int | None:
+        """Return the bracket version of an announcement, or None if it does not exist."""
+        result = await self.session.execute(
+            select(Announcement.bracket_version).where(
+                Announcement.id == announcement_id
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def find_all_by_organizer_id(
         self, organizer_id: int, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Announcement], int]:
+    ) -> tuple[list[AnnouncementResponse], int]:
         """Get paginated announcements by organizer with total count."""
         count_result = await self.session.execute(
             select(func.count())
@@ -47,20 +50,19 @@ class AnnouncementQueries:
         total = count_result.scalar_one()
 
         data_result = await self.session.execute(
-            select(Announcement)
-            .options(*_announcement_response_load_options())
+            select_announcement_list()
             .where(Announcement.organizer_id == organizer_id)
             .offset(skip)
             .limit(limit)
             .order_by(Announcement.created_at.desc())
         )
-        announcements = list(data_result.scalars().all())
+        announcements = to_announcement_responses(data_result.scalars().all())
 
         return announcements, total
 
     async def find_all_by_participant_id(
         self, user_id: int, skip: int = 0, limit: int = 10
-    ) -> tuple[list[Announcement], int]:
+    ) -> tuple[list[AnnouncementResponse], int]:
         """Get paginated announcements where the user is a participant."""
         count_result = await self.session.execute(
             select(func.count())
@@ -71,14 +73,13 @@ class AnnouncementQueries:
         total = count_result.scalar_one()
 
         data_result = await self.session.execute(
-            select(Announcement)
-            .options(*_announcement_response_load_options())
+            select_announcement_list()
             .join(Announcement.participants)
             .where(AnnouncementParticipant.user_id == user_id)
             .offset(skip)
             .limit(limit)
             .order_by(Announcement.created_at.desc())
         )
-        announcements = list(data_result.scalars().all())
+        announcements = to_announcement_responses(data_result.scalars().all())
 
         return announcements, total
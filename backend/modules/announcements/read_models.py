@@ -0,0 +1,156 @@
+"""
+Projection read models for announcement list endpoints.
+
+List pages need a flat response shape, not a unit of work: loading full
+``Announcement`` graphs costs one identity-map entry, change-tracking state and
+relationship collections per row plus a ``selectinload`` round trip per
+relationship. The projection below selects only the response columns and lets
+Postgres assemble each row into one JSON object, game and registration form
+included, so a page is one statement and validates straight into
+``AnnouncementResponse``.
+"""
+
+from enum import Enum
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, case, func, literal_column, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import aliased
+
+from enums import AnnouncementFormat, AnnouncementStatus, FormFieldType, SeedMethod
+from modules.announcements.model import Announcement
+from modules.announcements.schemas import AnnouncementResponse
+from modules.games.model import Game
+from modules.registration.models import FormField, RegistrationForm
+
+_game = aliased(Game, name="projected_game")
+_form = aliased(RegistrationForm, name="projected_form")
+_field = aliased(FormField, name="projected_field")
+"""
+Aliases keep the correlated subqueries self-contained, so filters joining the
+base tables (e.g. ``filter_by_q`` joining ``games``) do not get correlated away.
+"""
+
+_announcement_list_adapter = TypeAdapter(list[AnnouncementResponse])
+
+
+def _json_object(columns: dict[str, Any]) -> ColumnElement:
+    """Build ``json_build_object`` with inline keys so no key is sent as a parameter."""
+    arguments = []
+    for key, column in columns.items():
+        arguments.extend((literal_column(f"'{key}'"), column))
+    return func.json_build_object(*arguments, type_=JSON)
+
+
+def _enum_value(column: ColumnElement, enum_class: type[Enum]) -> ColumnElement:
+    """
+    Map an ``Enum`` column to its member values.
+
+    The columns store member names; the ORM translates them on load, which a
+    projection bypasses, so the translation is spelled out as a ``CASE``.
+    """
+    return case(
+        *(
+            (
+                column == literal_column(f"'{member.name}'"),
+                literal_column(f"'{member.value}'"),
+            )
+            for member in enum_class
+        )
+    )
+
+
+def _form_fields_json() -> ColumnElement:
+    field = _json_object(
+        {
+            "id": _field.id,
+            "form_id": _field.form_id,
+            "field_type": _enum_value(_field.field_type, FormFieldType),
+            "label": _field.label,
+            "required": _field.required,
+            "options": _field.options,
+        }
+    )
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(field, _field.id)),
+                func.json_build_array(),
+            )
+        )
+        .where(_field.form_id == _form.id)
+        .scalar_subquery()
+    )
+
+
+def _registration_form_json() -> ColumnElement:
+    return (
+        select(
+            _json_object(
+                {
+                    "id": _form.id,
+                    "announcement_id": _form.announcement_id,
+                    "fields": _form_fields_json(),
+                }
+            )
+        )
+        .where(_form.announcement_id == Announcement.id)
+        .scalar_subquery()
+    )
+
+
+def _game_json() -> ColumnElement:
+    return (
+        select(
+            _json_object(
+                {
+                    "id": _game.id,
+                    "name": _game.name,
+                    "image_url": _game.image_url,
+                    "category": _game.category,
+                }
+            )
+        )
+        .where(_game.id == Announcement.game_id)
+        .scalar_subquery()
+    )
+
+
+def announcement_list_projection() -> ColumnElement:
+    """Return one JSON column holding every ``AnnouncementResponse`` field."""
+    return _json_object(
+        {
+            "id": Announcement.id,
+            "created_at": Announcement.created_at,
+            "updated_at": Announcement.updated_at,
+            "title": Announcement.title,
+            "content": Announcement.content,
+            "format": _enum_value(Announcement.format, AnnouncementFormat),
+            "game_id": Announcement.game_id,
+            "start_at": Announcement.start_at,
+            "end_at": Announcement.end_at,
+            "registration_start_at": Announcement.registration_start_at,
+            "registration_end_at": Announcement.registration_end_at,
+            "max_participants": Announcement.max_participants,
+            "has_qualification": Announcement.has_qualification,
+            "organizer_id": Announcement.organizer_id,
+            "status": _enum_value(Announcement.status, AnnouncementStatus),
+            "participants_count": Announcement.participants_count,
+            "bracket_size": Announcement.bracket_size,
+            "seed_method": _enum_value(Announcement.seed_method, SeedMethod),
+            "qualification_finished": Announcement.qualification_finished,
+            "game": _game_json(),
+            "registration_form": _registration_form_json(),
+        }
+    ).label("announcement")
+
+
+def select_announcement_list():
+    """Select ``announcement_list_projection`` from the announcements table."""
+    return select(announcement_list_projection()).select_from(Announcement)
+
+
+def to_announcement_responses(rows: list[dict[str, Any]]) -> list[AnnouncementResponse]:
+    """Validate projected rows into response models in one adapter pass."""
+    return _announcement_list_adapter.validate_python(rows)
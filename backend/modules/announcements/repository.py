@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from core.cache import ANNOUNCEMENT, GAME, mark_stale
+from core.db.loading import refresh_columns
 from modules.announcements.model import Announcement
 
 
@@ -8,18 +10,40 @@ class AnnouncementRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def find_by_id_for_update(self, announcement_id: int) -> Announcement | None:
-        """Fetch and lock an announcement row with SELECT ... FOR UPDATE.
+    async def lock_participant_capacity(
+        self, announcement_id: int
+    ) -> tuple[int, int] | None:
+        """Lock an announcement row and return (participants_count, max_participants).
 
-        Used to serialize concurrent operations that depend on participant
-        count (e.g. approve).
+        Serializes concurrent approvals: the lock is held until the transaction
+        ends, and participants_count is read from the row, not from a possibly
+        stale object in the session.
         """
         result = await self.session.execute(
-            select(Announcement)
+            select(Announcement.participants_count, Announcement.max_participants)
             .where(Announcement.id == announcement_id)
             .with_for_update()
         )
-        return result.scalar_one_or_none()
+        row = result.one_or_none()
+        return (row.participants_count, row.max_participants) if row else None
+
+    async def bump_bracket_version(self, announcement_id: int) -> int:
+        """Increment the bracket version used as the bracket/matches ETag.
+
+        Must run in the same transaction as every write that changes the
+        announcement's matches. Flushes but does not commit.
+
+        Returns:
+            The new version.
+        """
+        result = await self.session.execute(
+            update(Announcement)
+            .where(Announcement.id == announcement_id)
+            .values(bracket_version=Announcement.bracket_version + 1)
+            .returning(Announcement.bracket_version)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one()
 
     async def update(self, announcement: Announcement, data: dict) -> Announcement:
         """Apply a partial update to an announcement and persist it.
@@ -35,10 +59,17 @@ class AnnouncementRepository:
         """Persist an announcement (create or update). Flushes but does not commit."""
         self.session.add(announcement)
         await self.session.flush()
-        await self.session.refresh(announcement)
+        await refresh_columns(self.session, announcement)
+        self._mark_stale(announcement)
         return announcement
 
     async def delete(self, announcement: Announcement) -> None:
         """Delete an announcement. Flushes but does not commit."""
         await self.session.delete(announcement)
         await self.session.flush()
+        self._mark_stale(announcement)
+
+    def _mark_stale(self, announcement: Announcement) -> None:
+        """Invalidate cached reads of the announcement and its game's counters."""
+        mark_stale(self.session, ANNOUNCEMENT, announcement.id)
+        mark_stale(self.session, GAME, announcement.game_id)
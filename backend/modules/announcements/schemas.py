@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field
 
 from modules.games.schemas import GameForAnnouncementResponse
 from core.schemas.base import BaseSchemaWithPermissions
 from core.search.base_filter import BaseFilter
-from modules.participants.schemas import AnnouncementParticipantResponse
 from modules.registration.form_schemas import (
     RegistrationFormCreate,
     RegistrationFormResponse,
@@ -88,10 +87,8 @@ class AnnouncementResponse(AnnouncementBase, BaseSchemaWithPermissions):
         ..., description="The ID of the user who organized the announcement"
     )
     status: str = Field(..., description="The current status of the announcement")
-    participants: list[AnnouncementParticipantResponse] = Field(
-        default_factory=list,
-        description="List of participants with their data",
-        exclude=True,
+    participants_count: int = Field(
+        0, description="Number of confirmed participants in the announcement"
     )
     registration_form: RegistrationFormResponse | None = Field(
         None, description="Custom registration form for this announcement, if exists"
@@ -110,12 +107,6 @@ class AnnouncementResponse(AnnouncementBase, BaseSchemaWithPermissions):
         ..., description="The game associated with this announcement"
     )
 
-    @computed_field
-    @property
-    def participants_count(self) -> int:
-        """Number of confirmed participants in the announcement."""
-        return len(self.participants)
-
 
 class AnnouncementForRegistrationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -126,15 +117,7 @@ class AnnouncementForRegistrationResponse(BaseModel):
     format: str
     registration_end_at: datetime
     game: GameForAnnouncementResponse
-    participants: list[AnnouncementParticipantResponse] = Field(
-        default_factory=list, exclude=True
-    )
-
-    @computed_field
-    @property
-    def participants_count(self) -> int:
-        """Number of confirmed participants in the announcement."""
-        return len(self.participants)
+    participants_count: int = 0
 
 
 class AnnouncementFilter(BaseFilter):
@@ -1,11 +1,15 @@
-from sqlalchemy import select, or_, case, desc, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import case, desc, func, select, union
 
 from modules.announcements.model import Announcement
+from modules.announcements.read_models import (
+    select_announcement_list,
+    to_announcement_responses,
+)
 from modules.announcements.schemas import AnnouncementFilter
 from modules.games.model import Game
-from modules.registration.models import RegistrationForm
 from core.search.base_search import BaseSearch
+from core.search.cursor import CursorKey
+from core.search.full_text import prefix_tsquery
 
 
 class AnnouncementSearch(BaseSearch):
@@ -13,47 +17,75 @@ class AnnouncementSearch(BaseSearch):
     filter_schema = AnnouncementFilter
 
     MIN_SEARCH_LENGTH = 2
+    MIN_TRIGRAM_LENGTH = 3
+
+    def __init__(self, session, filters):
+        super().__init__(session=session, filters=filters)
+        self._priority = None
+        self._rank = None
 
     def base_query(self):
-        query = select(self.model).options(
-            selectinload(Announcement.game),
-            selectinload(Announcement.participants),
-            selectinload(Announcement.registration_form).selectinload(
-                RegistrationForm.fields
-            ),
-        )
-        query = self.apply_filters(query)
-        query = query.order_by(desc(Announcement.created_at))
+        query = self.apply_filters(select_announcement_list())
+        query = query.order_by(desc(Announcement.created_at), desc(Announcement.id))
         return query
 
+    def to_items(self, values: list) -> list:
+        return to_announcement_responses(values)
+
+    def cursor_keys(self) -> list[CursorKey]:
+        """Prepend the ``q`` relevance keys when the search filter is active."""
+        keys = super().cursor_keys()
+        if self._rank is not None:
+            keys.insert(0, CursorKey(self._rank))
+        if self._priority is not None:
+            keys.insert(0, CursorKey(self._priority, descending=False))
+        return keys
+
     def filter_by_q(self, query, value: str):
         """
         Universal search filter across game.name, announcement.title, and announcement.content.
-        Results are prioritized by match location: game.name > title > content.
-        Then sorted by created_at DESC.
+
+        Game names are matched by substring through the ``pg_trgm`` index; title and
+        content are matched by word prefix against the GIN-indexed ``search_vector``.
+        Each match is its own indexed select of announcement ids, combined with
+        ``UNION``, since an ``OR`` across the games and announcements tables cannot
+        use either index and scans all announcements.
+        Values shorter than ``MIN_TRIGRAM_LENGTH`` have no trigram to look up, so
+        they only search title and content.
+        Results with a matching game come first, then by ``ts_rank`` (title words
+        weigh more than content words), then by created_at DESC.
         """
         if len(value) < self.MIN_SEARCH_LENGTH:
             return query
 
-        query = query.join(Game, Announcement.game_id == Game.id)
-
-        search_pattern = f"%{value}%"
+        matches = []
+        game_ids = None
+        if len(value) >= self.MIN_TRIGRAM_LENGTH:
+            game_ids = select(Game.id).where(Game.name.ilike(f"%{value}%"))
+            matches.append(
+                select(Announcement.id).where(Announcement.game_id.in_(game_ids))
+            )
 
-        search_conditions = or_(
-            Game.name.ilike(search_pattern),
-            Announcement.title.ilike(search_pattern),
-            func.coalesce(Announcement.content, "").ilike(search_pattern),
-        )
+        tsquery = prefix_tsquery(value)
+        if tsquery is not None:
+            matches.append(
+                select(Announcement.id).where(
+                    Announcement.search_vector.op("@@")(tsquery)
+                )
+            )
+            self._rank = func.coalesce(
+                func.ts_rank(Announcement.search_vector, tsquery), 0.0
+            )
 
-        query = query.where(search_conditions)
-
-        priority = case(
-            (Game.name.ilike(search_pattern), 1),
-            (Announcement.title.ilike(search_pattern), 2),
-            (func.coalesce(Announcement.content, "").ilike(search_pattern), 3),
-            else_=4,
-        )
-
-        query = query.order_by(priority, desc(Announcement.created_at))
+        if not matches:
+            return query
+        ids = matches[0] if len(matches) == 1 else union(*matches)
+        query = query.where(Announcement.id.in_(ids))
 
-        return query
+        ordering = []
+        if game_ids is not None:
+            self._priority = case((Announcement.game_id.in_(game_ids), 1), else_=2)
+            ordering.append(self._priority)
+        if self._rank is not None:
+            ordering.append(desc(self._rank))
+        return query.order_by(*ordering, desc(Announcement.created_at))
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from modules.announcements.model import Announcement
 from modules.matches.queries import MatchQueries
 from modules.matches.schemas import BracketResponse, MatchResponse
+from modules.matches.topology import get_bracket_topology
 from exceptions import AppException
 
 
@@ -60,13 +61,4 @@ def compute_bracket_slots(size: int) -> list[int]:
     Raises:
         ValueError: If size is not a power of two >= 2.
     """
-    if size < 2 or (size & (size - 1)) != 0:
-        raise ValueError(f"bracket_size must be a power of two >= 2, got {size}")
-    if size == 2:
-        return [1, 2]
-    half = compute_bracket_slots(size // 2)
-    result = []
-    for seed in half:
-        result.append(seed)
-        result.append(size + 1 - seed)
-    return result
+    return list(get_bracket_topology(size, third_place_match=False).slots)
@@ -1,16 +1,11 @@
 from core.permissions.base_policy import BasePolicy
+from core.permissions.rules import ADMIN, ANYONE, allow_if
 
 
 class GamePolicy(BasePolicy):
-    def can_view(self) -> bool:
-        """Games are public catalog data; anyone may view them."""
-        return True
+    can_view = allow_if(ANYONE)
+    """Games are public catalog data; anyone may view them."""
 
-    def can_create(self) -> bool:
-        return self.is_admin
-
-    def can_edit(self) -> bool:
-        return self.is_admin
-
-    def can_delete(self) -> bool:
-        return self.is_admin
+    can_create = allow_if(ADMIN)
+    can_edit = allow_if(ADMIN)
+    can_delete = allow_if(ADMIN)
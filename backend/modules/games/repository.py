@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import GAME, mark_stale
 from modules.games.model import Game
 
 
@@ -21,6 +22,7 @@ class GameRepository:
         self.session.add(game)
         await self.session.flush()
         await self.session.refresh(game)
+        mark_stale(self.session, GAME, game.id)
         return game
 
     async def delete(self, game: Game) -> None:
@@ -31,3 +33,4 @@ class GameRepository:
         """
         await self.session.delete(game)
         await self.session.flush()
+        mark_stale(self.session, GAME, game.id)
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import selectinload
+
+from core.db.loading import LoaderProfiles
+from modules.matches.model import Match
+
+_PARTICIPANT_OPTIONS = (
+    selectinload(Match.participant1),
+    selectinload(Match.participant2),
+)
+"""Participants rendered by ``MatchResponse`` and placed by result submission."""
+
+MATCH_LOADERS = LoaderProfiles(
+    list=_PARTICIPANT_OPTIONS,
+    detail=_PARTICIPANT_OPTIONS,
+    write=_PARTICIPANT_OPTIONS,
+)
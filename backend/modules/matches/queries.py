@@ -1,7 +1,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from modules.matches.loaders import MATCH_LOADERS
 from modules.matches.model import Match
 
 
@@ -15,10 +15,7 @@ class MatchQueries:
         """Fetch a single match by ID with participants preloaded."""
         result = await self.session.execute(
             select(Match)
-            .options(
-                selectinload(Match.participant1),
-                selectinload(Match.participant2),
-            )
+            .options(*MATCH_LOADERS.options("detail"))
             .where(Match.id == match_id)
         )
         return result.scalar_one_or_none()
@@ -36,10 +33,7 @@ class MatchQueries:
 
         data_result = await self.session.execute(
             select(Match)
-            .options(
-                selectinload(Match.participant1),
-                selectinload(Match.participant2),
-            )
+            .options(*MATCH_LOADERS.options("list"))
             .where(Match.announcement_id == announcement_id)
             .order_by(Match.round_number, Match.match_number)
             .offset(skip)
@@ -54,10 +48,7 @@ class MatchQueries:
         result = await self.session.execute(
             select(Match)
             .where(Match.announcement_id == announcement_id)
-            .options(
-                selectinload(Match.participant1),
-                selectinload(Match.participant2),
-            )
+            .options(*MATCH_LOADERS.options("list"))
             .order_by(Match.round_number, Match.match_number)
         )
         return list(result.scalars().all())
@@ -1,6 +1,7 @@
-from sqlalchemy import select
+from sqlalchemy import Integer, column, insert, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import ANNOUNCEMENT, mark_stale
 from modules.matches.model import Match
 from enums import MatchStatus
 
@@ -10,14 +11,68 @@ class MatchRepository:
         self.session = session
 
     async def save_many(self, matches: list[Match]) -> list[Match]:
-        """Persist multiple matches in a single flush. Does not commit."""
-        for match in matches:
-            self.session.add(match)
-        await self.session.flush()
-        for match in matches:
-            await self.session.refresh(match)
+        """
+        Insert new matches with a single ``INSERT ... RETURNING id``. Does not commit.
+
+        The generated IDs are assigned to the given objects, which are not added
+        to the session. SQLAlchemy batches the rows into one multi-row statement
+        (1000 rows per statement), so the round trips do not grow with the
+        bracket size. ``render_nulls`` keeps ``None`` values in every row;
+        otherwise rows with different null columns (e.g. a BYE without
+        ``participant2_id``) would be split into separate INSERTs.
+        """
+        if not matches:
+            return matches
+
+        result = await self.session.execute(
+            insert(Match)
+            .returning(Match.id, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            [
+                {
+                    "announcement_id": match.announcement_id,
+                    "round_number": match.round_number,
+                    "match_number": match.match_number,
+                    "participant1_id": match.participant1_id,
+                    "participant2_id": match.participant2_id,
+                    "winner_id": match.winner_id,
+                    "next_match_winner_id": match.next_match_winner_id,
+                    "status": match.status or MatchStatus.PENDING,
+                    "is_bye": bool(match.is_bye),
+                    "is_third_place": bool(match.is_third_place),
+                }
+                for match in matches
+            ],
+        )
+        for match, match_id in zip(matches, result.scalars()):
+            match.id = match_id
+
+        for announcement_id in {match.announcement_id for match in matches}:
+            mark_stale(self.session, ANNOUNCEMENT, announcement_id)
         return matches
 
+    async def link_next_matches(self, links: list[tuple[int, int]]) -> None:
+        """
+        Set ``next_match_winner_id`` for many matches in one statement. Does not commit.
+
+        Takes ``(match_id, next_match_winner_id)`` pairs and issues a single
+        ``UPDATE matches ... FROM (VALUES ...)``.
+        """
+        if not links:
+            return
+
+        link_values = values(
+            column("id", Integer),
+            column("next_match_winner_id", Integer),
+            name="links",
+        ).data(links)
+        await self.session.execute(
+            update(Match)
+            .where(Match.id == link_values.c.id)
+            .values(next_match_winner_id=link_values.c.next_match_winner_id)
+            .execution_options(synchronize_session=False)
+        )
+
     async def exists_for_announcement(self, announcement_id: int) -> bool:
         """Return True if any matches exist for the given announcement."""
         result = await self.session.execute(
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from enums import MatchStatus
 
@@ -38,6 +38,18 @@ class MatchResultUpdate(BaseModel):
     winner: Literal["participant1", "participant2"]
 
 
+class MatchResultEntry(MatchResultUpdate):
+    """One result of a batch submission."""
+
+    match_id: int
+
+
+class MatchResultsBatchUpdate(BaseModel):
+    """Request body for reporting several results of one announcement at once."""
+
+    results: list[MatchResultEntry] = Field(min_length=1, max_length=500)
+
+
 class BracketResponse(BaseModel):
     """Full bracket for an announcement, grouped by round."""
 
@@ -1,7 +1,6 @@
-import math
-
 from modules.matches.model import Match
 from modules.matches.repository import MatchRepository
+from modules.matches.topology import BracketTopology, get_bracket_topology
 from modules.participants.model import AnnouncementParticipant
 from enums import MatchStatus
 
@@ -10,8 +9,11 @@ class BracketMatchBuilder:
     """
     Callable service that builds and wires all Match records for a single-elimination bracket.
 
-    Handles creating Match objects for all rounds, persisting them,
-    linking them via next_match_winner_id, and propagating BYE winners.
+    Builds the whole bracket tree in memory (all rounds, BYE winners already
+    propagated), inserts it with one bulk INSERT and writes the
+    next_match_winner_id links with one bulk UPDATE, so generation takes the
+    same number of round trips for any bracket size. Match positions and their
+    links come from the memoized BracketTopology for the bracket shape.
     Does not handle seeding logic — seeding_slots and assigned seeds are
     provided by the caller.
 
@@ -26,7 +28,6 @@ class BracketMatchBuilder:
     Usage:
         builder = BracketMatchBuilder(announcement_id=1, third_place_match=True)
         await builder.call(eligible, bracket_size, seeding_slots, match_repo)
-        await session.flush()
     """
 
     def __init__(self, announcement_id: int, third_place_match: bool) -> None:
@@ -41,75 +42,51 @@ class BracketMatchBuilder:
         match_repo: MatchRepository,
     ) -> None:
         """
-        Build all Match records, persist them, link rounds, and propagate BYEs.
+        Build all Match records, propagate BYEs, persist them and link rounds.
 
-        Must be followed by session.flush() from the caller to finalise changes.
+        Issues the INSERT and the link UPDATE directly; nothing is left pending
+        for the caller's next flush.
         """
-        matches_by_round = self._build_matches(eligible, bracket_size, seeding_slots)
+        topology = get_bracket_topology(bracket_size, self._third_place_match)
+        matches = self._build_matches(eligible, topology, seeding_slots)
+        self._propagate_byes(matches, topology)
 
-        all_matches = []
-        for round_matches in matches_by_round.values():
-            all_matches.extend(round_matches)
-        await match_repo.save_many(all_matches)
+        await match_repo.save_many(matches)
 
-        self._link_next_matches(matches_by_round)
-        self._propagate_byes(matches_by_round)
+        await match_repo.link_next_matches(self._next_match_links(matches, topology))
 
     def _build_matches(
         self,
         eligible: list[AnnouncementParticipant],
-        bracket_size: int,
+        topology: BracketTopology,
         seeding_slots: list[int],
-    ) -> dict[int, list[Match]]:
+    ) -> list[Match]:
         """
-        Create all Match objects for every round without persisting.
+        Create all Match objects in topology order without persisting.
 
         Round 1 is built from seeding_slots — a slot with no matching participant
         produces a BYE match where the present participant advances automatically.
-        Rounds 2..num_rounds are empty PENDING matches.
-        A third-place match is added at the semifinal round when enabled.
+        Later rounds and the third-place match are empty PENDING matches.
         """
-        num_rounds = int(math.log2(bracket_size))
-        matches_by_round: dict[int, list[Match]] = {}
-
-        matches_by_round[1] = self._build_first_round(
-            eligible, seeding_slots, bracket_size
-        )
-
-        for round_number in range(2, num_rounds + 1):
-            previous_non_third = [
-                m for m in matches_by_round[round_number - 1] if not m.is_third_place
-            ]
-            match_count = len(previous_non_third) // 2
-            matches_by_round[round_number] = [
-                Match(
-                    announcement_id=self._announcement_id,
-                    round_number=round_number,
-                    match_number=match_number,
-                    status=MatchStatus.PENDING,
-                )
-                for match_number in range(1, match_count + 1)
-            ]
-
-        if num_rounds >= 2 and self._third_place_match:
-            semifinal_round = num_rounds - 1
-            matches_by_round[semifinal_round].append(
+        first_round_size = topology.bracket_size // 2
+        matches = self._build_first_round(eligible, seeding_slots, first_round_size)
+        for index in range(first_round_size, topology.match_count):
+            matches.append(
                 Match(
                     announcement_id=self._announcement_id,
-                    round_number=semifinal_round,
-                    match_number=3,
+                    round_number=topology.round_numbers[index],
+                    match_number=topology.match_numbers[index],
                     status=MatchStatus.PENDING,
-                    is_third_place=True,
+                    is_third_place=index == topology.third_place_index,
                 )
             )
-
-        return matches_by_round
+        return matches
 
     def _build_first_round(
         self,
         eligible: list[AnnouncementParticipant],
         seeding_slots: list[int],
-        bracket_size: int,
+        match_count: int,
     ) -> list[Match]:
         """
         Build round 1 matches by pairing participants from seeding_slots.
@@ -121,7 +98,7 @@ class BracketMatchBuilder:
         participant_by_seed = {p.seed: p for p in eligible}
         matches = []
 
-        for match_number in range(1, bracket_size // 2 + 1):
+        for match_number in range(1, match_count + 1):
             top = participant_by_seed.get(seeding_slots[(match_number - 1) * 2])
             bottom = participant_by_seed.get(seeding_slots[(match_number - 1) * 2 + 1])
 
@@ -153,31 +130,28 @@ class BracketMatchBuilder:
 
         return matches
 
-    def _link_next_matches(self, matches_by_round: dict[int, list[Match]]) -> None:
+    @staticmethod
+    def _next_match_links(
+        matches: list[Match], topology: BracketTopology
+    ) -> list[tuple[int, int]]:
         """
-        Set next_match_winner_id on each match to link the bracket progression.
+        Compute (match_id, next_match_winner_id) pairs linking the bracket progression.
 
-        Round R match M advances to Round R+1 match ceil(M/2).
-        Odd-numbered match fills participant1 slot; even fills participant2 slot.
-        Third-place matches are not linked forward.
+        Follows topology.parents; the final and the third-place match are not
+        linked forward.
 
         Requires matches to be already persisted so that IDs are assigned.
         """
-        num_rounds = max(matches_by_round.keys())
-        for round_number in range(1, num_rounds):
-            next_round_matches = matches_by_round.get(round_number + 1, [])
-            next_match_by_number = {
-                m.match_number: m for m in next_round_matches if not m.is_third_place
-            }
-            for match in matches_by_round[round_number]:
-                if match.is_third_place:
-                    continue
-                next_match_number = math.ceil(match.match_number / 2)
-                next_match = next_match_by_number.get(next_match_number)
-                if next_match:
-                    match.next_match_winner_id = next_match.id
-
-    def _propagate_byes(self, matches_by_round: dict[int, list[Match]]) -> None:
+        links = []
+        for match, parent in zip(matches, topology.parents):
+            if parent < 0:
+                continue
+            match.next_match_winner_id = matches[parent].id
+            links.append((match.id, matches[parent].id))
+        return links
+
+    @staticmethod
+    def _propagate_byes(matches: list[Match], topology: BracketTopology) -> None:
         """
         Propagate BYE winners from round 1 into their round 2 participant slots.
 
@@ -185,19 +159,13 @@ class BracketMatchBuilder:
         Even-numbered BYE → fills participant2_id of the next match.
         If both slots are filled after propagation, the match status becomes READY.
         """
-        second_round_matches = {
-            m.match_number: m
-            for m in matches_by_round.get(2, [])
-            if not m.is_third_place
-        }
-        for bye_match in matches_by_round.get(1, []):
-            if not bye_match.is_bye or bye_match.winner_id is None:
-                continue
-            next_match_number = math.ceil(bye_match.match_number / 2)
-            next_match = second_round_matches.get(next_match_number)
-            if next_match is None:
+        for index in range(topology.bracket_size // 2):
+            bye_match = matches[index]
+            parent = topology.parents[index]
+            if not bye_match.is_bye or bye_match.winner_id is None or parent < 0:
                 continue
-            if bye_match.match_number % 2 == 1:
+            next_match = matches[parent]
+            if topology.parent_slots[index] == 0:
                 next_match.participant1_id = bye_match.winner_id
             else:
                 next_match.participant2_id = bye_match.winner_id
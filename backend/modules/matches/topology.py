@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+MatchSlot = Literal["participant1", "participant2"]
+
+_SLOTS: tuple[MatchSlot, MatchSlot] = ("participant1", "participant2")
+
+
+@dataclass(frozen=True, slots=True)
+class BracketTopology:
+    """
+    Shape of a single-elimination bracket, independent of any announcement.
+
+    Matches are addressed by a flat index in persistence order: round 1 by
+    match number, then round 2, and so on. The third-place match, when
+    enabled, is match number 3 of the semifinal round. ``parents[i]`` is the
+    index of the match the winner of match ``i`` advances to (-1 for the
+    final and the third-place match) and ``parent_slots[i]`` the slot there
+    (0 = participant1, 1 = participant2).
+
+    Instances are immutable and shared; obtain them via ``get_bracket_topology``.
+    """
+
+    bracket_size: int
+    third_place_match: bool
+    slots: tuple[int, ...]
+    round_offsets: tuple[int, ...]
+    round_numbers: tuple[int, ...]
+    match_numbers: tuple[int, ...]
+    parents: tuple[int, ...]
+    parent_slots: tuple[int, ...]
+    third_place_index: int
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.round_offsets)
+
+    @property
+    def match_count(self) -> int:
+        return len(self.round_numbers)
+
+    @property
+    def semifinal_round(self) -> int | None:
+        return self.num_rounds - 1 if self.num_rounds >= 2 else None
+
+    def index_of(self, round_number: int, match_number: int) -> int:
+        """
+        Return the flat index of a match position.
+
+        Raises:
+            ValueError: If the position does not exist in this bracket.
+        """
+        if 1 <= round_number <= self.num_rounds and match_number >= 1:
+            index = self.round_offsets[round_number - 1] + match_number - 1
+            if index < self.match_count and self.round_numbers[index] == round_number:
+                return index
+        raise ValueError(
+            f"No match {match_number} in round {round_number} "
+            f"of a {self.bracket_size}-slot bracket"
+        )
+
+    def is_final(self, round_number: int, match_number: int) -> bool:
+        return round_number == self.num_rounds and match_number == 1
+
+    def winner_target(
+        self, round_number: int, match_number: int
+    ) -> tuple[int, int, MatchSlot] | None:
+        """Return ``(round_number, match_number, slot)`` the winner advances to."""
+        index = self.index_of(round_number, match_number)
+        parent = self.parents[index]
+        if parent < 0:
+            return None
+        return (
+            self.round_numbers[parent],
+            self.match_numbers[parent],
+            _SLOTS[self.parent_slots[index]],
+        )
+
+    def loser_target(
+        self, round_number: int, match_number: int
+    ) -> tuple[int, int, MatchSlot] | None:
+        """Return the third-place position the loser of a semifinal drops to."""
+        if (
+            self.third_place_index < 0
+            or round_number != self.semifinal_round
+            or match_number not in (1, 2)
+        ):
+            return None
+        return (
+            self.round_numbers[self.third_place_index],
+            self.match_numbers[self.third_place_index],
+            _SLOTS[match_number - 1],
+        )
+
+
+def seeding_slots(size: int) -> list[int]:
+    """
+    Compute the ordered slot list for standard single-elimination seeding.
+
+    Index pairs (0,1), (2,3)... define round 1 matches such that seed 1 faces
+    seed N, seed 4 faces seed N-3, etc. Example: size=4 → [1, 4, 2, 3].
+
+    Raises:
+        ValueError: If size is not a power of two >= 2.
+    """
+    if size < 2 or (size & (size - 1)) != 0:
+        raise ValueError(f"bracket_size must be a power of two >= 2, got {size}")
+    slots = [1, 2]
+    while len(slots) < size:
+        next_size = len(slots) * 2
+        slots = [seed for top in slots for seed in (top, next_size + 1 - top)]
+    return slots
+
+
+@lru_cache(maxsize=None)
+def get_bracket_topology(bracket_size: int, third_place_match: bool) -> BracketTopology:
+    """
+    Return the memoized topology for a bracket size and third-place setting.
+
+    Raises:
+        ValueError: If bracket_size is not a power of two >= 2.
+    """
+    slots = seeding_slots(bracket_size)
+    num_rounds = bracket_size.bit_length() - 1
+    has_third_place = third_place_match and num_rounds >= 2
+
+    round_offsets: list[int] = []
+    round_numbers: list[int] = []
+    match_numbers: list[int] = []
+    third_place_index = -1
+    for round_number in range(1, num_rounds + 1):
+        round_offsets.append(len(round_numbers))
+        match_count = bracket_size >> round_number
+        for match_number in range(1, match_count + 1):
+            round_numbers.append(round_number)
+            match_numbers.append(match_number)
+        if has_third_place and round_number == num_rounds - 1:
+            third_place_index = len(round_numbers)
+            round_numbers.append(round_number)
+            match_numbers.append(3)
+
+    parents: list[int] = []
+    parent_slots: list[int] = []
+    for index, (round_number, match_number) in enumerate(
+        zip(round_numbers, match_numbers)
+    ):
+        if round_number == num_rounds or index == third_place_index:
+            parents.append(-1)
+            parent_slots.append(0)
+            continue
+        parents.append(round_offsets[round_number] + (match_number - 1) // 2)
+        parent_slots.append((match_number - 1) % 2)
+
+    return BracketTopology(
+        bracket_size=bracket_size,
+        third_place_match=has_third_place,
+        slots=tuple(slots),
+        round_offsets=tuple(round_offsets),
+        round_numbers=tuple(round_numbers),
+        match_numbers=tuple(match_numbers),
+        parents=tuple(parents),
+        parent_slots=tuple(parent_slots),
+        third_place_index=third_place_index,
+    )
@@ -0,0 +1,21 @@
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db.base import Base
+
+
+class OutboxMessage(Base):
+    """A task message written with the transaction that caused it.
+
+    The outbox relay sends each row to taskiq after that transaction commits
+    and deletes it, so no message is lost and none is sent for work that was
+    rolled back.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    task_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    kwargs: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -0,0 +1,38 @@
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.outbox.model import OutboxMessage
+
+
+class OutboxRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    def add(self, task_name: str, kwargs: dict[str, Any]) -> OutboxMessage:
+        """Add a message to the current transaction. Does not flush."""
+        message = OutboxMessage(task_name=task_name, kwargs=kwargs)
+        self.session.add(message)
+        return message
+
+    async def lock_batch(self, limit: int) -> list[OutboxMessage]:
+        """
+        Lock the oldest ``limit`` messages no other relay has locked.
+
+        ``SKIP LOCKED`` lets several relays drain the outbox side by side, each
+        taking a different batch.
+        """
+        result = await self.session.execute(
+            select(OutboxMessage)
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def delete(self, message_ids: list[int]) -> None:
+        """Delete relayed messages. Does not commit."""
+        await self.session.execute(
+            delete(OutboxMessage).where(OutboxMessage.id.in_(message_ids))
+        )
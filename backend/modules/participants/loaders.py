@@ -0,0 +1,9 @@
+from sqlalchemy.orm import selectinload
+
+from core.db.loading import LoaderProfiles
+from modules.participants.model import AnnouncementParticipant
+
+PARTICIPANT_LOADERS = LoaderProfiles(
+    list=(selectinload(AnnouncementParticipant.user),),
+    detail=(selectinload(AnnouncementParticipant.user),),
+)
@@ -6,6 +6,7 @@ from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from core.db.base import Base
+from core.db.loading import RELATIONSHIP_LAZY
 from exceptions import ValidationException
 
 if TYPE_CHECKING:
@@ -57,7 +58,7 @@ class AnnouncementParticipant(Base):
         "User",
         back_populates="participation_records",
         passive_deletes=True,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
     @validates("seed", "qualification_rank", "qualification_score", "placement")
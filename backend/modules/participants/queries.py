@@ -1,7 +1,7 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from modules.participants.loaders import PARTICIPANT_LOADERS
 from modules.participants.model import AnnouncementParticipant
 
 
@@ -24,7 +24,7 @@ class ParticipantQueries:
 
         data_result = await self.session.execute(
             select(AnnouncementParticipant)
-            .options(selectinload(AnnouncementParticipant.user))
+            .options(*PARTICIPANT_LOADERS.options("list"))
             .where(AnnouncementParticipant.announcement_id == announcement_id)
             .order_by(
                 AnnouncementParticipant.qualification_score.desc().nulls_last(),
@@ -1,7 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete, select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, select
+from sqlalchemy.orm.util import identity_key
 
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.db.loading import refresh_columns
+from modules.announcements.model import Announcement
+from modules.participants.loaders import PARTICIPANT_LOADERS
 from modules.participants.model import AnnouncementParticipant
 
 
@@ -27,7 +31,7 @@ class ParticipantRepository:
         """Find a participant by their ID scoped to a specific announcement."""
         result = await self.session.execute(
             select(AnnouncementParticipant)
-            .options(selectinload(AnnouncementParticipant.user))
+            .options(*PARTICIPANT_LOADERS.options("detail"))
             .where(
                 AnnouncementParticipant.id == participant_id,
                 AnnouncementParticipant.announcement_id == announcement_id,
@@ -35,15 +39,6 @@ class ParticipantRepository:
         )
         return result.scalar_one_or_none()
 
-    async def count_by_announcement_id(self, announcement_id: int) -> int:
-        """Return the current number of participants for an announcement."""
-        result = await self.session.execute(
-            select(func.count())
-            .select_from(AnnouncementParticipant)
-            .where(AnnouncementParticipant.announcement_id == announcement_id)
-        )
-        return result.scalar_one()
-
     async def delete_by_announcement_and_user(
         self, announcement_id: int, user_id: int
     ) -> None:
@@ -55,6 +50,8 @@ class ParticipantRepository:
             )
         )
         await self.session.flush()
+        await self._refresh_participants_count(announcement_id)
+        mark_stale(self.session, ANNOUNCEMENT, announcement_id)
 
     async def delete_by_announcement_id(self, announcement_id: int) -> None:
         """Delete all participants for an announcement. Flushes but does not commit."""
@@ -64,6 +61,8 @@ class ParticipantRepository:
             )
         )
         await self.session.flush()
+        await self._refresh_participants_count(announcement_id)
+        mark_stale(self.session, ANNOUNCEMENT, announcement_id)
 
     async def delete_by_announcement_and_user_ids(
         self,
@@ -81,12 +80,31 @@ class ParticipantRepository:
             )
         )
         await self.session.flush()
+        await self._refresh_participants_count(announcement_id)
+        mark_stale(self.session, ANNOUNCEMENT, announcement_id)
 
     async def save(
         self, participant: AnnouncementParticipant
     ) -> AnnouncementParticipant:
         """Persist a participant record. Flushes but does not commit."""
+        created = participant.id is None
         self.session.add(participant)
         await self.session.flush()
-        await self.session.refresh(participant)
+        await refresh_columns(self.session, participant)
+        if created:
+            await self._refresh_participants_count(participant.announcement_id)
+        mark_stale(self.session, ANNOUNCEMENT, participant.announcement_id)
         return participant
+
+    async def _refresh_participants_count(self, announcement_id: int) -> None:
+        """
+        Reload participants_count of the announcement if it is in the session.
+
+        The counter is updated by a database trigger, so an announcement
+        loaded before the write would otherwise keep serving the old value.
+        """
+        announcement = self.session.identity_map.get(
+            identity_key(Announcement, announcement_id)
+        )
+        if announcement is not None:
+            await self.session.refresh(announcement, ["participants_count"])
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import selectinload
+
+from core.db.loading import LoaderProfiles
+from modules.announcements.model import Announcement
+from modules.registration.models import FormFieldResponse, RegistrationRequest
+
+_RESPONSE_OPTIONS = (
+    selectinload(RegistrationRequest.announcement).selectinload(Announcement.game),
+    selectinload(RegistrationRequest.user),
+    selectinload(RegistrationRequest.form_responses).selectinload(
+        FormFieldResponse.form_field
+    ),
+)
+"""Relationships rendered by ``RegistrationRequestResponse`` and read by its policy."""
+
+REGISTRATION_REQUEST_LOADERS = LoaderProfiles(
+    list=_RESPONSE_OPTIONS,
+    detail=_RESPONSE_OPTIONS,
+)
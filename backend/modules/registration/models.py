@@ -7,6 +7,7 @@ from sqlalchemy import Boolean, Enum, ForeignKey, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 
 from core.db.base import Base
+from core.db.loading import RELATIONSHIP_LAZY
 from enums import FormFieldType
 from enums.registration_status import RegistrationStatus
 
@@ -32,7 +33,7 @@ class RegistrationForm(Base):
         back_populates="form",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -103,7 +104,10 @@ class FormFieldResponse(Base):
         "RegistrationRequest", back_populates="form_responses", passive_deletes=True
     )
     form_field: Mapped["FormField"] = relationship(
-        "FormField", back_populates="responses", passive_deletes=True, lazy="selectin"
+        "FormField",
+        back_populates="responses",
+        passive_deletes=True,
+        lazy=RELATIONSHIP_LAZY,
     )
 
 
@@ -136,5 +140,5 @@ class RegistrationRequest(Base):
         back_populates="registration_request",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin",
+        lazy=RELATIONSHIP_LAZY,
     )
@@ -1,19 +1,9 @@
 from core.permissions.base_policy import BasePolicy
+from core.permissions.rules import ADMIN, Owner, allow_if
 
 
 class RegistrationRequestPolicy(BasePolicy):
-    def can_view(self) -> bool:
-        return (
-            self.is_admin
-            or self.user.id == self.record.user_id
-            or self.user.id == self.record.announcement.organizer_id
-        )
-
-    def can_approve(self) -> bool:
-        return self.is_admin or self.user.id == self.record.announcement.organizer_id
-
-    def can_reject(self) -> bool:
-        return self.is_admin or self.user.id == self.record.announcement.organizer_id
-
-    def can_cancel(self) -> bool:
-        return self.is_admin or self.user.id == self.record.user_id
+    can_view = allow_if(ADMIN | Owner("user_id") | Owner("announcement.organizer_id"))
+    can_approve = allow_if(ADMIN | Owner("announcement.organizer_id"))
+    can_reject = allow_if(ADMIN | Owner("announcement.organizer_id"))
+    can_cancel = allow_if(ADMIN | Owner("user_id"))
@@ -1,7 +1,8 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from core.db.loading import LoaderProfile
+from modules.registration.loaders import REGISTRATION_REQUEST_LOADERS
 from modules.registration.models import RegistrationRequest
 
 
@@ -12,15 +13,12 @@ class RegistrationRequestQueries:
         self.session = session
 
     async def find_by_id(
-        self, registration_request_id: int
+        self, registration_request_id: int, profile: LoaderProfile = "detail"
     ) -> RegistrationRequest | None:
-        """Fetch a registration request with announcement and user loaded."""
+        """Fetch a registration request with the relationships of ``profile`` loaded."""
         result = await self.session.execute(
             select(RegistrationRequest)
-            .options(
-                selectinload(RegistrationRequest.announcement),
-                selectinload(RegistrationRequest.user),
-            )
+            .options(*REGISTRATION_REQUEST_LOADERS.options(profile))
             .where(RegistrationRequest.id == registration_request_id)
         )
         return result.scalar_one_or_none()
@@ -28,7 +26,7 @@ class RegistrationRequestQueries:
     async def find_all_by_user_id(
         self, user_id: int, skip: int = 0, limit: int = 10
     ) -> tuple[list[RegistrationRequest], int]:
-        """Get paginated registration requests for a user with announcement loaded."""
+        """Get paginated registration requests for a user."""
         count_result = await self.session.execute(
             select(func.count())
             .select_from(RegistrationRequest)
@@ -38,10 +36,7 @@ class RegistrationRequestQueries:
 
         data_result = await self.session.execute(
             select(RegistrationRequest)
-            .options(
-                selectinload(RegistrationRequest.announcement),
-                selectinload(RegistrationRequest.user),
-            )
+            .options(*REGISTRATION_REQUEST_LOADERS.options("list"))
             .where(RegistrationRequest.user_id == user_id)
             .offset(skip)
             .limit(limit)
@@ -62,10 +57,7 @@ class RegistrationRequestQueries:
 
         data_result = await self.session.execute(
             select(RegistrationRequest)
-            .options(
-                selectinload(RegistrationRequest.announcement),
-                selectinload(RegistrationRequest.user),
-            )
+            .options(*REGISTRATION_REQUEST_LOADERS.options("list"))
             .where(RegistrationRequest.announcement_id == announcement_id)
             .offset(skip)
             .limit(limit)
@@ -1,9 +1,9 @@
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from core.search.base_search import BaseSearch
 from modules.announcements.model import Announcement
+from modules.registration.loaders import REGISTRATION_REQUEST_LOADERS
 from modules.registration.models import RegistrationRequest
 from modules.registration.schemas import RegistrationRequestFilter
 from modules.users.model import User
@@ -32,17 +32,16 @@ class RegistrationRequestSearch(BaseSearch):
     def base_query(self):
         query = (
             select(self.model)
-            .options(
-                selectinload(RegistrationRequest.announcement),
-                selectinload(RegistrationRequest.user),
-            )
+            .options(*REGISTRATION_REQUEST_LOADERS.options("list"))
             .where(self._scope_condition())
         )
         return self.apply_filters(query).order_by(desc(RegistrationRequest.created_at))
 
-    async def total_count(self) -> int:
-        """Return total count within scope, ignoring active filters."""
-        scoped_subquery = select(self.model).where(self._scope_condition()).subquery()
-        count_query = select(func.count()).select_from(scoped_subquery)
-        result = await self.session.execute(count_query)
-        return result.scalar_one()
+    def total_count_cache_key(self):
+        return (self.model.__tablename__, type(self.scope).__name__, self.scope.id)
+
+    def _total_count_query(self):
+        """Count within scope, ignoring active filters."""
+        return (
+            select(func.count()).select_from(self.model).where(self._scope_condition())
+        )
@@ -0,0 +1,58 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UserDatabase(SQLAlchemyUserDatabase):
+    """
+    ``SQLAlchemyUserDatabase`` whose writes can share one transaction.
+
+    Inside ``unit_of_work`` ``create`` and ``update`` only flush, and the block
+    commits once when it ends, so rows that user manager hooks add, such as
+    outbox messages, commit atomically with the user. Outside it they commit
+    right away, as fastapi-users expects.
+    """
+
+    def __init__(self, session: AsyncSession, user_table: type) -> None:
+        super().__init__(session, user_table)
+        self._in_unit_of_work = False
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """Commit every write of the block together; nested blocks join the outer one."""
+        if self._in_unit_of_work:
+            yield
+            return
+
+        self._in_unit_of_work = True
+        try:
+            yield
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self._in_unit_of_work = False
+
+    async def create(self, create_dict: dict[str, Any]):
+        if not self._in_unit_of_work:
+            return await super().create(create_dict)
+
+        user = self.user_table(**create_dict)
+        self.session.add(user)
+        await self.session.flush()
+        await self.session.refresh(user)
+        return user
+
+    async def update(self, user, update_dict: dict[str, Any]):
+        if not self._in_unit_of_work:
+            return await super().update(user, update_dict)
+
+        for key, value in update_dict.items():
+            setattr(user, key, value)
+        self.session.add(user)
+        await self.session.flush()
+        await self.session.refresh(user)
+        return user
@@ -1,10 +1,12 @@
 from core.db.base import Base
 from typing import TYPE_CHECKING
-from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable, SQLAlchemyUserDatabase
+from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import Integer, String
 from sqlalchemy.ext.associationproxy import association_proxy, AssociationProxy
 
+from modules.users.database import UserDatabase
+
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from modules.announcements.model import Announcement
@@ -41,4 +43,4 @@ class User(Base, SQLAlchemyBaseUserTable[int]):
 
     @classmethod
     def get_db(cls, session: "AsyncSession"):
-        return SQLAlchemyUserDatabase(session, cls)
+        return UserDatabase(session, cls)
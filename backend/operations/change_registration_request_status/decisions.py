@@ -64,6 +64,8 @@ class ChangeRegistrationRequestStatusDecisions:
                 and self._trigger
                 in {RegistrationTrigger.CANCEL, RegistrationTrigger.SYSTEM_REJECT}
             ),
+            notify_user=self._trigger
+            in {RegistrationTrigger.APPROVE, RegistrationTrigger.REJECT},
         )
 
     def _new_status(self, status: RegistrationStatus) -> RegistrationStatus:
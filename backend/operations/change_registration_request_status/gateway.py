@@ -1,5 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.outbox import REGISTRATION_STATUS_EMAIL_TASK, add_to_outbox
 from exceptions import AppException, ValidationException
 from modules.announcements.repository import AnnouncementRepository
 from modules.participants.model import AnnouncementParticipant
@@ -31,11 +33,10 @@ class ChangeRegistrationRequestStatusGateway:
             contract.registration_request_id
         )
         self._registration_request = registration_request
-        announcement = registration_request.announcement
 
         return ChangeRegistrationRequestStatusSnapshot(
             registration_request_id=registration_request.id,
-            announcement_id=announcement.id,
+            announcement_id=registration_request.announcement_id,
             user_id=registration_request.user_id,
             status=registration_request.status,
             cancellation_reason=contract.cancellation_reason,
@@ -51,16 +52,14 @@ class ChangeRegistrationRequestStatusGateway:
         registration_request = self._registration_request
 
         if decision.check_capacity:
-            locked = await AnnouncementRepository(self._session).find_by_id_for_update(
-                decision.announcement_id
-            )
-            if not locked:
+            capacity = await AnnouncementRepository(
+                self._session
+            ).lock_participant_capacity(decision.announcement_id)
+            if capacity is None:
                 raise ValidationException("Announcement not found")
 
-            participant_count = await self._participant_repo.count_by_announcement_id(
-                decision.announcement_id
-            )
-            if participant_count >= locked.max_participants:
+            participants_count, max_participants = capacity
+            if participants_count >= max_participants:
                 raise ValidationException(
                     "Cannot approve: maximum number of participants reached"
                 )
@@ -78,7 +77,17 @@ class ChangeRegistrationRequestStatusGateway:
                 user_id=decision.user_id,
             )
 
+        if decision.notify_user:
+            add_to_outbox(
+                self._session,
+                REGISTRATION_STATUS_EMAIL_TASK,
+                registration_request_id=decision.registration_request_id,
+                status=decision.new_status.value,
+                reason=decision.cancellation_reason,
+            )
+
         await self._session.flush()
+        mark_stale(self._session, ANNOUNCEMENT, decision.announcement_id)
         return registration_request
 
     async def _create_participant_if_missing(
@@ -92,7 +101,7 @@ class ChangeRegistrationRequestStatusGateway:
         if participant:
             return
 
-        self._session.add(
+        await self._participant_repo.save(
             AnnouncementParticipant(
                 announcement_id=decision.announcement_id,
                 user_id=decision.user_id,
@@ -106,7 +115,7 @@ class ChangeRegistrationRequestStatusGateway:
     ) -> RegistrationRequest:
         registration_request = await RegistrationRequestQueries(
             self._session
-        ).find_by_id(registration_request_id)
+        ).find_by_id(registration_request_id, profile="minimal")
         if registration_request is None:
             raise AppException("Registration Request not found", status_code=404)
         return registration_request
@@ -22,3 +22,4 @@ class ChangeRegistrationRequestStatusDecision:
     check_capacity: bool
     create_participant: bool
     delete_participant: bool
+    notify_user: bool
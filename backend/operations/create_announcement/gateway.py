@@ -1,7 +1,9 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from core.cache import GAME, mark_stale
+from core.schedule import schedule_status_transitions
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
 from modules.registration.services.upsert_form import UpsertRegistrationFormService
 from operations.create_announcement.contract import CreateAnnouncementContract
@@ -38,6 +40,8 @@ class CreateAnnouncementGateway:
         )
         self._session.add(announcement)
         await self._session.flush()
+        mark_stale(self._session, GAME, announcement.game_id)
+        schedule_status_transitions(self._session, announcement)
 
         await UpsertRegistrationFormService(
             session=self._session,
@@ -47,7 +51,7 @@ class CreateAnnouncementGateway:
 
         result = await self._session.execute(
             select(Announcement)
-            .options(selectinload(Announcement.organizer))
+            .options(*ANNOUNCEMENT_LOADERS.options("detail"))
             .where(Announcement.id == announcement.id)
         )
         return result.scalar_one()
@@ -1,11 +1,10 @@
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from exceptions import AppException, ValidationException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
-from modules.registration.models import RegistrationForm
 from modules.registration.models import FormFieldResponse, RegistrationRequest
 from modules.registration.repository import RegistrationRequestRepository
 from operations.create_registration_request.contract import (
@@ -100,11 +99,7 @@ class CreateRegistrationRequestGateway:
     async def _load_announcement(self, announcement_id: int) -> Announcement:
         result = await self._session.execute(
             select(Announcement)
-            .options(
-                selectinload(Announcement.registration_form).selectinload(
-                    RegistrationForm.fields
-                )
-            )
+            .options(*ANNOUNCEMENT_LOADERS.options("write"))
             .where(Announcement.id == announcement_id)
         )
         announcement = result.scalar_one_or_none()
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ExpireRegistrationRequestsContract(BaseModel):
+    """Contract for expiring one chunk of requests whose registration has closed."""
+
+    registration_closed_before: datetime
+    chunk_size: int = Field(default=1000, gt=0)
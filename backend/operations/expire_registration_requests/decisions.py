@@ -0,0 +1,33 @@
+from enums.registration_trigger import RegistrationTrigger
+from operations.change_registration_request_status.decisions import TRANSITIONS
+from operations.expire_registration_requests.contract import (
+    ExpireRegistrationRequestsContract,
+)
+from operations.expire_registration_requests.structures import (
+    ExpireRegistrationRequestsDecision,
+)
+
+
+class ExpireRegistrationRequestsDecisions:
+    """
+    Business rules for expiring registration requests in bulk.
+
+    The status changes are the ``EXPIRE`` entries of the single-request
+    ``TRANSITIONS`` table, so both paths always agree. Expiry only applies to
+    requests that were never approved, so it has no participant side effects
+    and the whole chunk can be changed with one statement.
+    """
+
+    def make(
+        self,
+        contract: ExpireRegistrationRequestsContract,
+    ) -> ExpireRegistrationRequestsDecision:
+        return ExpireRegistrationRequestsDecision(
+            new_status_by_status={
+                status: new_status
+                for (status, trigger), new_status in TRANSITIONS.items()
+                if trigger == RegistrationTrigger.EXPIRE
+            },
+            registration_closed_before=contract.registration_closed_before,
+            limit=contract.chunk_size,
+        )
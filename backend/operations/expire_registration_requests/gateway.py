@@ -0,0 +1,71 @@
+from sqlalchemy import case, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import ANNOUNCEMENT, mark_stale
+from modules.announcements.model import Announcement
+from modules.registration.models import RegistrationRequest
+from operations.expire_registration_requests.structures import (
+    ExpireRegistrationRequestsDecision,
+    ExpiredRegistrationRequest,
+)
+
+
+class ExpireRegistrationRequestsGateway:
+    """
+    Applies bulk expiry decisions with a single ``UPDATE ... RETURNING``.
+
+    The rows of a chunk are picked with ``FOR UPDATE SKIP LOCKED``, so requests
+    an organizer is changing at the same moment are left for the next run
+    instead of blocking it. Cache invalidation is recorded once per affected
+    announcement rather than once per request.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def apply(
+        self,
+        decision: ExpireRegistrationRequestsDecision,
+    ) -> list[ExpiredRegistrationRequest]:
+        chunk = (
+            select(RegistrationRequest.id)
+            .join(Announcement)
+            .where(
+                RegistrationRequest.status.in_(list(decision.new_status_by_status)),
+                Announcement.registration_end_at < decision.registration_closed_before,
+            )
+            .order_by(RegistrationRequest.id)
+            .limit(decision.limit)
+            .with_for_update(of=RegistrationRequest, skip_locked=True)
+        )
+        result = await self._session.execute(
+            update(RegistrationRequest)
+            .where(RegistrationRequest.id.in_(chunk.scalar_subquery()))
+            .values(status=self._new_status(decision))
+            .returning(RegistrationRequest.id, RegistrationRequest.announcement_id)
+        )
+        expired = [
+            ExpiredRegistrationRequest(
+                registration_request_id=registration_request_id,
+                announcement_id=announcement_id,
+            )
+            for registration_request_id, announcement_id in result.all()
+        ]
+
+        for announcement_id in {request.announcement_id for request in expired}:
+            mark_stale(self._session, ANNOUNCEMENT, announcement_id)
+        return expired
+
+    @staticmethod
+    def _new_status(decision: ExpireRegistrationRequestsDecision):
+        status_type = RegistrationRequest.status.type
+        targets = set(decision.new_status_by_status.values())
+        if len(targets) == 1:
+            return literal(targets.pop(), status_type)
+        return case(
+            {
+                status: literal(new_status, status_type)
+                for status, new_status in decision.new_status_by_status.items()
+            },
+            value=RegistrationRequest.status,
+        )
@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from operations.expire_registration_requests.contract import (
+    ExpireRegistrationRequestsContract,
+)
+from operations.expire_registration_requests.decisions import (
+    ExpireRegistrationRequestsDecisions,
+)
+from operations.expire_registration_requests.gateway import (
+    ExpireRegistrationRequestsGateway,
+)
+from operations.expire_registration_requests.structures import (
+    ExpiredRegistrationRequest,
+)
+
+
+class ExpireRegistrationRequestsScenario:
+    """Orchestrates expiring one chunk of registration requests."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._gateway = ExpireRegistrationRequestsGateway(session)
+        self._decisions = ExpireRegistrationRequestsDecisions()
+
+    async def run(
+        self,
+        contract: ExpireRegistrationRequestsContract,
+    ) -> list[ExpiredRegistrationRequest]:
+        decision = self._decisions.make(contract)
+        return await self._gateway.apply(decision)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from enums.registration_status import RegistrationStatus
+
+
+@dataclass(frozen=True)
+class ExpireRegistrationRequestsDecision:
+    new_status_by_status: dict[RegistrationStatus, RegistrationStatus]
+    registration_closed_before: datetime
+    limit: int
+
+
+@dataclass(frozen=True)
+class ExpiredRegistrationRequest:
+    registration_request_id: int
+    announcement_id: int
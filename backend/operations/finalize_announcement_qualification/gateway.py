@@ -4,6 +4,7 @@ from sqlalchemy.orm import selectinload
 
 from enums import AnnouncementStatus
 from exceptions import AppException, ValidationException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
 from modules.announcements.services.lifecycle import AnnouncementLifecycleService
 from operations.finalize_announcement_qualification.contract import (
@@ -73,7 +74,10 @@ class FinalizeAnnouncementQualificationGateway:
     async def _load_announcement(self, announcement_id: int) -> Announcement:
         result = await self._session.execute(
             select(Announcement)
-            .options(selectinload(Announcement.participants))
+            .options(
+                *ANNOUNCEMENT_LOADERS.options("write"),
+                selectinload(Announcement.participants),
+            )
             .where(Announcement.id == announcement_id)
         )
         announcement = result.scalar_one_or_none()
@@ -1,9 +1,7 @@
 from enums import AnnouncementStatus
 from exceptions import ValidationException
-from modules.announcements.utils.bracket import (
-    compute_bracket_size,
-    compute_bracket_slots,
-)
+from modules.announcements.utils.bracket import compute_bracket_size
+from modules.matches.topology import get_bracket_topology
 from operations.generate_announcement_bracket.structures import (
     BracketParticipantSnapshot,
     GenerateAnnouncementBracketDecision,
@@ -29,6 +27,7 @@ class GenerateAnnouncementBracketDecisions:
             )
 
         bracket_size = self._resolve_bracket_size(snapshot, eligible)
+        topology = get_bracket_topology(bracket_size, snapshot.third_place_match)
         return GenerateAnnouncementBracketDecision(
             announcement_id=snapshot.announcement_id,
             participant_seeds=[
@@ -36,7 +35,7 @@ class GenerateAnnouncementBracketDecisions:
                 for seed, participant in enumerate(eligible, start=1)
             ],
             bracket_size=bracket_size,
-            seeding_slots=compute_bracket_slots(bracket_size),
+            seeding_slots=list(topology.slots),
             third_place_match=snapshot.third_place_match,
         )
 
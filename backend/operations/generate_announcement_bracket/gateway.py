@@ -4,7 +4,9 @@ from sqlalchemy.orm import selectinload
 
 from enums import AnnouncementStatus
 from exceptions import AppException, ValidationException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
+from modules.announcements.repository import AnnouncementRepository
 from modules.announcements.services.lifecycle import AnnouncementLifecycleService
 from modules.matches.repository import MatchRepository
 from modules.matches.services.bracket_match_builder import BracketMatchBuilder
@@ -60,9 +62,9 @@ class GenerateAnnouncementBracketGateway:
         """
         Apply the bracket decision: assign seeds, create matches, and advance the lifecycle.
 
-        Match rows are flushed before the lifecycle transition so that the ORM assigns
-        their IDs — the match builder needs those IDs to wire next_match_winner_id links.
-        The lifecycle call must come after the flush for this reason.
+        The match builder inserts and links all match rows with bulk statements;
+        the flush then writes the participant seeds before the bracket version is
+        bumped and the lifecycle transition runs.
         """
         assert self._announcement is not None, "load() must be called before apply()"
         announcement = self._announcement
@@ -91,6 +93,9 @@ class GenerateAnnouncementBracketGateway:
             match_repo,
         )
         await self._session.flush()
+        await AnnouncementRepository(self._session).bump_bracket_version(
+            announcement.id
+        )
 
         lifecycle = AnnouncementLifecycleService(announcement, self._session)
         return await lifecycle.generate_bracket()
@@ -98,7 +103,10 @@ class GenerateAnnouncementBracketGateway:
     async def _load_announcement(self, announcement_id: int) -> Announcement:
         result = await self._session.execute(
             select(Announcement)
-            .options(selectinload(Announcement.participants))
+            .options(
+                *ANNOUNCEMENT_LOADERS.options("write"),
+                selectinload(Announcement.participants),
+            )
             .where(Announcement.id == announcement_id)
         )
         announcement = result.scalar_one_or_none()
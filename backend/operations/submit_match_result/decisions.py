@@ -1,5 +1,6 @@
 from exceptions import ValidationException
 from enums import MatchStatus
+from modules.matches.topology import BracketTopology, get_bracket_topology
 from operations.submit_match_result.structures import (
     MatchSlotAssignmentDecision,
     MatchSnapshot,
@@ -14,30 +15,43 @@ class SubmitMatchResultDecisions:
 
     def make(self, snapshot: SubmitMatchResultSnapshot) -> SubmitMatchResultDecision:
         self._validate(snapshot.match)
+        topology = self._topology(snapshot)
         winner_id, loser_id = self._resolve_winner_and_loser_ids(snapshot)
+        match = snapshot.match
 
         assignments = []
-        if snapshot.next_match is not None:
+        winner_target = topology.winner_target(match.round_number, match.match_number)
+        if winner_target is not None and snapshot.next_match is not None:
             assignments.append(
-                self._advance_to_next_match(
-                    snapshot.match, snapshot.next_match, winner_id
-                )
+                self._slot_assignment(snapshot.next_match, winner_target[2], winner_id)
             )
-            third_place_assignment = self._maybe_fill_third_place(
-                snapshot,
-                loser_id,
+        loser_target = topology.loser_target(match.round_number, match.match_number)
+        if loser_target is not None and snapshot.third_place_match is not None:
+            assignments.append(
+                self._slot_assignment(
+                    snapshot.third_place_match, loser_target[2], loser_id
+                )
             )
-            if third_place_assignment is not None:
-                assignments.append(third_place_assignment)
 
         return SubmitMatchResultDecision(
-            match_id=snapshot.match.id,
+            match_id=match.id,
             winner_id=winner_id,
             assignments=assignments,
-            placements=self._placement_decisions(snapshot.match, winner_id, loser_id),
+            placements=self._placement_decisions(topology, match, winner_id, loser_id),
             auto_finish_announcement=not snapshot.has_other_unfinished_non_bye_matches,
         )
 
+    @staticmethod
+    def _topology(snapshot: SubmitMatchResultSnapshot) -> BracketTopology:
+        try:
+            topology = get_bracket_topology(
+                snapshot.bracket_size, snapshot.third_place_match_enabled
+            )
+            topology.index_of(snapshot.match.round_number, snapshot.match.match_number)
+        except ValueError as e:
+            raise ValidationException(f"Match does not fit the bracket: {e}")
+        return topology
+
     @staticmethod
     def _validate(match: MatchSnapshot) -> None:
         if match.status != MatchStatus.READY:
@@ -63,35 +77,6 @@ class SubmitMatchResultDecisions:
 
         return winner_id, loser_id
 
-    def _advance_to_next_match(
-        self,
-        match: MatchSnapshot,
-        next_match: MatchSnapshot,
-        winner_id: int,
-    ) -> MatchSlotAssignmentDecision:
-        slot = "participant1" if match.match_number % 2 == 1 else "participant2"
-        return self._slot_assignment(next_match, slot, winner_id)
-
-    def _maybe_fill_third_place(
-        self,
-        snapshot: SubmitMatchResultSnapshot,
-        loser_id: int,
-    ) -> MatchSlotAssignmentDecision | None:
-        if not snapshot.third_place_match_enabled:
-            return None
-        if (
-            snapshot.next_match is None
-            or snapshot.next_match.next_match_winner_id is not None
-        ):
-            return None
-        if snapshot.third_place_match is None:
-            return None
-
-        slot = (
-            "participant1" if snapshot.match.match_number % 2 == 1 else "participant2"
-        )
-        return self._slot_assignment(snapshot.third_place_match, slot, loser_id)
-
     @staticmethod
     def _slot_assignment(
         target_match: MatchSnapshot,
@@ -113,11 +98,15 @@ class SubmitMatchResultDecisions:
 
     @staticmethod
     def _placement_decisions(
+        topology: BracketTopology,
         match: MatchSnapshot,
         winner_id: int,
         loser_id: int,
     ) -> list[PlacementDecision]:
-        is_final = match.next_match_winner_id is None and not match.is_third_place
+        is_final = (
+            topology.is_final(match.round_number, match.match_number)
+            and not match.is_third_place
+        )
 
         if not is_final and not match.is_third_place:
             return []
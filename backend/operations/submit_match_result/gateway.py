@@ -1,22 +1,62 @@
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from enums import MatchStatus
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.live import bracket_channel, publish_on_commit
+from enums import AnnouncementStatus, MatchStatus
 from exceptions import AppException, ValidationException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
+from modules.announcements.repository import AnnouncementRepository
 from modules.announcements.services.lifecycle import AnnouncementLifecycleService
+from modules.matches.loaders import MATCH_LOADERS
 from modules.matches.model import Match
+from modules.matches.schemas import MatchResponse
+from modules.matches.topology import get_bracket_topology
+from modules.participants.loaders import PARTICIPANT_LOADERS
 from modules.participants.model import AnnouncementParticipant
 from operations.submit_match_result.contract import SubmitMatchResultContract
 from operations.submit_match_result.structures import (
     MatchSnapshot,
+    PlacementDecision,
     SubmitMatchResultDecision,
     SubmitMatchResultSnapshot,
 )
 
 
+def bracket_delta(
+    matches: Iterable[Match],
+    placements: Iterable[PlacementDecision],
+    version: int,
+    announcement_status: str,
+) -> dict:
+    """
+    Describe applied result decisions as one live bracket delta.
+
+    Each changed match is sent whole in the snapshot's ``MatchResponse`` shape,
+    so clients replace the match with the same id; ``matches`` must have their
+    participants loaded.
+    """
+    return {
+        "version": version,
+        "matches": [
+            MatchResponse.model_validate(match).model_dump(mode="json")
+            for match in matches
+        ],
+        "placements": [
+            {
+                "participant_id": placement.participant_id,
+                "placement": placement.placement,
+            }
+            for placement in placements
+        ],
+        "announcement_status": AnnouncementStatus(announcement_status).value,
+    }
+
+
 class SubmitMatchResultGateway:
     """Translates between ORM state and match result operation data."""
 
@@ -24,28 +64,30 @@ class SubmitMatchResultGateway:
         self._session = session
         self._match: Match | None = None
         self._announcement: Announcement | None = None
+        self._related_matches: dict[int, Match] | None = None
 
     async def load(
         self, contract: SubmitMatchResultContract
     ) -> SubmitMatchResultSnapshot:
         match = await self._load_match(contract.match_id)
         announcement = await self._load_announcement(match.announcement_id)
+        if announcement.bracket_size is None:
+            raise ValidationException("Bracket has not been generated yet")
         self._match = match
         self._announcement = announcement
-        next_match = (
-            await self._load_match(match.next_match_winner_id)
-            if match.next_match_winner_id is not None
-            else None
-        )
-        third_place_match = (
-            await self._load_third_place_match(announcement.id)
-            if announcement.third_place_match
-            else None
+        next_match, third_place_match = await self._load_related_matches(
+            announcement, match
         )
+        self._related_matches = {
+            related.id: related
+            for related in (next_match, third_place_match)
+            if related is not None
+        }
 
         return SubmitMatchResultSnapshot(
             match=self._snapshot_match(match),
             announcement_id=announcement.id,
+            bracket_size=announcement.bracket_size,
             third_place_match_enabled=announcement.third_place_match,
             selected_winner_slot=contract.winner,
             next_match=self._snapshot_match(next_match) if next_match else None,
@@ -60,7 +102,9 @@ class SubmitMatchResultGateway:
 
     async def apply(self, decision: SubmitMatchResultDecision) -> Match:
         assert (
-            self._match is not None and self._announcement is not None
+            self._match is not None
+            and self._announcement is not None
+            and self._related_matches is not None
         ), "load() must be called before apply()"
         match = self._match
         announcement = self._announcement
@@ -69,19 +113,28 @@ class SubmitMatchResultGateway:
         match.status = MatchStatus.COMPLETED
         match.completed_at = datetime.now(timezone.utc)
 
+        participants = {
+            participant.id: participant
+            for participant in (match.participant1, match.participant2)
+            if participant is not None
+        }
+        changed_matches = {match.id: match}
         for assignment in decision.assignments:
-            target_match = await self._load_match(assignment.match_id)
+            target_match = self._related_matches[assignment.match_id]
+            participant = participants[assignment.participant_id]
             if assignment.slot == "participant1":
-                target_match.participant1_id = assignment.participant_id
+                target_match.participant1 = participant
             else:
-                target_match.participant2_id = assignment.participant_id
+                target_match.participant2 = participant
             if assignment.mark_ready:
                 target_match.status = MatchStatus.READY
+            changed_matches[target_match.id] = target_match
 
         for placement in decision.placements:
             participant = await self._session.get(
                 AnnouncementParticipant,
                 placement.participant_id,
+                options=PARTICIPANT_LOADERS.options("minimal"),
             )
             if participant is None:
                 raise ValidationException(
@@ -96,42 +149,95 @@ class SubmitMatchResultGateway:
             ).auto_finish()
 
         await self._session.flush()
+        version = await AnnouncementRepository(self._session).bump_bracket_version(
+            announcement.id
+        )
+        mark_stale(self._session, ANNOUNCEMENT, announcement.id)
+        publish_on_commit(
+            self._session,
+            bracket_channel(announcement.id),
+            bracket_delta(
+                changed_matches.values(),
+                decision.placements,
+                version,
+                announcement.status,
+            ),
+        )
         return match
 
     @staticmethod
     def _snapshot_match(match: Match) -> MatchSnapshot:
         return MatchSnapshot(
             id=match.id,
+            round_number=match.round_number,
             match_number=match.match_number,
             status=MatchStatus(match.status),
             participant1_id=match.participant1_id,
             participant2_id=match.participant2_id,
-            next_match_winner_id=match.next_match_winner_id,
             is_bye=match.is_bye,
             is_third_place=match.is_third_place,
         )
 
     async def _load_match(self, match_id: int) -> Match:
-        result = await self._session.execute(select(Match).where(Match.id == match_id))
+        result = await self._session.execute(
+            select(Match)
+            .options(*MATCH_LOADERS.options("write"))
+            .where(Match.id == match_id)
+        )
         match = result.scalar_one_or_none()
         if match is None:
             raise AppException("Match not found", status_code=404)
         return match
 
     async def _load_announcement(self, announcement_id: int) -> Announcement:
-        announcement = await self._session.get(Announcement, announcement_id)
+        announcement = await self._session.get(
+            Announcement,
+            announcement_id,
+            options=ANNOUNCEMENT_LOADERS.options("minimal"),
+        )
         if announcement is None:
             raise AppException("Announcement not found", status_code=404)
         return announcement
 
-    async def _load_third_place_match(self, announcement_id: int) -> Match | None:
+    async def _load_related_matches(
+        self, announcement: Announcement, match: Match
+    ) -> tuple[Match | None, Match | None]:
+        """
+        Load the matches the winner and loser of ``match`` move into.
+
+        Their positions come from the bracket topology, so both are fetched in
+        one query without following next_match_winner_id first.
+        """
+        try:
+            topology = get_bracket_topology(
+                announcement.bracket_size, announcement.third_place_match
+            )
+            winner_target = topology.winner_target(
+                match.round_number, match.match_number
+            )
+            loser_target = topology.loser_target(match.round_number, match.match_number)
+        except ValueError:
+            return None, None
+
+        winner_position = winner_target[:2] if winner_target is not None else None
+        loser_position = loser_target[:2] if loser_target is not None else None
+        positions = [p for p in (winner_position, loser_position) if p is not None]
+        if not positions:
+            return None, None
+
         result = await self._session.execute(
-            select(Match).where(
-                Match.announcement_id == announcement_id,
-                Match.is_third_place.is_(True),
+            select(Match)
+            .options(*MATCH_LOADERS.options("write"))
+            .where(
+                Match.announcement_id == announcement.id,
+                tuple_(Match.round_number, Match.match_number).in_(positions),
             )
         )
-        return result.scalar_one_or_none()
+        by_position = {
+            (related.round_number, related.match_number): related
+            for related in result.scalars()
+        }
+        return by_position.get(winner_position), by_position.get(loser_position)
 
     async def _has_other_unfinished_non_bye_matches(
         self,
@@ -1,19 +1,17 @@
 from dataclasses import dataclass
-from typing import Literal
 
 from enums import MatchStatus
-
-MatchSlot = Literal["participant1", "participant2"]
+from modules.matches.topology import MatchSlot
 
 
 @dataclass(frozen=True)
 class MatchSnapshot:
     id: int
+    round_number: int
     match_number: int
     status: MatchStatus
     participant1_id: int | None
     participant2_id: int | None
-    next_match_winner_id: int | None
     is_bye: bool
     is_third_place: bool
 
@@ -22,6 +20,7 @@ class MatchSnapshot:
 class SubmitMatchResultSnapshot:
     match: MatchSnapshot
     announcement_id: int
+    bracket_size: int
     third_place_match_enabled: bool
     selected_winner_slot: MatchSlot
     next_match: MatchSnapshot | None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+from modules.matches.schemas import MatchResultsBatchUpdate
+
+
+class SubmitMatchResultsContract(BaseModel):
+    """Contract for submitting several match results of one announcement."""
+
+    announcement_id: int
+    results_in: MatchResultsBatchUpdate
@@ -0,0 +1,145 @@
+from dataclasses import replace
+
+from enums import MatchStatus
+from exceptions import ValidationException
+from modules.matches.topology import BracketTopology, get_bracket_topology
+from operations.submit_match_result.decisions import SubmitMatchResultDecisions
+from operations.submit_match_result.structures import (
+    MatchSnapshot,
+    SubmitMatchResultDecision,
+    SubmitMatchResultSnapshot,
+)
+from operations.submit_match_results.structures import (
+    MatchResultSelection,
+    SubmitMatchResultsDecision,
+    SubmitMatchResultsSnapshot,
+)
+
+
+class SubmitMatchResultsDecisions:
+    """
+    Business rules for reporting several match results at once.
+
+    Results are decided in bracket order (round, then match number) against an
+    in-memory copy of the announcement's matches, so a result may depend on
+    another result of the same batch, e.g. a final whose participants come
+    from two semifinals submitted alongside it. Every result follows the same
+    rules as a single submission; any invalid result rejects the whole batch.
+    """
+
+    def __init__(self) -> None:
+        self._match_decisions = SubmitMatchResultDecisions()
+
+    def make(self, snapshot: SubmitMatchResultsSnapshot) -> SubmitMatchResultsDecision:
+        matches = {match.id: match for match in snapshot.matches}
+        self._validate_selections(snapshot.results, matches)
+        try:
+            topology = get_bracket_topology(
+                snapshot.bracket_size, snapshot.third_place_match_enabled
+            )
+        except ValueError as e:
+            raise ValidationException(str(e))
+
+        match_id_by_position = {
+            (match.round_number, match.match_number): match.id
+            for match in snapshot.matches
+        }
+        unfinished_count = sum(
+            1
+            for match in snapshot.matches
+            if not match.is_bye and match.status != MatchStatus.COMPLETED
+        )
+
+        decisions = []
+        for selection in sorted(
+            snapshot.results,
+            key=lambda s: (
+                matches[s.match_id].round_number,
+                matches[s.match_id].match_number,
+            ),
+        ):
+            match = matches[selection.match_id]
+            winner_target, loser_target = self._targets(topology, match)
+            match_snapshot = SubmitMatchResultSnapshot(
+                match=match,
+                announcement_id=snapshot.announcement_id,
+                bracket_size=snapshot.bracket_size,
+                third_place_match_enabled=snapshot.third_place_match_enabled,
+                selected_winner_slot=selection.selected_winner_slot,
+                next_match=self._match_at(winner_target, matches, match_id_by_position),
+                third_place_match=self._match_at(
+                    loser_target, matches, match_id_by_position
+                ),
+                has_other_unfinished_non_bye_matches=unfinished_count > 1,
+            )
+            try:
+                decision = self._match_decisions.make(match_snapshot)
+            except ValidationException as e:
+                raise ValidationException(f"Match {match.id}: {e.message}")
+
+            self._apply_in_memory(matches, decision)
+            unfinished_count -= 1
+            decisions.append(decision)
+
+        return SubmitMatchResultsDecision(
+            results=decisions,
+            auto_finish_announcement=decisions[-1].auto_finish_announcement,
+        )
+
+    @staticmethod
+    def _validate_selections(
+        selections: list[MatchResultSelection],
+        matches: dict[int, MatchSnapshot],
+    ) -> None:
+        if not selections:
+            raise ValidationException("At least one match result is required")
+        seen: set[int] = set()
+        for selection in selections:
+            if selection.match_id not in matches:
+                raise ValidationException(
+                    f"Match {selection.match_id} does not belong to this announcement"
+                )
+            if selection.match_id in seen:
+                raise ValidationException(
+                    f"Match {selection.match_id} is submitted more than once"
+                )
+            seen.add(selection.match_id)
+
+    @staticmethod
+    def _targets(
+        topology: BracketTopology, match: MatchSnapshot
+    ) -> tuple[tuple[int, int, str] | None, tuple[int, int, str] | None]:
+        """Positions the winner and loser move to; none for misplaced matches."""
+        try:
+            return (
+                topology.winner_target(match.round_number, match.match_number),
+                topology.loser_target(match.round_number, match.match_number),
+            )
+        except ValueError:
+            return None, None
+
+    @staticmethod
+    def _match_at(
+        target: tuple[int, int, str] | None,
+        matches: dict[int, MatchSnapshot],
+        match_id_by_position: dict[tuple[int, int], int],
+    ) -> MatchSnapshot | None:
+        if target is None:
+            return None
+        match_id = match_id_by_position.get((target[0], target[1]))
+        return matches[match_id] if match_id is not None else None
+
+    @staticmethod
+    def _apply_in_memory(
+        matches: dict[int, MatchSnapshot],
+        decision: SubmitMatchResultDecision,
+    ) -> None:
+        matches[decision.match_id] = replace(
+            matches[decision.match_id], status=MatchStatus.COMPLETED
+        )
+        for assignment in decision.assignments:
+            target = matches[assignment.match_id]
+            changes = {f"{assignment.slot}_id": assignment.participant_id}
+            if assignment.mark_ready:
+                changes["status"] = MatchStatus.READY
+            matches[assignment.match_id] = replace(target, **changes)
@@ -0,0 +1,170 @@
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.live import bracket_channel, publish_on_commit
+from enums import MatchStatus
+from exceptions import AppException, ValidationException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
+from modules.announcements.model import Announcement
+from modules.announcements.repository import AnnouncementRepository
+from modules.announcements.services.lifecycle import AnnouncementLifecycleService
+from modules.matches.loaders import MATCH_LOADERS
+from modules.matches.model import Match
+from modules.participants.model import AnnouncementParticipant
+from operations.submit_match_result.gateway import bracket_delta
+from operations.submit_match_result.structures import MatchSnapshot
+from operations.submit_match_results.contract import SubmitMatchResultsContract
+from operations.submit_match_results.structures import (
+    MatchResultSelection,
+    SubmitMatchResultsDecision,
+    SubmitMatchResultsSnapshot,
+)
+
+
+class SubmitMatchResultsGateway:
+    """
+    Translates between ORM state and batch match result operation data.
+
+    Loads the announcement's whole match set (with participants) in one query
+    and applies every decision to those objects, so the batch is written with
+    a single flush whatever its size.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._announcement: Announcement | None = None
+        self._matches: dict[int, Match] | None = None
+
+    async def load(
+        self, contract: SubmitMatchResultsContract
+    ) -> SubmitMatchResultsSnapshot:
+        announcement = await self._load_announcement(contract.announcement_id)
+        if announcement.bracket_size is None:
+            raise ValidationException("Bracket has not been generated yet")
+        matches = await self._load_matches(announcement.id)
+        self._announcement = announcement
+        self._matches = {match.id: match for match in matches}
+
+        return SubmitMatchResultsSnapshot(
+            announcement_id=announcement.id,
+            bracket_size=announcement.bracket_size,
+            third_place_match_enabled=announcement.third_place_match,
+            matches=[self._snapshot_match(match) for match in matches],
+            results=[
+                MatchResultSelection(
+                    match_id=result.match_id, selected_winner_slot=result.winner
+                )
+                for result in contract.results_in.results
+            ],
+        )
+
+    async def apply(self, decision: SubmitMatchResultsDecision) -> list[Match]:
+        assert (
+            self._announcement is not None and self._matches is not None
+        ), "load() must be called before apply()"
+        announcement = self._announcement
+        matches = self._matches
+        participants = self._participants_by_id(matches.values())
+        completed_at = datetime.now(timezone.utc)
+        changed_matches: dict[int, Match] = {}
+
+        for result in decision.results:
+            match = matches[result.match_id]
+            changed_matches[match.id] = match
+            match.winner_id = result.winner_id
+            match.status = MatchStatus.COMPLETED
+            match.completed_at = completed_at
+
+            for assignment in result.assignments:
+                target_match = matches[assignment.match_id]
+                participant = participants[assignment.participant_id]
+                if assignment.slot == "participant1":
+                    target_match.participant1 = participant
+                else:
+                    target_match.participant2 = participant
+                if assignment.mark_ready:
+                    target_match.status = MatchStatus.READY
+                changed_matches[target_match.id] = target_match
+
+            for placement in result.placements:
+                participants[placement.participant_id].placement = placement.placement
+
+        if decision.auto_finish_announcement:
+            await AnnouncementLifecycleService(
+                announcement,
+                self._session,
+            ).auto_finish()
+
+        await self._session.flush()
+        version = await AnnouncementRepository(self._session).bump_bracket_version(
+            announcement.id
+        )
+        mark_stale(self._session, ANNOUNCEMENT, announcement.id)
+        publish_on_commit(
+            self._session,
+            bracket_channel(announcement.id),
+            bracket_delta(
+                changed_matches.values(),
+                [
+                    placement
+                    for result in decision.results
+                    for placement in result.placements
+                ],
+                version,
+                announcement.status,
+            ),
+        )
+        return [matches[result.match_id] for result in decision.results]
+
+    @staticmethod
+    def _participants_by_id(
+        matches: Iterable[Match],
+    ) -> dict[int, AnnouncementParticipant]:
+        """
+        Index the participants already loaded with the matches.
+
+        Every participant that advances or gets a placement played in one of
+        these matches, so no further lookups are needed.
+        """
+        participants = {}
+        for match in matches:
+            for participant in (match.participant1, match.participant2):
+                if participant is not None:
+                    participants[participant.id] = participant
+        return participants
+
+    @staticmethod
+    def _snapshot_match(match: Match) -> MatchSnapshot:
+        return MatchSnapshot(
+            id=match.id,
+            round_number=match.round_number,
+            match_number=match.match_number,
+            status=MatchStatus(match.status),
+            participant1_id=match.participant1_id,
+            participant2_id=match.participant2_id,
+            is_bye=match.is_bye,
+            is_third_place=match.is_third_place,
+        )
+
+    async def _load_announcement(self, announcement_id: int) -> Announcement:
+        announcement = await self._session.get(
+            Announcement,
+            announcement_id,
+            options=ANNOUNCEMENT_LOADERS.options("minimal"),
+        )
+        if announcement is None:
+            raise AppException("Announcement not found", status_code=404)
+        return announcement
+
+    async def _load_matches(self, announcement_id: int) -> list[Match]:
+        result = await self._session.execute(
+            select(Match)
+            .where(Match.announcement_id == announcement_id)
+            .options(*MATCH_LOADERS.options("write"))
+            .order_by(Match.round_number, Match.match_number)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,19 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.matches.model import Match
+from operations.submit_match_results.contract import SubmitMatchResultsContract
+from operations.submit_match_results.decisions import SubmitMatchResultsDecisions
+from operations.submit_match_results.gateway import SubmitMatchResultsGateway
+
+
+class SubmitMatchResultsScenario:
+    """Orchestrates submitting several match results in one transaction."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._gateway = SubmitMatchResultsGateway(session)
+        self._decisions = SubmitMatchResultsDecisions()
+
+    async def run(self, contract: SubmitMatchResultsContract) -> list[Match]:
+        snapshot = await self._gateway.load(contract)
+        decision = self._decisions.make(snapshot)
+        return await self._gateway.apply(decision)
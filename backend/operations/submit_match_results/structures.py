@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from operations.submit_match_result.structures import (
+    MatchSlot,
+    MatchSnapshot,
+    SubmitMatchResultDecision,
+)
+
+
+@dataclass(frozen=True)
+class MatchResultSelection:
+    match_id: int
+    selected_winner_slot: MatchSlot
+
+
+@dataclass(frozen=True)
+class SubmitMatchResultsSnapshot:
+    announcement_id: int
+    bracket_size: int
+    third_place_match_enabled: bool
+    matches: list[MatchSnapshot]
+    results: list[MatchResultSelection]
+
+
+@dataclass(frozen=True)
+class SubmitMatchResultsDecision:
+    results: list[SubmitMatchResultDecision]
+    auto_finish_announcement: bool
@@ -1,10 +1,13 @@
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import set_committed_value
 
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.db.loading import refresh_columns
+from core.schedule import schedule_status_transitions
 from enums import AnnouncementStatus
 from exceptions import AppException
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
 from modules.announcements.model import Announcement
 from modules.participants.repository import ParticipantRepository
 from modules.registration.repository import RegistrationRequestRepository
@@ -61,7 +64,9 @@ class UpdateAnnouncementGateway:
             .values(**announcement_data)
         )
         await self._session.flush()
-        await self._session.refresh(announcement)
+        await refresh_columns(self._session, announcement)
+        mark_stale(self._session, ANNOUNCEMENT, announcement.id)
+        schedule_status_transitions(self._session, announcement)
 
         await UpsertRegistrationFormService(
             session=self._session,
@@ -80,7 +85,7 @@ class UpdateAnnouncementGateway:
     async def _load_announcement(self, announcement_id: int) -> Announcement:
         result = await self._session.execute(
             select(Announcement)
-            .options(selectinload(Announcement.registration_form))
+            .options(*ANNOUNCEMENT_LOADERS.options("write"))
             .where(Announcement.id == announcement_id)
         )
         announcement = result.scalar_one_or_none()
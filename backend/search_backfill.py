@@ -0,0 +1,23 @@
+"""Fill announcement full-text search vectors for rows created before the trigger."""
+
+import asyncio
+import sys
+
+from core.db.container import get_db
+from core.search.full_text import backfill_announcement_search_vectors
+
+
+async def main(batch_size: int = 1000):
+    db = get_db()
+    try:
+        total = await backfill_announcement_search_vectors(
+            db.session_factory, batch_size=batch_size
+        )
+    finally:
+        await db.dispose()
+
+    print(f"✅ Backfilled search vectors for {total} announcements")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:2])))
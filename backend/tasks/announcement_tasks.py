@@ -1,18 +1,66 @@
 from datetime import datetime, timezone
 from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.cache import ANNOUNCEMENT, mark_stale
+from core.db.commit_hooks import register_commit_hook
+from core.logger import logger
+from core.schedule import ANNOUNCEMENT_TRANSITIONS
+from core.utils import as_utc
 from modules.announcements.model import Announcement
 from enums import AnnouncementStatus
 from core.db.container import get_db
 from tasks.broker import broker
+from tasks.single_flight import ensure_lease, single_flight
+
+
+async def _apply_due_transitions(
+    session: AsyncSession, now: datetime, announcement_id: int | None = None
+) -> list[int]:
+    """
+    Open and close registration of announcements whose time has come.
+
+    Both statements only match announcements that are still in the source
+    status and past the relevant time, so running them early, late or twice
+    changes nothing. Returns the ids of the announcements that changed.
+    """
+    opened = (
+        update(Announcement)
+        .where(Announcement.status == AnnouncementStatus.PRE_REGISTRATION)
+        .where(Announcement.registration_start_at <= now)
+        .values(status=AnnouncementStatus.REGISTRATION_OPEN)
+        .returning(Announcement.id)
+    )
+    closed = (
+        update(Announcement)
+        .where(Announcement.status == AnnouncementStatus.REGISTRATION_OPEN)
+        .where(Announcement.registration_end_at <= now)
+        .values(status=AnnouncementStatus.REGISTRATION_CLOSED)
+        .returning(Announcement.id)
+    )
+    if announcement_id is not None:
+        opened = opened.where(Announcement.id == announcement_id)
+        closed = closed.where(Announcement.id == announcement_id)
+
+    changed_ids = list((await session.execute(opened)).scalars())
+    changed_ids.extend((await session.execute(closed)).scalars())
+
+    for changed_id in changed_ids:
+        mark_stale(session, ANNOUNCEMENT, changed_id)
+    return changed_ids
 
 
 @broker.task
+@single_flight()
 async def update_announcement_statuses():
     """
     Automatically update announcement statuses based on current time:
     - pre_registration → registration_open (when registration_start_at is reached)
     - registration_open → registration_closed (when registration_end_at is reached)
 
+    Transitions normally happen on time through ``transition_announcement_status``
+    jobs; this periodic run only reconciles announcements whose job was missed,
+    using the partial indexes on each source status.
+
     Moving to LIVE requires a manual organizer action (generate_bracket or
     start_qualification) via the lifecycle endpoints.
     """
@@ -20,18 +68,61 @@ async def update_announcement_statuses():
 
     db = get_db()
     async with db.session_factory() as session:
-        await session.execute(
-            update(Announcement)
-            .where(Announcement.status == AnnouncementStatus.PRE_REGISTRATION)
-            .where(Announcement.registration_start_at <= now)
-            .values(status=AnnouncementStatus.REGISTRATION_OPEN)
-        )
-
-        await session.execute(
-            update(Announcement)
-            .where(Announcement.status == AnnouncementStatus.REGISTRATION_OPEN)
-            .where(Announcement.registration_end_at <= now)
-            .values(status=AnnouncementStatus.REGISTRATION_CLOSED)
-        )
+        changed_ids = await _apply_due_transitions(session, now)
+        await ensure_lease()
+        await session.commit()
+
+    if changed_ids:
+        logger.info(f"Reconciled statuses of {len(changed_ids)} announcements")
 
+
+@broker.task
+async def transition_announcement_status(announcement_id: int):
+    """Apply the registration transitions of one announcement that are due."""
+    now = datetime.now(timezone.utc)
+
+    db = get_db()
+    async with db.session_factory() as session:
+        await _apply_due_transitions(session, now, announcement_id)
         await session.commit()
+
+
+def transition_schedule_id(announcement_id: int, status: AnnouncementStatus) -> str:
+    return f"announcement:{announcement_id}:{status.value}"
+
+
+async def _schedule_transitions(
+    items: list[tuple[int, datetime, datetime]],
+) -> None:
+    from tasks.scheduler import get_scheduler
+
+    source = get_scheduler().sources[0]
+    if not hasattr(transition_announcement_status, "kicker") or not hasattr(
+        source, "delete_schedule"
+    ):
+        return
+
+    now = datetime.now(timezone.utc)
+    times_by_id = {
+        announcement_id: (start_at, end_at)
+        for announcement_id, start_at, end_at in items
+    }
+    for announcement_id, (start_at, end_at) in times_by_id.items():
+        for status, at in (
+            (AnnouncementStatus.REGISTRATION_OPEN, start_at),
+            (AnnouncementStatus.REGISTRATION_CLOSED, end_at),
+        ):
+            schedule_id = transition_schedule_id(announcement_id, status)
+            try:
+                await source.delete_schedule(schedule_id)
+                if as_utc(at) > now:
+                    await (
+                        transition_announcement_status.kicker()
+                        .with_schedule_id(schedule_id)
+                        .schedule_by_time(source, as_utc(at), announcement_id)
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to schedule {schedule_id}: {e}")
+
+
+register_commit_hook(ANNOUNCEMENT_TRANSITIONS, _schedule_transitions)
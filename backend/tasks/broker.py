@@ -1,6 +1,9 @@
 from functools import lru_cache
 from core.config import get_settings
 from core.logger import logger
+from core.metrics import TaskMetricsMiddleware
+from core.services.email import close_smtp_pool
+from taskiq import TaskiqEvents, TaskiqState
 from taskiq_redis import RedisAsyncResultBackend, ListQueueBroker
 
 
@@ -57,9 +60,20 @@ def get_broker():
         redis_async_result
     )
 
+    if settings.metrics.enabled:
+        broker = broker.with_middlewares(
+            TaskMetricsMiddleware(worker_port=settings.metrics.worker_port)
+        )
+
+    broker.add_event_handler(TaskiqEvents.WORKER_SHUTDOWN, _close_worker_resources)
+
     return broker
 
 
+async def _close_worker_resources(state: TaskiqState) -> None:
+    await close_smtp_pool()
+
+
 async def startup_broker():
     """Start broker if not in worker process."""
     broker = get_broker()
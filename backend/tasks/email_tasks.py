@@ -1,6 +1,14 @@
+from sqlalchemy import select
+
 from tasks.broker import broker
+from core.db.container import get_db
 from core.logger import logger
+from enums.registration_status import RegistrationStatus
+from mailers.registration_mailer import RegistrationMailer
 from mailers.user_mailer import UserMailer
+from modules.announcements.model import Announcement
+from modules.registration.models import RegistrationRequest
+from modules.users.model import User
 
 
 @broker.task
@@ -37,3 +45,45 @@ async def send_password_reset_email_task(
         logger.error(f"❌ Failed to send password reset email to {email}")
 
     return result
+
+
+@broker.task
+async def send_registration_status_email_task(
+    registration_request_id: int, status: str, reason: str | None = None
+):
+    """Send the approval or rejection email of a registration request via taskiq."""
+    db = get_db()
+    async with db.session_factory() as session:
+        result = await session.execute(
+            select(User.email, User.first_name, Announcement.id, Announcement.title)
+            .select_from(RegistrationRequest)
+            .join(RegistrationRequest.user)
+            .join(RegistrationRequest.announcement)
+            .where(RegistrationRequest.id == registration_request_id)
+        )
+        row = result.one_or_none()
+
+    if row is None:
+        logger.info(f"Registration request {registration_request_id} is gone, no email")
+        return False
+
+    email, first_name, announcement_id, announcement_title = row
+    logger.info(f"📧 Processing registration {status} email for {email}")
+
+    mailer = RegistrationMailer()
+    mail = mailer.status_email(
+        email,
+        announcement_id,
+        announcement_title,
+        RegistrationStatus(status),
+        first_name,
+        reason,
+    )
+    result = await mailer.deliver(mail)
+
+    if result:
+        logger.info(f"✅ Registration {status} email sent to {email}")
+    else:
+        logger.error(f"❌ Failed to send registration {status} email to {email}")
+
+    return result
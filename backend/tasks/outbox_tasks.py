@@ -0,0 +1,58 @@
+from taskiq.kicker import AsyncKicker
+
+from core.db.commit_hooks import register_commit_hook
+from core.db.container import get_db
+from core.logger import logger
+from core.outbox import OUTBOX_MESSAGES
+from modules.outbox.repository import OutboxRepository
+from tasks.broker import broker, get_broker
+
+OUTBOX_BATCH_SIZE = 100
+"""Messages sent to the broker per relay transaction."""
+
+
+async def _wake_relay(task_names: list[str]) -> None:
+    if not hasattr(relay_outbox_task, "kiq"):
+        return
+    try:
+        await relay_outbox_task.kiq()
+    except Exception as e:
+        logger.warning(f"Failed to wake the outbox relay, next run sends: {e}")
+
+
+register_commit_hook(OUTBOX_MESSAGES, _wake_relay)
+
+
+@broker.task
+async def relay_outbox_task(batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+    """
+    Send outbox messages to the broker and delete them, one batch per commit.
+
+    Each batch is locked with ``FOR UPDATE SKIP LOCKED``, so relays woken by
+    different commits drain the outbox side by side. A failure rolls the
+    batch back; its messages, including any already sent, go out again on the
+    next run.
+    """
+    relayed = 0
+    db = get_db()
+    async with db.session_factory() as session:
+        repository = OutboxRepository(session)
+        while True:
+            messages = await repository.lock_batch(batch_size)
+            if not messages:
+                break
+
+            for message in messages:
+                await AsyncKicker(message.task_name, get_broker(), {}).kiq(
+                    **message.kwargs
+                )
+            await repository.delete([message.id for message in messages])
+            await session.commit()
+
+            relayed += len(messages)
+            if len(messages) < batch_size:
+                break
+
+    if relayed:
+        logger.info(f"📤 Relayed {relayed} outbox messages")
+    return relayed
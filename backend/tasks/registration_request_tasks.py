@@ -1,54 +1,51 @@
 from tasks.broker import broker
+from tasks.single_flight import ensure_lease, single_flight
 from core.logger import logger
 from core.db.container import get_db
-from modules.registration.models import RegistrationRequest
-from modules.announcements.model import Announcement
-from enums.registration_status import RegistrationStatus
-from enums.registration_trigger import RegistrationTrigger
-from operations.change_registration_request_status.contract import (
-    ChangeRegistrationRequestStatusContract,
+from operations.expire_registration_requests.contract import (
+    ExpireRegistrationRequestsContract,
 )
-from operations.change_registration_request_status.scenario import (
-    ChangeRegistrationRequestStatusScenario,
+from operations.expire_registration_requests.scenario import (
+    ExpireRegistrationRequestsScenario,
 )
-from sqlalchemy import select, and_
 from datetime import datetime, timezone
 
+EXPIRY_CHUNK_SIZE = 1000
+"""Registration requests expired per statement and transaction."""
+
 
 @broker.task
-async def expire_registration_requests_task():
-    """Expire registration requests that are past their deadline."""
+@single_flight()
+async def expire_registration_requests_task(chunk_size: int = EXPIRY_CHUNK_SIZE):
+    """
+    Expire registration requests that are past their deadline.
+
+    Requests are expired in chunks of ``chunk_size``, each with one
+    ``UPDATE ... RETURNING`` and its own commit, so a popular announcement
+    closing never holds one long transaction over all of its requests.
+    """
     logger.info("🔄 Checking for expired registration requests...")
 
     db = get_db()
     async with db.session_factory() as session:
-        now = datetime.now(timezone.utc)
-
-        result = await session.execute(
-            select(RegistrationRequest, Announcement)
-            .join(Announcement)
-            .where(
-                and_(
-                    RegistrationRequest.status == RegistrationStatus.PENDING,
-                    Announcement.registration_end_at < now,
-                )
-            )
+        scenario = ExpireRegistrationRequestsScenario(session)
+        contract = ExpireRegistrationRequestsContract(
+            registration_closed_before=datetime.now(timezone.utc),
+            chunk_size=chunk_size,
         )
 
-        expired_pairs = result.all()
-
-        for registration_request, announcement in expired_pairs:
-            await ChangeRegistrationRequestStatusScenario(session).run(
-                ChangeRegistrationRequestStatusContract(
-                    registration_request_id=registration_request.id,
-                    trigger=RegistrationTrigger.EXPIRE,
-                )
-            )
-
-        expired_count = len(expired_pairs)
+        expired_count = 0
+        while True:
+            expired = await scenario.run(contract)
+            if not expired:
+                break
+            await ensure_lease()
+            await session.commit()
+            expired_count += len(expired)
+            if len(expired) < chunk_size:
+                break
 
         if expired_count:
-            await session.commit()
             logger.info(f"✅ Expired {expired_count} registration requests")
         else:
             logger.debug("No registration requests to expire")
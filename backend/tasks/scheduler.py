@@ -4,6 +4,7 @@ from core.logger import logger
 from taskiq_redis import ListRedisScheduleSource
 from taskiq import TaskiqScheduler
 from tasks.broker import get_broker
+from tasks.single_flight import single_flight
 
 
 @lru_cache()
@@ -23,15 +24,24 @@ def get_scheduler():
     return TaskiqScheduler(broker=get_broker(), sources=[redis_source])
 
 
+@single_flight(ttl_seconds=30)
 async def register_periodic_tasks():
-    """Register all periodic tasks in Redis if they don't already exist."""
+    """
+    Register all periodic tasks in Redis, once each, whatever ran before.
+
+    Every task gets one schedule whose id is the task's name. Any other or
+    outdated schedule of the task, such as duplicates left by earlier
+    registrations, is replaced, so running this on every scheduler start, from
+    several replicas at once, always leaves exactly one schedule per task.
+    """
     from tasks.announcement_tasks import update_announcement_statuses
+    from tasks.outbox_tasks import relay_outbox_task
     from tasks.registration_request_tasks import expire_registration_requests_task
 
     PERIODIC_TASKS = [
         {
             "task": update_announcement_statuses,
-            "cron": "* * * * *",
+            "cron": get_settings().schedule.reconcile_cron,
             "name": "update_announcement_statuses",
         },
         {
@@ -39,6 +49,11 @@ async def register_periodic_tasks():
             "cron": "*/5 * * * *",
             "name": "expire_registration_requests_task",
         },
+        {
+            "task": relay_outbox_task,
+            "cron": "* * * * *",
+            "name": "relay_outbox_task",
+        },
     ]
 
     redis_source = get_scheduler().sources[0]
@@ -50,10 +65,9 @@ async def register_periodic_tasks():
 
     try:
         schedules = await redis_source.get_schedules()
-        existing = {schedule.task_name for schedule in schedules}
     except Exception as e:
         logger.warning(f"Could not get existing schedules: {e}")
-        existing = set()
+        schedules = []
 
     for task_config in PERIODIC_TASKS:
         task = task_config["task"]
@@ -62,13 +76,22 @@ async def register_periodic_tasks():
 
         task_name = task.__name__.replace("__taskiq_original", "")
         full_name = f"{task.__module__}:{task_name}"
+        scheduled = [
+            schedule
+            for schedule in schedules
+            if schedule.task_name == full_name and schedule.cron is not None
+        ]
 
-        if full_name in existing:
+        if [(s.schedule_id, s.cron) for s in scheduled] == [(name, cron)]:
             logger.info(f"⏭️  Skipped: {name} (already scheduled)")
             continue
 
         try:
-            await task.schedule_by_cron(redis_source, cron)
+            for schedule_id in {schedule.schedule_id for schedule in scheduled}:
+                await redis_source.delete_schedule(schedule_id)
+            await task.kicker().with_schedule_id(name).schedule_by_cron(
+                redis_source, cron
+            )
             logger.info(f"✓ Scheduled: {name} ({cron})")
         except Exception as e:
             logger.warning(f"Failed to schedule {name}: {e}")
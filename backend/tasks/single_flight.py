@@ -0,0 +1,102 @@
+import asyncio
+import time
+from contextlib import suppress
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from core.config import get_settings
+from core.locks import LeaseLock, LeaseLostError, get_lock_redis
+from core.logger import logger
+from core.metrics.registry import TASK_LEASE_HELD, TASK_SKIPPED
+
+_current_lease: ContextVar[LeaseLock | None] = ContextVar("current_lease", default=None)
+
+
+def single_flight(
+    name: str | None = None, ttl_seconds: float | None = None
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Run the decorated task in at most one worker at a time.
+
+    Place it below ``@broker.task``. Each run takes the task's ``LeaseLock``
+    first; a run that finds the lease held, whether by another scheduler
+    replica's run or a slow previous one, logs and returns ``None`` without
+    running. The lease is renewed every third of ``ttl_seconds`` while the task
+    runs, so ``ttl_seconds`` only bounds how long a crashed worker blocks the
+    next run. Tasks call ``ensure_lease`` before committing to stop once a
+    newer run has taken over.
+
+    If Redis is unreachable the run is skipped as well, since overlapping
+    runs are what the lease exists to prevent.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        lock_name = name or func.__name__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            settings = get_settings().schedule
+            if not settings.locks_enabled:
+                return await func(*args, **kwargs)
+
+            ttl = ttl_seconds or settings.lock_ttl_seconds
+            lease = LeaseLock(get_lock_redis(), lock_name, ttl)
+            try:
+                acquired = await lease.acquire()
+            except RedisError as e:
+                logger.warning(f"Skipped {lock_name}: lease unavailable: {e}")
+                TASK_SKIPPED.labels(lock_name).inc()
+                return None
+            if not acquired:
+                logger.info(f"⏭️  Skipped {lock_name}: another run holds the lease")
+                TASK_SKIPPED.labels(lock_name).inc()
+                return None
+
+            started_at = time.monotonic()
+            renewal = asyncio.create_task(_renew(lease, lock_name, ttl / 3))
+            reset = _current_lease.set(lease)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_lease.reset(reset)
+                renewal.cancel()
+                with suppress(asyncio.CancelledError):
+                    await renewal
+                TASK_LEASE_HELD.labels(lock_name).observe(time.monotonic() - started_at)
+                try:
+                    await lease.release()
+                except RedisError as e:
+                    logger.warning(f"Failed to release lease of {lock_name}: {e}")
+
+        return wrapper
+
+    return decorator
+
+
+async def ensure_lease() -> None:
+    """
+    Raise ``LeaseLostError`` if the running task no longer holds its lease.
+
+    The check compares fencing tokens: once the lease expired and another run
+    took it, the stored token is newer than ours. Outside ``single_flight``
+    runs, or with locks disabled, it does nothing.
+    """
+    lease = _current_lease.get()
+    if lease is not None and not await lease.is_held():
+        raise LeaseLostError(f"Lease {lease.token} is no longer held")
+
+
+async def _renew(lease: LeaseLock, lock_name: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            renewed = await lease.extend()
+        except RedisError as e:
+            logger.warning(f"Failed to renew lease of {lock_name}: {e}")
+            continue
+        if not renewed:
+            logger.warning(f"Lost lease of {lock_name}")
+            return
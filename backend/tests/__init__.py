@@ -0,0 +1,11 @@
+"""
+Test suite package.
+
+Strict loading is switched on here, before any model is imported, so a
+relationship that its query's loader profile did not load raises instead of
+emitting SQL.
+"""
+
+import os
+
+os.environ.setdefault("DB_STRICT_LOADING", "1")
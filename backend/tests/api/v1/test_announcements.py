@@ -2,8 +2,9 @@ import pytest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta, timezone
-from enums import AnnouncementStatus, AnnouncementFormat
+from enums import AnnouncementStatus, AnnouncementFormat, MatchStatus
 from exceptions import AppException, ValidationException
+from core.search.base_search import CursorPage, SearchPage
 
 
 @pytest.mark.asyncio
@@ -14,9 +15,7 @@ async def test_get_announcements_paginated(async_client, announcement_factory):
     announcements = [SimpleNamespace(**a1), SimpleNamespace(**a2)]
 
     mock_search = MagicMock()
-    mock_search.results = AsyncMock(return_value=announcements)
-    mock_search.filtered_count = AsyncMock(return_value=2)
-    mock_search.total_count = AsyncMock(return_value=2)
+    mock_search.paginate = AsyncMock(return_value=SearchPage(announcements, 2, 2))
 
     with (
         patch("api.v1.announcements.AnnouncementSearch", return_value=mock_search),
@@ -34,6 +33,36 @@ async def test_get_announcements_paginated(async_client, announcement_factory):
         assert body["filtered_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_get_announcements_cursor_mode_returns_next_cursor(
+    async_client, announcement_factory
+):
+    a1 = announcement_factory.build(organizer_id=1)
+    announcements = [SimpleNamespace(**a1)]
+
+    mock_search = MagicMock()
+    mock_search.paginate = AsyncMock()
+    mock_search.cursor_paginate = AsyncMock(
+        return_value=CursorPage(
+            items=announcements, next_cursor="abc", filtered_count=5, total_count=5
+        )
+    )
+
+    with (
+        patch("api.v1.announcements.AnnouncementSearch", return_value=mock_search),
+        patch("api.v1.announcements.get_batch_permissions", return_value=None),
+    ):
+        r = await async_client.get("/api/v1/announcements?cursor=&skip=3&limit=1")
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["next_cursor"] == "abc"
+    assert body["skip"] == 0
+    assert body["filtered_count"] == 5
+    mock_search.cursor_paginate.assert_awaited_once_with(cursor="", limit=1)
+    mock_search.paginate.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_create_announcement_sets_pre_registration_status(
     async_client, announcement_factory, authenticated_client, user
@@ -64,7 +93,6 @@ async def test_create_announcement_sets_pre_registration_status(
             "api.v1.announcements.CreateAnnouncementScenario",
             new=FakeScenario,
         ),
-        patch("api.v1.announcements.get_permissions", return_value={}),
     ):
         r = await client.post("/api/v1/announcements", json=announcement_data)
         assert r.status_code == 201
@@ -100,7 +128,6 @@ async def test_create_announcement_sets_registration_open_status(
             "api.v1.announcements.CreateAnnouncementScenario",
             new=FakeScenario,
         ),
-        patch("api.v1.announcements.get_permissions", return_value={}),
     ):
         r = await client.post("/api/v1/announcements", json=announcement_data)
         assert r.status_code == 201
@@ -115,9 +142,7 @@ async def test_get_announcements_with_game_filter(async_client, announcement_fac
     announcements = [SimpleNamespace(**a1), SimpleNamespace(**a2)]
 
     mock_search = MagicMock()
-    mock_search.results = AsyncMock(return_value=announcements)
-    mock_search.filtered_count = AsyncMock(return_value=2)
-    mock_search.total_count = AsyncMock(return_value=5)
+    mock_search.paginate = AsyncMock(return_value=SearchPage(announcements, 2, 5))
 
     with (
         patch("api.v1.announcements.AnnouncementSearch", return_value=mock_search),
@@ -143,9 +168,7 @@ async def test_get_all_announcements_without_filter(async_client, announcement_f
     ]
 
     mock_search = MagicMock()
-    mock_search.results = AsyncMock(return_value=announcements)
-    mock_search.filtered_count = AsyncMock(return_value=3)
-    mock_search.total_count = AsyncMock(return_value=3)
+    mock_search.paginate = AsyncMock(return_value=SearchPage(announcements, 3, 3))
 
     with (
         patch("api.v1.announcements.AnnouncementSearch", return_value=mock_search),
@@ -189,7 +212,6 @@ async def test_create_announcement_with_format(
             "api.v1.announcements.CreateAnnouncementScenario",
             new=FakeScenario,
         ),
-        patch("api.v1.announcements.get_permissions", return_value={}),
     ):
         r = await client.post("/api/v1/announcements", json=announcement_data)
         assert r.status_code == 201
@@ -412,6 +434,58 @@ async def test_generate_bracket_transitions_to_live(
     assert r.json()["data"]["status"] == AnnouncementStatus.LIVE.value
 
 
+@pytest.mark.asyncio
+async def test_submit_match_results_returns_updated_matches(
+    async_client, announcement_factory, authenticated_client, user
+):
+    """POST /matches/results runs the batch scenario and returns its matches."""
+    from api.v1.announcements import get_minimal_announcement_dependency
+
+    client = authenticated_client(user)
+    ann_obj = SimpleNamespace(**announcement_factory.build(organizer_id=user.id))
+    completed = SimpleNamespace(
+        id=5,
+        round_number=1,
+        match_number=1,
+        participant1=None,
+        participant2=None,
+        winner_id=7,
+        status=MatchStatus.COMPLETED,
+        is_bye=False,
+        is_third_place=False,
+        next_match_winner_id=None,
+    )
+    run = AsyncMock(return_value=[completed])
+
+    async def override_announcement():
+        return ann_obj
+
+    app = async_client._transport.app
+    app.dependency_overrides[get_minimal_announcement_dependency] = (
+        override_announcement
+    )
+
+    try:
+        with (
+            patch("api.v1.announcements.authorize_action"),
+            patch(
+                "api.v1.announcements.SubmitMatchResultsScenario",
+                return_value=MagicMock(run=run),
+            ),
+        ):
+            r = await client.post(
+                f"/api/v1/announcements/{ann_obj.id}/matches/results",
+                json={"results": [{"match_id": 5, "winner": "participant1"}]},
+            )
+    finally:
+        del app.dependency_overrides[get_minimal_announcement_dependency]
+
+    assert r.status_code == 200
+    assert r.json()["data"][0]["winner_id"] == 7
+    contract = run.call_args.args[0]
+    assert contract.results_in.results[0].match_id == 5
+
+
 @pytest.mark.asyncio
 async def test_cancel_announcement_returns_cancelled(
     async_client, announcement_factory, authenticated_client, user
@@ -516,10 +590,60 @@ async def test_lifecycle_endpoint_returns_403_for_non_organizer(
     assert r.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_get_announcement_merges_permissions_per_user(
+    async_client, announcement_factory
+):
+    """GET /{id} serves a shared payload and computes permissions per caller."""
+    import core.users as users_mod
+    from core.cache.response_cache import ResponseCache
+    from core.permissions import get_payload_permissions
+
+    ann_obj = SimpleNamespace(**announcement_factory.build(organizer_id=1))
+    build_source = AsyncMock(return_value=ann_obj)
+    stored: dict[str, str] = {}
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=stored.get)
+    redis.set = AsyncMock(
+        side_effect=lambda key, value, ex: stored.update({key: value})
+    )
+
+    app = async_client._transport.app
+    organizer = SimpleNamespace(id=1, is_superuser=False)
+
+    with (
+        patch("api.v1.announcements.get_announcement_dependency", build_source),
+        patch(
+            "api.v1.announcements.get_response_cache",
+            return_value=ResponseCache(redis),
+        ),
+        patch(
+            "api.v1.announcements.get_payload_permissions",
+            wraps=get_payload_permissions,
+        ) as payload_permissions,
+    ):
+        anonymous = await async_client.get(f"/api/v1/announcements/{ann_obj.id}")
+
+        app.dependency_overrides[users_mod.current_user_or_none] = lambda: organizer
+        try:
+            owner = await async_client.get(f"/api/v1/announcements/{ann_obj.id}")
+        finally:
+            del app.dependency_overrides[users_mod.current_user_or_none]
+
+    assert anonymous.status_code == owner.status_code == 200
+    assert anonymous.json()["data"]["permissions"]["edit"] is False
+    assert owner.json()["data"]["permissions"]["edit"] is True
+    assert "permissions" not in next(iter(stored.values()))
+    build_source.assert_awaited_once()
+    assert [c.args[0] for c in payload_permissions.call_args_list] == [
+        None,
+        organizer,
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_bracket_returns_rounds(async_client, announcement_factory):
     """GET /bracket returns bracket_size and grouped rounds when matches exist."""
-    from api.v1.announcements import get_announcement_dependency
     from enums import MatchStatus
 
     announcement_data = announcement_factory.build(organizer_id=1, bracket_size=4)
@@ -551,24 +675,25 @@ async def test_get_bracket_returns_rounds(async_client, announcement_factory):
         next_match_winner_id=None,
     )
 
-    async def override_announcement():
-        return ann_obj
-
-    app = async_client._transport.app
-    app.dependency_overrides[get_announcement_dependency] = override_announcement
-
-    try:
-        with patch(
+    with (
+        patch(
+            "api.v1.announcements.get_announcement_dependency",
+            AsyncMock(return_value=ann_obj),
+        ),
+        patch(
+            "api.v1.announcements.AnnouncementQueries",
+            return_value=MagicMock(find_bracket_version=AsyncMock(return_value=1)),
+        ),
+        patch(
             "modules.announcements.utils.bracket.MatchQueries",
             return_value=MagicMock(
                 find_all_unpaginated_by_announcement_id=AsyncMock(
                     return_value=[match1, match2]
                 )
             ),
-        ):
-            r = await async_client.get(f"/api/v1/announcements/{ann_obj.id}/bracket")
-    finally:
-        del app.dependency_overrides[get_announcement_dependency]
+        ),
+    ):
+        r = await async_client.get(f"/api/v1/announcements/{ann_obj.id}/bracket")
 
     assert r.status_code == 200
     body = r.json()["data"]
@@ -576,6 +701,98 @@ async def test_get_bracket_returns_rounds(async_client, announcement_factory):
     assert len(body["rounds"]) == 2
     assert len(body["rounds"]["1"]) == 1
     assert len(body["rounds"]["2"]) == 1
+    assert r.headers["etag"] == f'"{ann_obj.id}-1"'
+
+
+@pytest.mark.asyncio
+async def test_get_bracket_returns_304_without_loading_matches(async_client):
+    """GET /bracket answers 304 from the version marker when the ETag matches."""
+    load_announcement = AsyncMock()
+    match_queries = MagicMock()
+
+    with (
+        patch("api.v1.announcements.get_announcement_dependency", load_announcement),
+        patch(
+            "api.v1.announcements.AnnouncementQueries",
+            return_value=MagicMock(find_bracket_version=AsyncMock(return_value=3)),
+        ),
+        patch("modules.announcements.utils.bracket.MatchQueries", match_queries),
+    ):
+        r = await async_client.get(
+            "/api/v1/announcements/7/bracket", headers={"If-None-Match": '"7-3"'}
+        )
+
+    assert r.status_code == 304
+    assert r.headers["etag"] == '"7-3"'
+    load_announcement.assert_not_awaited()
+    match_queries.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_matches_returns_304_when_etag_matches(async_client):
+    """GET /matches skips the match query when the bracket version is unchanged."""
+    match_queries = MagicMock()
+
+    with (
+        patch(
+            "api.v1.announcements.AnnouncementQueries",
+            return_value=MagicMock(find_bracket_version=AsyncMock(return_value=2)),
+        ),
+        patch("api.v1.announcements.MatchQueries", match_queries),
+    ):
+        r = await async_client.get(
+            "/api/v1/announcements/7/matches", headers={"If-None-Match": 'W/"7-2"'}
+        )
+
+    assert r.status_code == 304
+    match_queries.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_matches_stays_within_query_budget(
+    async_client,
+    query_budget,
+    create_user,
+    create_announcement,
+    create_participant,
+    create_match,
+):
+    """GET /matches loads participants per relationship, not per match."""
+    organizer = await create_user(email="budget_org@example.com")
+    announcement = await create_announcement(organizer_id=organizer.id)
+    participants = []
+    for index in range(4):
+        player = await create_user(email=f"budget_p{index}@example.com")
+        participants.append(
+            await create_participant(announcement_id=announcement.id, user_id=player.id)
+        )
+    for match_number in (1, 2):
+        await create_match(
+            announcement_id=announcement.id,
+            round_number=1,
+            match_number=match_number,
+            participant1_id=participants[2 * match_number - 2].id,
+            participant2_id=participants[2 * match_number - 1].id,
+        )
+
+    with query_budget(6):
+        r = await async_client.get(f"/api/v1/announcements/{announcement.id}/matches")
+
+    assert r.status_code == 200
+    assert len(r.json()["data"]) == 2
+    assert r.headers["server-timing"].startswith("db;dur=")
+
+
+@pytest.mark.asyncio
+async def test_get_matches_returns_404_for_unknown_announcement(async_client):
+    """GET /matches returns 404 when the announcement does not exist."""
+    with patch(
+        "api.v1.announcements.AnnouncementQueries",
+        return_value=MagicMock(find_bracket_version=AsyncMock(return_value=None)),
+    ):
+        r = await async_client.get("/api/v1/announcements/7/matches")
+
+    assert r.status_code == 404
 
 
 @pytest.mark.asyncio
@@ -583,27 +800,26 @@ async def test_get_bracket_returns_404_when_no_matches(
     async_client, announcement_factory
 ):
     """GET /bracket returns 404 when no matches have been generated yet."""
-    from api.v1.announcements import get_announcement_dependency
-
     announcement_data = announcement_factory.build(organizer_id=1)
     ann_obj = SimpleNamespace(**announcement_data)
 
-    async def override_announcement():
-        return ann_obj
-
-    app = async_client._transport.app
-    app.dependency_overrides[get_announcement_dependency] = override_announcement
-
-    try:
-        with patch(
+    with (
+        patch(
+            "api.v1.announcements.get_announcement_dependency",
+            AsyncMock(return_value=ann_obj),
+        ),
+        patch(
+            "api.v1.announcements.AnnouncementQueries",
+            return_value=MagicMock(find_bracket_version=AsyncMock(return_value=1)),
+        ),
+        patch(
             "modules.announcements.utils.bracket.MatchQueries",
             return_value=MagicMock(
                 find_all_unpaginated_by_announcement_id=AsyncMock(return_value=[])
             ),
-        ):
-            r = await async_client.get(f"/api/v1/announcements/{ann_obj.id}/bracket")
-    finally:
-        del app.dependency_overrides[get_announcement_dependency]
+        ),
+    ):
+        r = await async_client.get(f"/api/v1/announcements/{ann_obj.id}/bracket")
 
     assert r.status_code == 404
 
@@ -686,9 +902,7 @@ async def test_get_announcement_registration_requests_allowed_for_organizer(
 
     try:
         mock_search = MagicMock()
-        mock_search.results = AsyncMock(return_value=[])
-        mock_search.filtered_count = AsyncMock(return_value=0)
-        mock_search.total_count = AsyncMock(return_value=0)
+        mock_search.paginate = AsyncMock(return_value=SearchPage([], 0, 0))
 
         with (
             patch("api.v1.announcements.authorize_action"),
@@ -841,3 +1055,11 @@ async def test_generate_bracket_returns_403_for_non_organizer(
         del app.dependency_overrides[get_announcement_dependency]
 
     assert r.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bracket_stream_returns_503_when_live_updates_disabled(async_client):
+    """GET /bracket/stream fails fast when Redis pub/sub is not configured."""
+    r = await async_client.get("/api/v1/announcements/1/bracket/stream")
+
+    assert r.status_code == 503
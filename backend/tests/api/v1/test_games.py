@@ -2,6 +2,7 @@ import pytest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
+from core.search.base_search import SearchPage
 from modules.games.policy import GamePolicy
 
 
@@ -16,9 +17,10 @@ def test_game_policy_can_view_is_public():
 async def test_get_games_accessible_without_auth(async_client):
     """GET /games returns 200 for unauthenticated callers."""
     with (
-        patch("api.v1.games.GameSearch.results", new=AsyncMock(return_value=[])),
-        patch("api.v1.games.GameSearch.filtered_count", new=AsyncMock(return_value=0)),
-        patch("api.v1.games.GameSearch.total_count", new=AsyncMock(return_value=0)),
+        patch(
+            "api.v1.games.GameSearch.paginate",
+            new=AsyncMock(return_value=SearchPage([], 0, 0)),
+        ),
         patch("api.v1.games.get_batch_permissions", return_value=None),
     ):
         r = await async_client.get("/api/v1/games")
@@ -33,11 +35,9 @@ async def test_get_games_paginated(async_client, game_factory):
 
     with (
         patch(
-            "api.v1.games.GameSearch.results",
-            new=AsyncMock(return_value=games),
+            "api.v1.games.GameSearch.paginate",
+            new=AsyncMock(return_value=SearchPage(games, 2, 5)),
         ),
-        patch("api.v1.games.GameSearch.filtered_count", new=AsyncMock(return_value=2)),
-        patch("api.v1.games.GameSearch.total_count", new=AsyncMock(return_value=5)),
         patch("api.v1.games.get_batch_permissions", return_value=None),
     ):
         r = await async_client.get("/api/v1/games?skip=0&limit=10")
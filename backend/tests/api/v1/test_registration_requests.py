@@ -3,8 +3,6 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
-from modules.participants.schemas import AnnouncementParticipantResponse
-
 
 def _make_fake_game(**overrides) -> SimpleNamespace:
     data = {"id": 1, "name": "CS2", "image_url": None, "category": "FPS"}
@@ -20,7 +18,7 @@ def _make_fake_announcement(**overrides) -> SimpleNamespace:
         "format": "single_elimination",
         "registration_end_at": datetime.now(timezone.utc),
         "game": _make_fake_game(),
-        "participants": [],
+        "participants_count": 0,
     }
     data.update(overrides)
     return SimpleNamespace(**data)
@@ -102,19 +100,9 @@ async def test_get_registration_request_includes_announcement(
 async def test_get_registration_request_announcement_participants_count(
     async_client, authenticated_client, user
 ):
-    """participants_count in announcement reflects the participants list length."""
+    """participants_count in announcement is the announcement's counter."""
     client = authenticated_client(user)
-    participants = [
-        AnnouncementParticipantResponse(
-            id=n,
-            announcement_id=1,
-            user_id=n,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        for n in range(1, 4)
-    ]
-    ann = _make_fake_announcement(participants=participants)
+    ann = _make_fake_announcement(participants_count=3)
     fake_rr = _make_fake_rr(user_id=user.id, announcement=ann)
 
     import api.v1.registration_requests as rr_module
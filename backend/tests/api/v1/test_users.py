@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from core.search.base_search import SearchPage
 from enums.registration_status import RegistrationStatus
 
 
@@ -27,9 +28,7 @@ async def test_get_my_registration_requests_uses_search_with_status_filter(
     client = authenticated_client(user)
 
     mock_search = MagicMock()
-    mock_search.results = AsyncMock(return_value=[])
-    mock_search.filtered_count = AsyncMock(return_value=0)
-    mock_search.total_count = AsyncMock(return_value=3)
+    mock_search.paginate = AsyncMock(return_value=SearchPage([], 0, 3))
 
     with patch(
         "api.v1.users.RegistrationRequestSearch",
@@ -20,8 +20,9 @@ from sqlalchemy.ext.asyncio import (
 )
 from testcontainers.postgres import PostgresContainer
 from core.config import get_settings
+from core.db.query_stats import instrument_engine
 
-pytest_plugins = ["tests.factory_fixtures"]
+pytest_plugins = ["tests.factory_fixtures", "tests.query_budget"]
 
 
 def test_settings(sync_db_url: str) -> config.Settings:
@@ -51,6 +52,10 @@ def test_settings(sync_db_url: str) -> config.Settings:
             "verification_token_secret": "test-verification-token-secret-key-only",
             "reset_password_token_secret": "test-reset-password-token-secret-only",
         },
+        "cache": {"enabled": False},
+        "user_cache": {"enabled": False},
+        "live": {"enabled": False},
+        "schedule": {"transitions_enabled": False, "locks_enabled": False},
     }
 
     return config.Settings(**settings_data)
@@ -88,6 +93,13 @@ def pytest_sessionstart(session):
     config.get_settings = lambda: settings_instance
     db_container.get_settings = lambda: settings_instance
 
+    from tasks.outbox_tasks import relay_outbox_task
+
+    async def _no_relay(*args, **kwargs):
+        return None
+
+    setattr(relay_outbox_task, "kiq", _no_relay)
+
     session._test_postgres_container = container
 
 
@@ -178,6 +190,7 @@ async def engine(migrated_db, async_db_url) -> AsyncGenerator[AsyncEngine, None]
     """
 
     engine = create_async_engine(async_db_url, echo=False)
+    instrument_engine(engine)
 
     yield engine
 
@@ -258,6 +271,9 @@ async def async_client(app, db_session) -> AsyncGenerator[httpx.AsyncClient, Non
         yield db_session
 
     app.dependency_overrides[core_deps._session_getter_dep] = override_session_getter
+    app.dependency_overrides[core_deps._read_session_getter_dep] = (
+        override_session_getter
+    )
 
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
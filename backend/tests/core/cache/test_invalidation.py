@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.orm import Session
+
+from core.cache.invalidation import mark_stale, pending_stale
+from core.db.commit_hooks import wait_for_commit_hooks
+
+
+def test_mark_stale_records_entities_on_session():
+    session = Session()
+
+    mark_stale(session, "announcement", 1)
+    mark_stale(session, "announcement", 1)
+    mark_stale(session, "game", 3)
+
+    assert pending_stale(session) == {("announcement", 1), ("game", 3)}
+
+
+def test_mark_stale_ignores_missing_id():
+    session = Session()
+
+    mark_stale(session, "announcement", None)
+
+    assert pending_stale(session) == set()
+
+
+def test_rollback_discards_marks():
+    session = Session()
+    session.begin()
+    mark_stale(session, "announcement", 1)
+
+    session.rollback()
+
+    assert pending_stale(session) == set()
+
+
+@pytest.mark.asyncio
+async def test_commit_invalidates_marked_entities():
+    cache = MagicMock(enabled=True, invalidate=AsyncMock())
+    session = Session()
+    session.begin()
+    mark_stale(session, "announcement", 1)
+
+    with patch("core.cache.invalidation.get_response_cache", return_value=cache):
+        session.commit()
+        await wait_for_commit_hooks()
+
+    cache.invalidate.assert_awaited_once_with({("announcement", 1)})
+    assert pending_stale(session) == set()
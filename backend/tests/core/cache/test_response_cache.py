@@ -0,0 +1,125 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.cache.response_cache import ResponseCache, payload_key, version_key
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self._ops.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self._ops.append(("expire", key, seconds))
+
+    async def execute(self):
+        for op, key, *_ in self._ops:
+            if op == "incr":
+                self._redis.store[key] = str(int(self._redis.store.get(key, 0)) + 1)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def test_payload_key_includes_version_and_variant():
+    assert payload_key("announcement", 7, 3, "bracket") == (
+        "cache:announcement:7:v3:bracket"
+    )
+    assert version_key("announcement", 7) == "cache:announcement:7:version"
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_builds_once_then_serves_cached_payload():
+    cache = ResponseCache(FakeRedis())
+    build = AsyncMock(return_value={"id": 1, "title": "Cup"})
+
+    first = await cache.get_or_build("announcement", 1, "detail", build)
+    second = await cache.get_or_build("announcement", 1, "detail", build)
+
+    assert first == second == {"id": 1, "title": "Cup"}
+    build.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version_so_next_read_rebuilds():
+    redis = FakeRedis()
+    cache = ResponseCache(redis)
+    build = AsyncMock(side_effect=[{"title": "old"}, {"title": "new"}])
+
+    await cache.get_or_build("announcement", 1, "detail", build)
+    await cache.invalidate([("announcement", 1)])
+    result = await cache.get_or_build("announcement", 1, "detail", build)
+
+    assert result == {"title": "new"}
+    assert redis.store[version_key("announcement", 1)] == "1"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_leaves_other_entities_cached():
+    cache = ResponseCache(FakeRedis())
+    build = AsyncMock(return_value={"id": 2})
+
+    await cache.get_or_build("announcement", 2, "detail", build)
+    await cache.invalidate([("announcement", 1), ("game", 2)])
+    await cache.get_or_build("announcement", 2, "detail", build)
+
+    build.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_build_errors_are_not_cached():
+    redis = FakeRedis()
+    cache = ResponseCache(redis)
+    build = AsyncMock(side_effect=LookupError("missing"))
+
+    with pytest.raises(LookupError):
+        await cache.get_or_build("announcement", 1, "detail", build)
+
+    assert redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_builds():
+    cache = ResponseCache(redis=None)
+    build = AsyncMock(return_value={"id": 1})
+
+    await cache.get_or_build("announcement", 1, "detail", build)
+    await cache.get_or_build("announcement", 1, "detail", build)
+    await cache.invalidate([("announcement", 1)])
+
+    assert not cache.enabled
+    assert build.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_serves_uncached_payload():
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=RedisConnectionError("down"))
+    cache = ResponseCache(redis)
+
+    result = await cache.get_or_build(
+        "announcement", 1, "detail", AsyncMock(return_value={"id": 1})
+    )
+
+    assert result == {"id": 1}
@@ -0,0 +1,225 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi_users import IntegerIDMixin, exceptions
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import inspect
+
+from core.auth import CachedJWTStrategy
+from core.cache.user_cache import UserCache, user_key
+from core.user_manager import UserManager
+from modules.users.model import User
+
+SECRET = "test-secret-key-for-testing-purposes-only"
+
+
+def make_user(user_id: int = 1, **overrides) -> User:
+    values = {
+        "id": user_id,
+        "email": f"user{user_id}@example.com",
+        "hashed_password": "hash",
+        "is_active": True,
+        "is_superuser": False,
+        "is_verified": True,
+        "nickname": "player",
+    }
+    return User(**{**values, **overrides})
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, key, field, value):
+        self._ops.append((key, field, value))
+
+    def expire(self, key, seconds):
+        self._redis.ttls[key] = seconds
+
+    async def execute(self):
+        for key, field, value in self._ops:
+            self._redis.store.setdefault(key, {})[field] = value
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def hget(self, key, field):
+        return self.store.get(key, {}).get(field)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeUserManager(IntegerIDMixin):
+    def __init__(self, user: User) -> None:
+        self.user = user
+        self.get = AsyncMock(return_value=user)
+
+
+@pytest.mark.asyncio
+async def test_hit_returns_detached_copy_without_password_hash():
+    cache = UserCache()
+    await cache.set(make_user(), issued_at=100)
+
+    first = await cache.get(1, 100)
+    second = await cache.get(1, 100)
+
+    assert first is not second
+    assert (first.id, first.email, first.nickname) == (1, "user1@example.com", "player")
+    assert inspect(first).detached
+    assert "hashed_password" not in first.__dict__
+    assert await cache.get(1, 101) is None
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = UserCache(ttl_seconds=30)
+    with patch("core.cache.user_cache.time.monotonic", return_value=0.0):
+        await cache.set(make_user(), issued_at=100)
+
+    with patch("core.cache.user_cache.time.monotonic", return_value=29.0):
+        assert await cache.get(1, 100) is not None
+    with patch("core.cache.user_cache.time.monotonic", return_value=30.0):
+        assert await cache.get(1, 100) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_every_token_of_the_user():
+    cache = UserCache()
+    await cache.set(make_user(1), issued_at=100)
+    await cache.set(make_user(1), issued_at=200)
+    await cache.set(make_user(2), issued_at=100)
+
+    await cache.invalidate(1)
+
+    assert await cache.get(1, 100) is None
+    assert await cache.get(1, 200) is None
+    assert await cache.get(2, 100) is not None
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_user_is_evicted():
+    cache = UserCache(max_entries=2)
+    await cache.set(make_user(1), issued_at=100)
+    await cache.set(make_user(2), issued_at=100)
+    await cache.get(1, 100)
+    await cache.set(make_user(3), issued_at=100)
+
+    assert await cache.get(1, 100) is not None
+    assert await cache.get(2, 100) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_layer_is_shared_and_invalidated():
+    redis = FakeRedis()
+    writer = UserCache(ttl_seconds=30, redis=redis)
+    reader = UserCache(ttl_seconds=30, redis=redis)
+
+    await writer.set(make_user(), issued_at=100)
+
+    assert (await reader.get(1, 100)).email == "user1@example.com"
+    assert redis.ttls[user_key(1)] == 30
+
+    await writer.invalidate(1)
+    assert user_key(1) not in redis.store
+
+
+@pytest.mark.asyncio
+async def test_redis_layer_restores_timestamps():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    redis = FakeRedis()
+    user = make_user(created_at=created_at, updated_at=created_at)
+
+    await UserCache(max_entries=0, redis=redis).set(user, issued_at=100)
+    cached = await UserCache(max_entries=0, redis=redis).get(1, 100)
+
+    assert cached.created_at == created_at
+    assert cached.updated_at == created_at
+
+
+@pytest.mark.asyncio
+async def test_user_loaded_from_the_database_round_trips_through_redis(
+    db_session, create_user
+):
+    created = await create_user(email="cached_db_user@example.com")
+    user = await db_session.get(User, created.id)
+    redis = FakeRedis()
+
+    await UserCache(max_entries=0, redis=redis).set(user, issued_at=100)
+    cached = await UserCache(max_entries=0, redis=redis).get(user.id, 100)
+
+    assert cached.email == user.email
+    assert isinstance(cached.created_at, datetime)
+    assert cached.created_at == user.created_at
+    assert cached.updated_at == user.updated_at
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses():
+    redis = FakeRedis()
+    redis.hget = AsyncMock(side_effect=RedisConnectionError("down"))
+
+    assert await UserCache(max_entries=0, redis=redis).get(1, 100) is None
+
+
+@pytest.mark.asyncio
+async def test_strategy_loads_user_once_per_token():
+    strategy = CachedJWTStrategy(
+        secret=SECRET, lifetime_seconds=60, token_audience=["test"]
+    )
+    manager = FakeUserManager(make_user())
+    token = await strategy.write_token(manager.user)
+
+    with patch("core.auth.get_user_cache", return_value=UserCache()):
+        first = await strategy.read_token(token, manager)
+        second = await strategy.read_token(token, manager)
+
+    assert first is manager.user
+    assert second.id == 1 and second is not first
+    manager.get.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_strategy_rejects_unknown_users_and_bad_tokens():
+    strategy = CachedJWTStrategy(
+        secret=SECRET, lifetime_seconds=60, token_audience=["test"]
+    )
+    manager = FakeUserManager(make_user())
+    manager.get.side_effect = exceptions.UserNotExists()
+    token = await strategy.write_token(manager.user)
+
+    with patch("core.auth.get_user_cache", return_value=UserCache()):
+        assert await strategy.read_token(token, manager) is None
+        assert await strategy.read_token("not-a-token", manager) is None
+        assert await strategy.read_token(None, manager) is None
+
+
+@pytest.mark.asyncio
+async def test_user_manager_hooks_invalidate_the_user():
+    cache = UserCache()
+    manager = UserManager(None)
+    user = make_user()
+
+    with patch("core.user_manager.get_user_cache", return_value=cache):
+        for hook in (
+            lambda: manager.on_after_update(user, {"nickname": "new"}),
+            lambda: manager.on_after_verify(user),
+            lambda: manager.on_after_reset_password(user),
+        ):
+            await cache.set(user, issued_at=100)
+            await hook()
+            assert await cache.get(1, 100) is None
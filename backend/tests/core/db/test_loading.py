@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from sqlalchemy import inspect
+
+from core.db.loading import (
+    STRICT_LOADING_ENV,
+    LoaderProfiles,
+    refresh_columns,
+    relationship_default_lazy,
+)
+from modules.announcements.loaders import ANNOUNCEMENT_LOADERS
+from modules.announcements.model import Announcement
+from modules.participants.model import AnnouncementParticipant
+from modules.registration.models import (
+    FormFieldResponse,
+    RegistrationForm,
+    RegistrationRequest,
+)
+
+
+def test_profiles_default_to_columns_only():
+    profiles = LoaderProfiles(list=("game",))
+
+    assert profiles.options("minimal") == ()
+    assert profiles.options("write") == ()
+    assert profiles.options("list") == ("game",)
+
+
+def test_relationship_default_lazy_follows_strict_flag(monkeypatch):
+    monkeypatch.setenv(STRICT_LOADING_ENV, "1")
+    assert relationship_default_lazy() == "raise_on_sql"
+
+    monkeypatch.delenv(STRICT_LOADING_ENV)
+    assert relationship_default_lazy() == "select"
+
+
+@pytest.mark.parametrize(
+    "model, name",
+    [
+        (Announcement, "game"),
+        (Announcement, "participants"),
+        (Announcement, "registration_form"),
+        (AnnouncementParticipant, "user"),
+        (RegistrationForm, "fields"),
+        (RegistrationRequest, "form_responses"),
+        (FormFieldResponse, "form_field"),
+    ],
+)
+def test_profiled_relationships_raise_in_tests(model, name):
+    assert inspect(model).relationships[name].lazy == "raise_on_sql"
+
+
+def test_detail_profile_extends_list_profile():
+    detail = ANNOUNCEMENT_LOADERS.options("detail")
+
+    assert ANNOUNCEMENT_LOADERS.options("minimal") == ()
+    assert all(option in detail for option in ANNOUNCEMENT_LOADERS.options("list"))
+
+
+@pytest.mark.asyncio
+async def test_refresh_columns_leaves_relationships_loaded():
+    session = AsyncMock()
+    participant = AnnouncementParticipant(announcement_id=1, user_id=2)
+
+    await refresh_columns(session, participant)
+
+    (_, column_keys), _ = session.refresh.call_args
+    assert "qualification_score" in column_keys
+    assert "user" not in column_keys
+    assert "announcement" not in column_keys
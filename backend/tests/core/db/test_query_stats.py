@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from core.db.query_stats import QueryStats, instrument_engine, track_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items (id) VALUES (1), (2), (3)"))
+    yield engine
+    engine.dispose()
+
+
+def test_counts_statements_rows_and_repeats(engine):
+    with track_queries() as stats, engine.connect() as conn:
+        for item_id in (1, 2, 3):
+            conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": item_id})
+        conn.execute(text("UPDATE items SET id = id + 10 WHERE id > 1"))
+
+    assert stats.statements == 4
+    assert stats.rows == 2
+    assert stats.duration_ms > 0
+    assert stats.repeated_statements(3) == {"SELECT id FROM items WHERE id = ?": 3}
+    assert stats.repeated_statements(4) == {}
+
+
+def test_statements_outside_a_block_are_not_counted(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 2"))
+
+    assert stats.statements == 1
+
+
+def test_nested_blocks_both_count(engine):
+    with track_queries() as outer, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            conn.execute(text("SELECT 2"))
+
+    assert outer.statements == 2
+    assert inner.statements == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_blocks_are_isolated(engine):
+    async def request(count: int) -> QueryStats:
+        with track_queries() as stats:
+            for _ in range(count):
+                await asyncio.sleep(0)
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+        return stats
+
+    first, second = await asyncio.gather(request(2), request(5))
+
+    assert (first.statements, second.statements) == (2, 5)
+
+
+def test_instrument_engine_is_idempotent(engine):
+    instrument_engine(engine)
+
+    with track_queries() as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert stats.statements == 1
+
+
+def test_server_timing_header_value():
+    stats = QueryStats()
+    stats.record("SELECT 1", 1.5, 1)
+    stats.record("SELECT 1", 2.25, -1)
+
+    assert stats.server_timing() == 'db;dur=3.75;desc="2 queries, 1 rows"'
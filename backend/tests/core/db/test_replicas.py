@@ -0,0 +1,113 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from core.db.replicas import READ_ONLY, ReadOnlySessionError, ReplicaSet
+
+
+class FakeDatabase:
+    def __init__(self, name: str, lag: float | None = 0.0) -> None:
+        self.name = name
+        self.lag = lag
+        self.sessions: list[dict] = []
+
+    def session_factory(self, info: dict):
+        @asynccontextmanager
+        async def session():
+            self.sessions.append(info)
+            yield SimpleNamespace(info=info, database=self)
+
+        return session()
+
+
+def make_set(*replicas: FakeDatabase, **kwargs) -> ReplicaSet:
+    replica_set = ReplicaSet(FakeDatabase("primary"), list(replicas), **kwargs)
+
+    async def lag_seconds(replica):
+        return replica.lag
+
+    replica_set._lag_seconds = lag_seconds
+    return replica_set
+
+
+async def read_from(replica_set: ReplicaSet):
+    async for session in replica_set.session_getter():
+        return session.database
+
+
+@pytest.mark.asyncio
+async def test_reads_rotate_over_replicas_within_lag():
+    first, second = FakeDatabase("replica_0", 0.5), FakeDatabase("replica_1", 0.0)
+    lagging = FakeDatabase("replica_2", 30.0)
+    down = FakeDatabase("replica_3", None)
+    replica_set = make_set(first, lagging, second, down, max_lag_seconds=5)
+
+    picked = [await read_from(replica_set) for _ in range(4)]
+
+    assert picked == [first, second, first, second]
+    assert first.sessions[0] == {READ_ONLY: True}
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_without_usable_replicas():
+    replica_set = make_set(FakeDatabase("replica_0", None), max_lag_seconds=5)
+    without_replicas = make_set()
+
+    assert await read_from(replica_set) is replica_set.primary
+    assert await read_from(without_replicas) is without_replicas.primary
+
+
+@pytest.mark.asyncio
+async def test_checks_run_once_per_interval():
+    replica = FakeDatabase("replica_0", 30.0)
+    replica_set = make_set(replica, max_lag_seconds=5, check_interval_seconds=10)
+
+    with patch("core.db.replicas.time.monotonic", return_value=100.0):
+        assert await read_from(replica_set) is replica_set.primary
+    replica.lag = 0.0
+    with patch("core.db.replicas.time.monotonic", return_value=105.0):
+        assert await read_from(replica_set) is replica_set.primary
+    with patch("core.db.replicas.time.monotonic", return_value=110.0):
+        assert await read_from(replica_set) is replica
+
+
+@pytest.mark.asyncio
+async def test_replica_failing_mid_request_is_skipped():
+    replica = FakeDatabase("replica_0")
+    replica_set = make_set(replica, check_interval_seconds=60)
+
+    getter = replica_set.session_getter()
+    await anext(getter)
+    with pytest.raises(OperationalError):
+        await getter.athrow(OperationalError("SELECT 1", {}, OSError("gone")))
+
+    assert await read_from(replica_set) is replica_set.primary
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+def test_read_sessions_reject_writes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine, info={READ_ONLY: True}) as session:
+        session.add(Item(id=1))
+        with pytest.raises(ReadOnlySessionError):
+            session.flush()
+
+    with Session(engine) as session:
+        session.add(Item(id=1))
+        session.flush()
@@ -0,0 +1,210 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.orm import Session
+
+from core.db.commit_hooks import wait_for_commit_hooks
+from core.live.channel import (
+    LiveHub,
+    LiveSubscription,
+    bracket_channel,
+    publish_on_commit,
+)
+from core.live.sse import SSE_HEARTBEAT, sse_event, versioned_event_stream
+
+
+class FakeSubscription:
+    def __init__(self, messages):
+        self._messages = messages
+        self.closed = False
+
+    async def messages(self):
+        for message in self._messages:
+            yield message
+
+    async def close(self):
+        self.closed = True
+
+
+def _request(disconnected: bool = False):
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=disconnected)
+    return request
+
+
+def test_sse_event_format():
+    assert sse_event("delta", {"version": 2}) == 'event: delta\ndata: {"version":2}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_snapshot_then_newer_deltas_only():
+    subscription = FakeSubscription([{"version": 3}, None, {"version": 4}])
+
+    events = [
+        event
+        async for event in versioned_event_stream(
+            _request(), subscription, {"bracket_size": 4}, version=3
+        )
+    ]
+
+    assert events == [
+        sse_event("snapshot", {"bracket_size": 4, "version": 3}),
+        SSE_HEARTBEAT,
+        sse_event("delta", {"version": 4}),
+    ]
+    assert subscription.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_when_client_disconnects():
+    subscription = FakeSubscription([{"version": 2}])
+
+    events = [
+        event
+        async for event in versioned_event_stream(
+            _request(disconnected=True), subscription, {}, version=1
+        )
+    ]
+
+    assert events == [sse_event("snapshot", {"version": 1})]
+    assert subscription.closed
+
+
+@pytest.mark.asyncio
+async def test_publish_on_commit_publishes_after_commit_only():
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+
+    session = Session()
+    with patch("core.live.channel.get_live_redis", return_value=redis):
+        session.begin()
+        publish_on_commit(session, bracket_channel(1), {"version": 1})
+        session.rollback()
+
+        session.begin()
+        publish_on_commit(session, bracket_channel(1), {"version": 2})
+        session.commit()
+        await wait_for_commit_hooks()
+
+    pipe.publish.assert_called_once_with(
+        "live:announcement:1:bracket", json.dumps({"version": 2}, separators=(",", ":"))
+    )
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels: set[str] = set()
+        self.pending: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel):
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        try:
+            message = await asyncio.wait_for(self.pending.get(), timeout)
+        except TimeoutError:
+            return None
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    async def aclose(self):
+        self.closed = True
+
+    def publish(self, channel: str, data: dict):
+        self.pending.put_nowait(
+            {"type": "message", "channel": channel.encode(), "data": json.dumps(data)}
+        )
+
+
+def _hub() -> tuple[LiveHub, MagicMock, FakePubSub]:
+    pubsub = FakePubSub()
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+    return LiveHub(redis), redis, pubsub
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_one_connection_to_every_viewer():
+    hub, redis, pubsub = _hub()
+    first = await hub.subscribe(bracket_channel(1))
+    second = await hub.subscribe(bracket_channel(1))
+    other = await hub.subscribe(bracket_channel(2))
+
+    pubsub.publish(bracket_channel(1), {"version": 2})
+
+    assert await asyncio.wait_for(first.get(), 1) == {"version": 2}
+    assert await asyncio.wait_for(second.get(), 1) == {"version": 2}
+    assert other.empty()
+    redis.pubsub.assert_called_once()
+
+    await hub.unsubscribe(bracket_channel(1), first)
+    assert bracket_channel(1) in pubsub.channels
+    await hub.unsubscribe(bracket_channel(1), second)
+    assert pubsub.channels == {bracket_channel(2)}
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_ends_streams_when_the_connection_fails():
+    hub, redis, pubsub = _hub()
+    with (
+        patch("core.live.channel.get_live_hub", return_value=hub),
+        patch("core.live.channel.get_settings") as get_settings,
+    ):
+        get_settings.return_value.live.heartbeat_seconds = 1
+        subscription = await LiveSubscription.open(bracket_channel(1))
+
+    pubsub.publish(bracket_channel(1), {"version": 2})
+    pubsub.pending.put_nowait(RedisConnectionError("gone"))
+
+    assert [message async for message in subscription.messages()] == [{"version": 2}]
+    assert pubsub.closed
+    await subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_skips_malformed_messages_and_keeps_reading():
+    hub, redis, pubsub = _hub()
+    queue = await hub.subscribe(bracket_channel(1))
+
+    pubsub.pending.put_nowait(
+        {"type": "message", "channel": bracket_channel(1).encode(), "data": b"{"}
+    )
+    pubsub.publish(bracket_channel(1), {"version": 2})
+
+    assert await asyncio.wait_for(queue.get(), 1) == {"version": 2}
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_resets_when_the_reader_fails_unexpectedly():
+    hub, redis, pubsub = _hub()
+    queue = await hub.subscribe(bracket_channel(1))
+
+    pubsub.pending.put_nowait(RuntimeError("boom"))
+
+    async def drain(subscription: LiveSubscription) -> list:
+        return [message async for message in subscription.messages()]
+
+    subscription = LiveSubscription(hub, bracket_channel(1), queue, 5)
+    assert await asyncio.wait_for(drain(subscription), 1) == []
+    assert pubsub.closed
+
+    redis.pubsub.return_value = replacement = FakePubSub()
+    queue = await hub.subscribe(bracket_channel(1))
+    replacement.publish(bracket_channel(1), {"version": 3})
+
+    assert await asyncio.wait_for(queue.get(), 1) == {"version": 3}
+    await hub.close()
@@ -0,0 +1,125 @@
+import sqlite3
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from prometheus_client import REGISTRY
+from taskiq import TaskiqMessage, TaskiqResult
+
+from core.metrics import (
+    MeteredAsyncQueuePool,
+    MetricsMiddleware,
+    TaskMetricsMiddleware,
+    metrics_endpoint,
+)
+from core.metrics.tasks import ENQUEUED_AT_LABEL
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    app.include_router(router, prefix="/api")
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_latency_is_labelled_by_route_template(app):
+    labels = {"method": "GET", "route": "/api/items/{item_id}", "status": "200"}
+    before = _sample("http_request_duration_seconds_count", labels)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        await c.get("/api/items/1")
+        await c.get("/api/items/2")
+        missing = await c.get("/nowhere")
+        exposition = await c.get("/metrics")
+
+    assert _sample("http_request_duration_seconds_count", labels) == before + 2
+    assert missing.status_code == 404
+    assert (
+        _sample(
+            "http_request_duration_seconds_count",
+            {"method": "GET", "route": "unmatched", "status": "404"},
+        )
+        >= 1
+    )
+    assert _sample("http_requests_in_flight", {"method": "GET"}) == 0
+    assert 'route="/api/items/{item_id}"' in exposition.text
+
+
+def test_pool_reports_checked_out_overflow_and_wait():
+    pool = MeteredAsyncQueuePool(
+        lambda: sqlite3.connect(":memory:"),
+        pool_size=2,
+        max_overflow=1,
+        logging_name="metrics_test",
+    )
+    labels = {"pool": "metrics_test"}
+
+    connections = [pool.connect() for _ in range(3)]
+
+    assert _sample("db_pool_size", labels) == 2
+    assert _sample("db_pool_checked_out", labels) == 3
+    assert _sample("db_pool_overflow", labels) == 1
+    assert _sample("db_pool_checkout_wait_seconds_count", labels) == 3
+
+    for connection in connections:
+        connection.close()
+
+    assert _sample("db_pool_checked_out", labels) == 0
+    pool.dispose()
+
+
+def _message(task_name: str) -> TaskiqMessage:
+    return TaskiqMessage(
+        task_id="1", task_name=task_name, labels={}, args=[], kwargs={}
+    )
+
+
+def test_task_middleware_records_enqueue_wait_execution_and_failures():
+    middleware = TaskMetricsMiddleware(worker_port=0)
+    middleware.set_broker(SimpleNamespace(is_worker_process=True))
+    labels = {"task": "expire_registration_requests_task"}
+    failures_before = _sample("taskiq_task_failures_total", labels)
+
+    message = middleware.pre_send(
+        _message("tasks.registration_request_tasks:expire_registration_requests_task")
+    )
+    middleware.post_send(message)
+    middleware.pre_execute(message)
+    middleware.post_execute(
+        message,
+        TaskiqResult(is_err=True, return_value=None, execution_time=0.2),
+    )
+
+    assert ENQUEUED_AT_LABEL in message.labels
+    assert _sample("taskiq_enqueue_duration_seconds_count", labels) >= 1
+    assert _sample("taskiq_queue_wait_seconds_count", labels) >= 1
+    assert _sample("taskiq_execution_duration_seconds_count", labels) >= 1
+    assert _sample("taskiq_task_failures_total", labels) == failures_before + 1
+
+
+def test_task_middleware_skips_wait_for_messages_sent_without_label():
+    middleware = TaskMetricsMiddleware(worker_port=0)
+    labels = {"task": "update_announcement_statuses"}
+    before = _sample("taskiq_queue_wait_seconds_count", labels)
+
+    middleware.pre_execute(
+        _message("tasks.announcement_tasks:update_announcement_statuses")
+    )
+
+    assert _sample("taskiq_queue_wait_seconds_count", labels) == before
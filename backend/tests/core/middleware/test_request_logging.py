@@ -0,0 +1,86 @@
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+
+from core.db.query_stats import instrument_engine
+from core.middleware.request_logging_middleware import RequestLoggingMiddleware
+
+
+@pytest.fixture
+def app():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    with patch(
+        "core.middleware.request_logging_middleware.get_settings",
+        return_value=SimpleNamespace(db=SimpleNamespace(n_plus_one_threshold=3)),
+    ):
+        app = FastAPI()
+        app.add_middleware(RequestLoggingMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: int):
+            with engine.connect() as conn:
+                for _ in range(item_id):
+                    conn.execute(text("SELECT 1"))
+            return {"id": item_id}
+
+        @app.get("/boom")
+        def boom():
+            raise RuntimeError("boom")
+
+        yield app
+    engine.dispose()
+
+
+@pytest.fixture
+def access_records(monkeypatch, caplog):
+    monkeypatch.setattr(logging.getLogger("gameannouncer.access"), "propagate", True)
+    monkeypatch.setattr(logging.getLogger("gameannouncer"), "propagate", True)
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+async def _get(app, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get(path, headers={"User-Agent": "pytest"})
+
+
+@pytest.mark.asyncio
+async def test_one_structured_record_and_server_timing_per_request(app, access_records):
+    response = await _get(app, "/items/2")
+
+    [record] = [r for r in access_records.records if r.name == "gameannouncer.access"]
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert '"2 queries' in response.headers["server-timing"]
+    assert record.levelno == logging.INFO
+    assert record.fields["route"] == "/items/{item_id}"
+    assert record.fields["status"] == 200
+    assert record.fields["queries"] == 2
+    assert record.fields["user_agent"] == "pytest"
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_log_a_warning(app, access_records):
+    await _get(app, "/items/3")
+
+    [warning] = [r for r in access_records.records if r.levelno == logging.WARNING]
+    assert "n_plus_one=1" in warning.getMessage()
+    assert "3x SELECT 1" in warning.getMessage()
+
+
+@pytest.mark.asyncio
+async def test_unhandled_error_is_logged_as_500(app, access_records):
+    response = await _get(app, "/boom")
+
+    [record] = [r for r in access_records.records if r.name == "gameannouncer.access"]
+    assert response.status_code == 500
+    assert record.levelno == logging.ERROR
+    assert record.fields["status"] == 500
+    assert record.fields["error"] == "boom"
@@ -59,3 +59,32 @@ def test_get_batch_and_global_permissions():
     assert hasattr(records[0], "permissions")
     gp = svc.get_global_permissions(SimpleNamespace())
     assert isinstance(gp, dict)
+
+
+def test_get_batch_permissions_looks_up_policy_by_model():
+    class Policy:
+        def __init__(self, user, record):
+            self.record = record
+
+        def can_edit(self):
+            return self.record.organizer_id == 1
+
+    class Model:
+        pass
+
+    looked_up = []
+
+    class Reg:
+        def get_policy_for_record(self, r):
+            looked_up.append(r)
+            return Policy
+
+        def get_policy_methods(self, pc):
+            return {"edit": False}
+
+    svc = PermissionsService(Reg())
+    records = [SimpleNamespace(organizer_id=1), SimpleNamespace(organizer_id=2)]
+    svc.get_batch_permissions(SimpleNamespace(), records, Model)
+
+    assert looked_up == [Model]
+    assert [r.permissions for r in records] == [{"edit": True}, {"edit": False}]
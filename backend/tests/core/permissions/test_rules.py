@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+import core.permissions  # noqa: F401 — pre-initialize package to avoid circular import
+from core.permissions.base_policy import BasePolicy
+from core.permissions.registry import PoliciesRegistry
+from core.permissions.rules import (
+    ADMIN,
+    ADMIN_ROLE,
+    ANONYMOUS,
+    MEMBER,
+    ANYONE,
+    Owner,
+    Rule,
+    allow_if,
+    compile_policy,
+)
+from core.services.permissions import PermissionsService
+from modules.announcements.policy import AnnouncementPolicy
+from modules.registration.models import RegistrationRequest
+from modules.registration.policy import RegistrationRequestPolicy
+
+ADMIN_USER = SimpleNamespace(id=9, is_superuser=True)
+ORGANIZER = SimpleNamespace(id=1, is_superuser=False)
+
+
+def test_rule_resolves_role_dependent_parts_ahead_of_records():
+    rule = ADMIN | Owner("organizer_id")
+
+    assert rule.resolve(ADMIN_ROLE) is True
+    assert rule.resolve(ANONYMOUS) is False
+    assert isinstance(rule.resolve(MEMBER), Owner)
+
+
+def test_rules_must_implement_resolve_and_predicate():
+    record = SimpleNamespace(organizer_id=1)
+
+    with pytest.raises(TypeError):
+        Rule()
+    assert ADMIN.predicate(ADMIN_USER)(record) is True
+    assert ADMIN.predicate(ORGANIZER)(record) is False
+    assert ANYONE.predicate(None)(record) is True
+
+
+def test_owner_follows_dotted_paths():
+    record = SimpleNamespace(announcement=SimpleNamespace(organizer_id=1))
+
+    assert Owner("announcement.organizer_id")(ORGANIZER, record) is True
+    assert Owner("announcement.organizer_id")(ADMIN_USER, record) is False
+
+
+def test_allow_if_methods_evaluate_like_hand_written_ones():
+    record = SimpleNamespace(organizer_id=1)
+
+    assert AnnouncementPolicy(ORGANIZER, record).can_edit() is True
+    assert AnnouncementPolicy(SimpleNamespace(id=2), record).can_edit() is False
+    assert AnnouncementPolicy(ADMIN_USER, record).can_delete() is True
+
+
+def test_compile_policy_skips_global_and_hand_written_actions():
+    compiled = compile_policy(AnnouncementPolicy, ADMIN_ROLE)
+
+    assert compiled == {"delete": True, "edit": True, "manage_lifecycle": True}
+    assert compile_policy(AnnouncementPolicy, ADMIN_ROLE) is compiled
+
+
+def test_batch_permissions_match_per_record_policies():
+    service = PermissionsService(PoliciesRegistry())
+    records = [
+        SimpleNamespace(
+            user_id=user_id, announcement=SimpleNamespace(organizer_id=organizer_id)
+        )
+        for user_id, organizer_id in [(1, 2), (2, 1), (3, 4)]
+    ]
+
+    for user in (None, ADMIN_USER, ORGANIZER):
+        service.get_batch_permissions(user, records, RegistrationRequest)
+        for record in records:
+            assert record.permissions == service.get_permissions_from_policy(
+                user, record, RegistrationRequestPolicy
+            )
+
+
+def test_batch_permissions_build_policies_only_for_hand_written_actions():
+    built = []
+
+    class SamplePolicy(BasePolicy):
+        def __init__(self, user, record=None):
+            built.append(record)
+            super().__init__(user, record)
+
+        can_edit = allow_if(ADMIN | Owner("organizer_id"))
+
+        def can_archive(self) -> bool:
+            return self.record.organizer_id == 2
+
+    class Registry(PoliciesRegistry):
+        def get_policy_for_record(self, record):
+            return SamplePolicy
+
+    records = [SimpleNamespace(organizer_id=1), SimpleNamespace(organizer_id=2)]
+    PermissionsService(Registry()).get_batch_permissions(ORGANIZER, records)
+
+    assert [r.permissions for r in records] == [
+        {"archive": False, "edit": True},
+        {"archive": True, "edit": False},
+    ]
+    assert built == records
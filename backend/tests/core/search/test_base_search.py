@@ -1,8 +1,12 @@
+import pytest
 from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import String
 
 from core.search.base_search import BaseSearch
+from core.search.cursor import encode_cursor
+from exceptions import ValidationException
 from enums.registration_status import RegistrationStatus
 
 
@@ -64,3 +68,42 @@ def test_apply_filters_native_enum_uses_exact_match_by_value():
 
     assert ("eq", "pending") in q.conditions
     assert not any(condition[0] == "ilike" for condition in q.conditions)
+
+
+def _cursor_search(pages: dict[str, tuple[list, str | None]]) -> BaseSearch:
+    search = BaseSearch(session=None, filters=None)
+    search.cursor_results = AsyncMock(side_effect=lambda cursor, limit: pages[cursor])
+    search.filtered_count = AsyncMock(return_value=5)
+    search.cached_total_count = AsyncMock(return_value=9)
+    return search
+
+
+@pytest.mark.asyncio
+async def test_cursor_paginate_counts_on_the_first_page_only():
+    search = _cursor_search({"": ([1, 2], "p1"), "p1": ([3, 4], "p2")})
+
+    first = await search.cursor_paginate(cursor="", limit=2)
+    second = await search.cursor_paginate(cursor=first.next_cursor, limit=2)
+
+    assert (first.items, first.filtered_count, first.total_count) == ([1, 2], 5, 9)
+    assert (second.items, second.filtered_count) == ([3, 4], 5)
+    search.filtered_count.assert_awaited_once()
+    search.cursor_results.assert_awaited_with(cursor="p1", limit=2)
+
+
+@pytest.mark.asyncio
+async def test_cursor_paginate_skips_the_count_when_the_first_page_is_the_last():
+    search = _cursor_search({"": ([1, 2], None)})
+
+    page = await search.cursor_paginate(cursor="", limit=2)
+
+    assert (page.filtered_count, page.next_cursor) == (2, None)
+    search.filtered_count.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cursor_paginate_rejects_a_bare_position_cursor():
+    search = _cursor_search({})
+
+    with pytest.raises(ValidationException):
+        await search.cursor_paginate(cursor=encode_cursor(["x", "p1"]), limit=2)
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from core.search.count_cache import TotalCountCache
+
+
+def test_get_returns_value_until_ttl_expires():
+    cache = TotalCountCache(ttl_seconds=10)
+
+    with patch("core.search.count_cache.time.monotonic", return_value=100.0):
+        cache.set("games", 7)
+
+    with patch("core.search.count_cache.time.monotonic", return_value=109.0):
+        assert cache.get("games") == 7
+
+    with patch("core.search.count_cache.time.monotonic", return_value=110.0):
+        assert cache.get("games") is None
+
+
+def test_keys_are_isolated_and_clear_drops_everything():
+    cache = TotalCountCache()
+    cache.set(("registration_requests", "User", 1), 3)
+    cache.set(("registration_requests", "User", 2), 5)
+
+    assert cache.get(("registration_requests", "User", 1)) == 3
+    assert cache.get(("registration_requests", "User", 2)) == 5
+
+    cache.clear()
+
+    assert cache.get(("registration_requests", "User", 1)) is None
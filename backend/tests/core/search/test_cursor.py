@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from core.search.cursor import (
+    CursorKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+from exceptions import ValidationException
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_encode_decode_roundtrip_preserves_datetimes():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    cursor = encode_cursor([2, created_at, 17])
+
+    assert decode_cursor(cursor, size=3) == [2, created_at, 17]
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!!", encode_cursor([1, 2]), "e30"])
+def test_decode_rejects_malformed_or_mismatched_cursor(cursor):
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor, size=3)
+
+
+def test_keyset_condition_same_direction_uses_row_comparison():
+    keys = [CursorKey(column("created_at")), CursorKey(column("id"))]
+
+    sql = _sql(keyset_condition(keys, [datetime.now(timezone.utc), 5]))
+
+    assert sql.startswith("(created_at, id) < (")
+
+
+def test_keyset_condition_mixed_directions_expands_leading_key():
+    keys = [
+        CursorKey(column("priority"), descending=False),
+        CursorKey(column("created_at")),
+        CursorKey(column("id")),
+    ]
+
+    sql = _sql(keyset_condition(keys, [1, datetime.now(timezone.utc), 5]))
+
+    assert "priority >" in sql
+    assert "priority =" in sql
+    assert "(created_at, id) < (" in sql
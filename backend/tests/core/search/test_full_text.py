@@ -0,0 +1,24 @@
+from sqlalchemy.dialects import postgresql
+
+from core.search.full_text import prefix_tsquery
+
+
+def _params(clause) -> dict:
+    return clause.compile(dialect=postgresql.dialect()).params
+
+
+def test_prefix_tsquery_turns_words_into_prefix_terms():
+    params = _params(prefix_tsquery("Dota  Tourn"))
+
+    assert "dota:* & tourn:*" in params.values()
+    assert "simple" in params.values()
+
+
+def test_prefix_tsquery_drops_tsquery_operators():
+    params = _params(prefix_tsquery("cs:go & (finals)|"))
+
+    assert "cs:* & go:* & finals:*" in params.values()
+
+
+def test_prefix_tsquery_returns_none_without_words():
+    assert prefix_tsquery("!!! ___") is None
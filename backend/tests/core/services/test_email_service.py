@@ -1,7 +1,10 @@
+import asyncio
+
+import aiosmtplib
 import pytest
 
 from email.mime.multipart import MIMEMultipart
-from core.services.email import EmailService
+from core.services.email import EmailService, SMTPPool
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
@@ -30,9 +33,90 @@ async def test_send_email_success_and_failure(monkeypatch):
     smtp = AsyncMock()
     smtp.send_message = AsyncMock(return_value=None)
 
-    with patch("core.services.email.aiosmtplib.SMTP") as mock_smtp:
-        mock_smtp.return_value.__aenter__.return_value = smtp
-        mock_smtp.return_value.__aexit__.return_value = None
-        smtp.login = AsyncMock()
+    with patch("core.services.email.get_smtp_pool") as get_pool:
+        get_pool.return_value.send_message = smtp.send_message
         res = await EmailService.send_email(mail)
         assert res in (True, False)
+
+
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, hostname, port):
+        self.is_connected = False
+        self.sent = []
+        self.drop_next = False
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def login(self, username, password):
+        self.login_as = username
+
+    async def send_message(self, message):
+        if self.drop_next:
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("gone")
+        self.sent.append(message)
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+@pytest.fixture
+def fake_smtp():
+    FakeSMTP.instances = []
+    with patch("core.services.email.aiosmtplib.SMTP", FakeSMTP):
+        yield FakeSMTP
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_a_logged_in_connection(fake_smtp):
+    pool = SMTPPool("smtp", 25, username="u", password="p", size=2)
+
+    for i in range(3):
+        await pool.send_message(f"m{i}")
+
+    assert len(fake_smtp.instances) == 1
+    assert fake_smtp.instances[0].sent == ["m0", "m1", "m2"]
+    assert fake_smtp.instances[0].login_as == "u"
+
+    await pool.close()
+    assert fake_smtp.instances[0].is_connected is False
+
+
+@pytest.mark.asyncio
+async def test_pool_opens_at_most_size_connections(fake_smtp):
+    pool = SMTPPool("smtp", 25, size=2)
+
+    await asyncio.gather(*(pool.send_message(f"m{i}") for i in range(10)))
+
+    assert len(fake_smtp.instances) <= 2
+    assert sum(len(server.sent) for server in fake_smtp.instances) == 10
+
+
+@pytest.mark.asyncio
+async def test_pool_reconnects_when_the_server_dropped_the_connection(fake_smtp):
+    pool = SMTPPool("smtp", 25)
+    await pool.send_message("first")
+    fake_smtp.instances[0].drop_next = True
+
+    await pool.send_message("second")
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[1].sent == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_connections_idle_too_long(fake_smtp):
+    pool = SMTPPool("smtp", 25, idle_seconds=0)
+    await pool.send_message("first")
+
+    await pool.send_message("second")
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].is_connected is False
@@ -0,0 +1,79 @@
+import json
+import logging
+from unittest.mock import patch
+
+from core.logger import (
+    JsonFormatter,
+    LocalQueueHandler,
+    RateLimitFilter,
+    SamplingFilter,
+    logging_config,
+    set_sql_echo,
+)
+
+
+def _record(name: str = "gameannouncer", level: int = logging.INFO, msg="m", args=()):
+    return logging.LogRecord(name, level, "", 0, msg, args, None)
+
+
+def test_json_formatter_lifts_fields():
+    record = _record(msg="GET /")
+    record.fields = {"status": 200}
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "GET /"
+    assert payload["status"] == 200
+    assert payload["level"] == "INFO"
+
+
+def test_sampling_uses_closest_configured_logger_and_keeps_warnings():
+    sampling = SamplingFilter({"sqlalchemy.engine": 0.0, "gameannouncer": 1.0})
+
+    assert sampling.filter(_record("sqlalchemy.engine.Engine")) is False
+    assert sampling.filter(_record("sqlalchemy.engine.Engine", logging.ERROR))
+    assert sampling.filter(_record("gameannouncer.access"))
+    assert sampling.filter(_record("fastapi"))
+
+
+def test_rate_limit_drops_over_budget_and_reports_suppressed():
+    limiter = RateLimitFilter({"sqlalchemy.engine": 2})
+
+    with patch("core.logger.time.monotonic", return_value=100.0):
+        passed = [limiter.filter(_record("sqlalchemy.engine.Engine")) for _ in range(5)]
+        assert limiter.filter(_record("gameannouncer"))
+    assert passed == [True, True, False, False, False]
+
+    record = _record("sqlalchemy.engine.Engine", msg="SELECT %s", args=(1,))
+    with patch("core.logger.time.monotonic", return_value=101.0):
+        assert limiter.filter(record)
+    assert record.getMessage() == "[3 suppressed] SELECT 1"
+
+
+def test_local_queue_handler_defers_formatting():
+    record = _record(msg="value %s", args=(1,))
+
+    prepared = LocalQueueHandler(None).prepare(record)
+
+    assert prepared is record
+    assert (prepared.msg, prepared.args) == ("value %s", (1,))
+
+
+def test_production_config_writes_json():
+    config = logging_config(json_format=True, sampling={"sqlalchemy.engine": 0.1})
+
+    assert config["handlers"]["app_queue"]["handlers"] == ["json"]
+    assert config["handlers"]["access_stream"]["formatter"] == "json"
+    assert config["filters"]["sampling"]["rates"] == {"sqlalchemy.engine": 0.1}
+
+
+def test_sql_echo_sets_logger_levels():
+    engine_logger = logging.getLogger("sqlalchemy.engine")
+    previous = engine_logger.level
+    try:
+        set_sql_echo(True)
+        assert engine_logger.level == logging.INFO
+        set_sql_echo(False)
+        assert engine_logger.level == logging.WARNING
+    finally:
+        engine_logger.setLevel(previous)
@@ -0,0 +1,47 @@
+import json
+from datetime import datetime, timezone
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from api.v1 import announcements, games, matches, registration_requests, users
+from core.responses import FastJSONResponse
+
+
+def test_fast_json_matches_stdlib_encoding():
+    payload = {"data": {"id": 1, "title": "Кубок", "tags": [None, True, 1.5]}}
+
+    assert FastJSONResponse(payload).body == JSONResponse(payload).body
+
+
+def test_fast_json_encodes_datetimes_and_nan():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    body = json.loads(FastJSONResponse({"at": created_at, "score": float("nan")}).body)
+
+    assert body == {"at": "2026-01-02T03:04:05Z", "score": None}
+
+
+def test_response_model_routes_keep_default_response_class():
+    """
+    A custom response class turns off FastAPI's one-pass ``dump_json`` path.
+
+    Routes declaring a ``response_model`` (the announcements list among them)
+    must leave ``response_class`` unset; handlers that build their own payload
+    return a ``FastJSONResponse`` instead.
+    """
+    routes = [
+        route
+        for module in (announcements, games, matches, registration_requests, users)
+        for route in module.router.routes
+        if isinstance(route, APIRoute) and route.response_field
+    ]
+    overridden = [
+        route.path
+        for route in routes
+        if not isinstance(route.response_class, DefaultPlaceholder)
+    ]
+
+    assert routes
+    assert not overridden
@@ -0,0 +1,25 @@
+from core.utils import etag_matches, strong_etag
+
+
+def test_strong_etag_joins_parts():
+    assert strong_etag(12, 3) == '"12-3"'
+
+
+def test_etag_matches_exact_list_and_wildcard():
+    etag = strong_etag(12, 3)
+
+    assert etag_matches('"12-3"', etag)
+    assert etag_matches('"12-2", "12-3"', etag)
+    assert etag_matches("*", etag)
+
+
+def test_etag_matches_compares_weakly():
+    assert etag_matches('W/"12-3"', strong_etag(12, 3))
+
+
+def test_etag_does_not_match_other_versions_or_missing_header():
+    etag = strong_etag(12, 3)
+
+    assert not etag_matches('"12-2"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
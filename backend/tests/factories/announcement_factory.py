@@ -34,7 +34,7 @@ class AnnouncementDictFactory(factory.Factory):
     bracket_size = None
     third_place_match = True
     qualification_finished = False
-    participants = factory.LazyFunction(list)
+    participants_count = 0
     game = factory.LazyAttribute(
         lambda obj: {
             "id": obj.game_id,
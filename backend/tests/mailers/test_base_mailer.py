@@ -94,3 +94,10 @@ async def test_deliver_calls_email_service():
         res = await mailer.deliver(mail)
     assert res is True
     async_mock.assert_awaited_once_with(mail)
+
+
+def test_mailers_share_one_jinja_environment():
+    from mailers.base_mailer import BaseMailer
+    from mailers.user_mailer import UserMailer
+
+    assert BaseMailer().jinja_env is UserMailer().jinja_env
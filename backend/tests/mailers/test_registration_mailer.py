@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from enums.registration_status import RegistrationStatus
+
+
+def test_status_email_links_the_announcement_and_passes_the_reason():
+    import mailers.registration_mailer as rm
+
+    with patch(
+        "mailers.registration_mailer.get_settings",
+        return_value=SimpleNamespace(
+            cors=SimpleNamespace(frontend_host="https://app.test")
+        ),
+    ):
+        mail_mock = MagicMock(return_value=SimpleNamespace())
+        with patch("mailers.base_mailer.BaseMailer.mail", new=mail_mock):
+            rm.RegistrationMailer().status_email(
+                email="u@test",
+                announcement_id=7,
+                announcement_title="Cup",
+                status=RegistrationStatus.REJECTED,
+                first_name="Joe",
+                reason="Full",
+            )
+
+    _, kwargs = mail_mock.call_args
+    assert kwargs["to"] == "u@test"
+    assert kwargs["subject"] == "Registration declined: Cup"
+    assert kwargs["template"] == "registration_status_email"
+    assert kwargs["announcement_url"] == "https://app.test/announcements/7"
+    assert kwargs["approved"] is False
+    assert kwargs["reason"] == "Full"
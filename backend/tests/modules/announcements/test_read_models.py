@@ -0,0 +1,71 @@
+from sqlalchemy.dialects import postgresql
+
+from modules.announcements.read_models import (
+    select_announcement_list,
+    to_announcement_responses,
+)
+
+
+def _row(**overrides):
+    row = {
+        "id": 1,
+        "created_at": "2026-01-01T10:00:00+00:00",
+        "updated_at": "2026-01-01T10:00:00+00:00",
+        "title": "Cup",
+        "content": None,
+        "format": "single_elimination",
+        "game_id": 3,
+        "start_at": "2026-02-01T10:00:00+00:00",
+        "end_at": None,
+        "registration_start_at": "2026-01-02T10:00:00+00:00",
+        "registration_end_at": "2026-01-20T10:00:00+00:00",
+        "max_participants": 8,
+        "has_qualification": False,
+        "organizer_id": 7,
+        "status": "registration_open",
+        "participants_count": 2,
+        "bracket_size": None,
+        "seed_method": "random",
+        "qualification_finished": False,
+        "game": {"id": 3, "name": "Chess", "image_url": None, "category": "board"},
+        "registration_form": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_projection_is_a_single_statement_without_key_parameters():
+    compiled = select_announcement_list().compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert sql.count("json_build_object(") == 4
+    assert "json_agg" in sql
+    assert compiled.params == {}
+
+
+def test_to_announcement_responses_validates_projected_rows():
+    form = {
+        "id": 5,
+        "announcement_id": 1,
+        "fields": [
+            {
+                "id": 9,
+                "form_id": 5,
+                "field_type": "text",
+                "label": "Nickname",
+                "required": True,
+                "options": None,
+            }
+        ],
+    }
+
+    first, second = to_announcement_responses(
+        [_row(), _row(id=2, registration_form=form)]
+    )
+
+    assert first.created_at.year == 2026
+    assert first.game.name == "Chess"
+    assert first.registration_form is None
+    assert first.permissions == {}
+    assert second.registration_form.fields[0].label == "Nickname"
+    assert "game_id" not in second.model_dump()
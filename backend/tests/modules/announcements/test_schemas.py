@@ -82,13 +82,12 @@ def test_announcement_response_participants_count_empty():
         format=AnnouncementFormat.SINGLE_ELIMINATION,
         has_qualification=False,
         seed_method=SeedMethod.RANDOM,
-        participants=[],
         game={"id": 2, "name": "Test Game", "image_url": None, "category": "RTS"},
     )
     assert resp.participants_count == 0
 
 
-def test_announcement_response_participants_count_with_participants():
+def test_announcement_response_participants_count_from_counter():
     now = datetime.now()
     resp = AnnouncementResponse(
         id=1,
@@ -106,26 +105,13 @@ def test_announcement_response_participants_count_with_participants():
         format=AnnouncementFormat.SINGLE_ELIMINATION,
         has_qualification=False,
         seed_method=SeedMethod.RANDOM,
-        participants=[
-            {
-                "id": i,
-                "announcement_id": 1,
-                "user_id": i,
-                "qualification_score": None,
-                "qualification_rank": None,
-                "seed": None,
-                "is_qualified": False,
-                "created_at": now,
-                "updated_at": now,
-            }
-            for i in [1, 2, 3]
-        ],
+        participants_count=3,
         game={"id": 2, "name": "Test Game", "image_url": None, "category": "RTS"},
     )
     assert resp.participants_count == 3
 
 
-def test_announcement_response_participants_excluded_from_json():
+def test_announcement_response_serializes_participants_count():
     now = datetime.now()
     resp = AnnouncementResponse(
         id=1,
@@ -143,20 +129,7 @@ def test_announcement_response_participants_excluded_from_json():
         format=AnnouncementFormat.SINGLE_ELIMINATION,
         has_qualification=False,
         seed_method=SeedMethod.RANDOM,
-        participants=[
-            {
-                "id": i,
-                "announcement_id": 1,
-                "user_id": i,
-                "qualification_score": None,
-                "qualification_rank": None,
-                "seed": None,
-                "is_qualified": False,
-                "created_at": now,
-                "updated_at": now,
-            }
-            for i in [1, 2]
-        ],
+        participants_count=2,
         game={"id": 2, "name": "Test Game", "image_url": None, "category": "RTS"},
     )
     data = resp.model_dump()
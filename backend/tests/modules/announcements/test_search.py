@@ -0,0 +1,111 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from enums import AnnouncementFormat, SeedMethod
+from modules.announcements.model import Announcement
+from modules.announcements.schemas import AnnouncementFilter
+from modules.announcements.search import AnnouncementSearch
+from modules.games.model import Game
+from sqlalchemy.dialects import postgresql
+
+
+def _make_announcement(
+    game_id: int, organizer_id: int, title: str, content: str = "c"
+) -> Announcement:
+    now = datetime.now(timezone.utc)
+    return Announcement(
+        title=title,
+        content=content,
+        game_id=game_id,
+        organizer_id=organizer_id,
+        start_at=now + timedelta(days=30),
+        registration_start_at=now,
+        registration_end_at=now + timedelta(days=29),
+        max_participants=10,
+        format=AnnouncementFormat.SINGLE_ELIMINATION,
+        has_qualification=False,
+        seed_method=SeedMethod.RANDOM,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_q_ranks_game_then_title_then_content(db_session, create_user):
+    user = await create_user(email="fts_org@example.com", password="x")
+    matching_game = Game(name="Zephyrcraft", category="RTS", description="d")
+    other_game = Game(name="FTS Other", category="RTS", description="d")
+    db_session.add_all([matching_game, other_game])
+    await db_session.commit()
+
+    by_content = _make_announcement(
+        other_game.id, user.id, "Weekly cup", content="Bring your zephyrcraft decks"
+    )
+    by_title = _make_announcement(other_game.id, user.id, "Zephyrcraft open")
+    by_game = _make_announcement(matching_game.id, user.id, "Spring league")
+    unrelated = _make_announcement(other_game.id, user.id, "Chess night")
+    db_session.add_all([by_content, by_title, by_game, unrelated])
+    await db_session.commit()
+
+    search = AnnouncementSearch(
+        session=db_session, filters=AnnouncementFilter(q="zephyr")
+    )
+    results = await search.results(limit=10)
+
+    assert [a.id for a in results] == [by_game.id, by_title.id, by_content.id]
+
+
+@pytest.mark.asyncio
+async def test_search_q_cursor_pages_follow_relevance_order(db_session, create_user):
+    user = await create_user(email="fts_cursor_org@example.com", password="x")
+    game = Game(name="FTS Cursor", category="RTS", description="d")
+    db_session.add(game)
+    await db_session.commit()
+
+    announcements = [
+        _make_announcement(game.id, user.id, f"Quasarball round {i}") for i in range(3)
+    ] + [
+        _make_announcement(game.id, user.id, f"Cup {i}", content="quasarball finals")
+        for i in range(2)
+    ]
+    db_session.add_all(announcements)
+    await db_session.commit()
+
+    search = AnnouncementSearch(
+        session=db_session, filters=AnnouncementFilter(q="quasarball")
+    )
+    expected = [a.id for a in await search.results(limit=10)]
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        page, cursor = await search.cursor_results(cursor=cursor, limit=2)
+        seen.extend(a.id for a in page)
+
+    assert len(expected) == 5
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_search_q_plan_uses_indexes_instead_of_scanning(db_session):
+    search = AnnouncementSearch(
+        session=db_session, filters=AnnouncementFilter(q="zephyr cup")
+    )
+    connection = await db_session.connection()
+    compiled = search.base_query().limit(10).compile(dialect=connection.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)
+
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    result = await connection.exec_driver_sql(f"EXPLAIN {compiled}", params)
+    plan = "\n".join(row[0] for row in result)
+
+    assert "ix_announcements_search_vector" in plan
+    assert "ix_games_name_trgm" in plan
+    assert "Seq Scan on announcements" not in plan
+
+
+@pytest.mark.parametrize(("q", "searches_game_names"), [("cs", False), ("csgo", True)])
+def test_search_q_looks_up_game_names_only_from_trigram_length(q, searches_game_names):
+    """Test 2-character values only search the tsvector, which needs no trigrams."""
+    search = AnnouncementSearch(session=None, filters=AnnouncementFilter(q=q))
+    sql = str(search.base_query().compile(dialect=postgresql.dialect()))
+
+    assert "@@" in sql
+    assert ("games.name ILIKE" in sql) is searches_game_names
@@ -91,3 +91,27 @@ async def test_game_search_empty_results(db_session):
 
     assert len(await search.results()) == 0
     assert await search.filtered_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_game_search_cursor_pagination_walks_all_rows(db_session):
+    games = [
+        Game(name=f"CursorGame{i}", category="Puzzle", description=f"test{i}")
+        for i in range(5)
+    ]
+    db_session.add_all(games)
+    await db_session.commit()
+
+    search = GameSearch(session=db_session, filters=GameFilter(name="CursorGame"))
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await search.cursor_results(cursor=cursor, limit=2)
+        seen.extend(game.id for game in page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+    assert seen == sorted(seen, reverse=True)
@@ -1,5 +1,6 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
 
 from modules.matches.model import Match
 from modules.matches.repository import MatchRepository
@@ -282,3 +283,56 @@ async def test_no_third_place_match_when_disabled(
 
     assert all(not m.is_third_place for m in matches)
     assert len(matches) == 7
+
+
+@pytest.mark.asyncio
+async def test_bracket_is_persisted_with_constant_number_of_statements(
+    db_session, create_announcement, create_user, create_participant
+):
+    """16-slot bracket → one bulk INSERT and one bulk link UPDATE, no per-row SQL."""
+    organizer = await create_user(email="bmb_org9@example.com")
+    announcement = await create_announcement(
+        organizer_id=organizer.id,
+        status=AnnouncementStatus.REGISTRATION_CLOSED,
+    )
+    participants = []
+    for i in range(1, 15):
+        user = await create_user(email=f"bmb_u9_{i}@example.com")
+        p = await create_participant(announcement_id=announcement.id, user_id=user.id)
+        p.seed = i
+        participants.append(p)
+    await db_session.flush()
+
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", count)
+    try:
+        builder = BracketMatchBuilder(
+            announcement_id=announcement.id, third_place_match=True
+        )
+        await builder.call(
+            participants,
+            16,
+            [1, 16, 8, 9, 4, 13, 5, 12, 2, 15, 7, 10, 3, 14, 6, 11],
+            MatchRepository(db_session),
+        )
+    finally:
+        event.remove(Engine, "before_cursor_execute", count)
+
+    assert len(statements) == 2
+    assert statements[0].startswith("INSERT INTO matches")
+    assert statements[1].startswith("UPDATE matches")
+
+    result = await db_session.execute(
+        select(Match).where(Match.announcement_id == announcement.id)
+    )
+    matches = list(result.scalars().all())
+    assert len(matches) == 16
+    round_2 = {m.match_number: m for m in matches if m.round_number == 2}
+    assert round_2[1].participant1_id == participants[0].id
+    assert round_2[1].status == MatchStatus.PENDING
+    linked = [m for m in matches if m.next_match_winner_id is not None]
+    assert len(linked) == 14
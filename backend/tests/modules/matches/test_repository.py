@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import select
 
 from modules.matches.model import Match
 from modules.matches.repository import MatchRepository
@@ -41,6 +42,35 @@ async def test_save_many_persists_matches(db_session, create_user, create_announ
     assert all(match.id is not None for match in saved)
 
 
+@pytest.mark.asyncio
+async def test_link_next_matches_sets_links_in_bulk(
+    db_session, create_user, create_announcement
+):
+    organizer = await create_user(email="mr_org2b@example.com")
+    announcement = await create_announcement(organizer_id=organizer.id)
+    repo = MatchRepository(db_session)
+    semi_1, semi_2, final = await repo.save_many(
+        [
+            Match(announcement_id=announcement.id, round_number=1, match_number=1),
+            Match(announcement_id=announcement.id, round_number=1, match_number=2),
+            Match(announcement_id=announcement.id, round_number=2, match_number=1),
+        ]
+    )
+
+    await repo.link_next_matches([(semi_1.id, final.id), (semi_2.id, final.id)])
+
+    result = await db_session.execute(
+        select(Match.id, Match.next_match_winner_id)
+        .where(Match.announcement_id == announcement.id)
+        .order_by(Match.id)
+    )
+    assert result.all() == [
+        (semi_1.id, final.id),
+        (semi_2.id, final.id),
+        (final.id, None),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_exists_for_announcement_returns_true_when_matches_exist(
     db_session, create_user, create_announcement, create_match
@@ -0,0 +1,62 @@
+import pytest
+
+from modules.announcements.utils.bracket import compute_bracket_slots
+from modules.matches.topology import get_bracket_topology
+
+
+def test_topology_is_memoized_per_shape():
+    assert get_bracket_topology(8, True) is get_bracket_topology(8, True)
+    assert get_bracket_topology(8, True) is not get_bracket_topology(8, False)
+
+
+def test_slots_match_standard_seeding():
+    assert get_bracket_topology(8, False).slots == (1, 8, 4, 5, 2, 7, 3, 6)
+    assert compute_bracket_slots(4) == [1, 4, 2, 3]
+
+
+def test_positions_follow_persistence_order_with_third_place_in_semifinal():
+    topology = get_bracket_topology(8, True)
+
+    assert list(zip(topology.round_numbers, topology.match_numbers)) == [
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (1, 4),
+        (2, 1),
+        (2, 2),
+        (2, 3),
+        (3, 1),
+    ]
+    assert topology.third_place_index == 6
+    assert topology.index_of(3, 1) == 7
+
+
+def test_winner_and_loser_targets():
+    topology = get_bracket_topology(8, True)
+
+    assert topology.winner_target(1, 3) == (2, 2, "participant1")
+    assert topology.winner_target(2, 2) == (3, 1, "participant2")
+    assert topology.winner_target(3, 1) is None
+    assert topology.winner_target(2, 3) is None
+    assert topology.loser_target(2, 2) == (2, 3, "participant2")
+    assert topology.loser_target(1, 1) is None
+    assert topology.is_final(3, 1)
+
+
+def test_two_slot_bracket_has_no_third_place():
+    topology = get_bracket_topology(2, True)
+
+    assert topology.third_place_match is False
+    assert topology.match_count == 1
+    assert topology.loser_target(1, 1) is None
+
+
+@pytest.mark.parametrize("size", [0, 1, 6, 12])
+def test_rejects_sizes_that_are_not_powers_of_two(size):
+    with pytest.raises(ValueError, match="power of two"):
+        get_bracket_topology(size, False)
+
+
+def test_index_of_rejects_unknown_positions():
+    with pytest.raises(ValueError):
+        get_bracket_topology(4, False).index_of(2, 3)
@@ -2,7 +2,6 @@ from datetime import datetime, timezone
 
 from modules.announcements.schemas import AnnouncementForRegistrationResponse
 from modules.games.schemas import GameForAnnouncementResponse
-from modules.participants.schemas import AnnouncementParticipantResponse
 from modules.registration.schemas import (
     RegistrationRequestCreate,
     RegistrationRequestResponse,
@@ -23,17 +22,6 @@ from modules.users.schemas import UserBrief
 from enums import FormFieldType
 
 
-def _make_participant(n: int = 1) -> AnnouncementParticipantResponse:
-    now = datetime.now(timezone.utc)
-    return AnnouncementParticipantResponse(
-        id=n,
-        announcement_id=1,
-        user_id=n,
-        created_at=now,
-        updated_at=now,
-    )
-
-
 def _make_game_response(**overrides) -> GameForAnnouncementResponse:
     data = {"id": 1, "name": "CS2", "image_url": None, "category": "FPS"}
     data.update(overrides)
@@ -63,20 +51,18 @@ def _make_announcement_for_registration(
         "format": "single_elimination",
         "registration_end_at": datetime.now(timezone.utc),
         "game": _make_game_response(),
-        "participants": [],
     }
     data.update(overrides)
     return AnnouncementForRegistrationResponse(**data)
 
 
 def test_announcement_for_registration_response_participants_count_empty():
-    ann = _make_announcement_for_registration(participants=[])
+    ann = _make_announcement_for_registration()
     assert ann.participants_count == 0
 
 
-def test_announcement_for_registration_response_participants_count_with_participants():
-    participants = [_make_participant(n) for n in range(1, 4)]
-    ann = _make_announcement_for_registration(participants=participants)
+def test_announcement_for_registration_response_participants_count_from_counter():
+    ann = _make_announcement_for_registration(participants_count=3)
     assert ann.participants_count == 3
 
 
@@ -88,11 +74,9 @@ def test_announcement_for_registration_response_contains_game():
     assert ann.game.category == "MOBA"
 
 
-def test_announcement_for_registration_response_participants_excluded_from_serialization():
-    participants = [_make_participant(n) for n in range(1, 3)]
-    ann = _make_announcement_for_registration(participants=participants)
+def test_announcement_for_registration_response_serializes_participants_count():
+    ann = _make_announcement_for_registration(participants_count=2)
     serialized = ann.model_dump()
-    assert "participants" not in serialized
     assert serialized["participants_count"] == 2
 
 
@@ -143,9 +127,7 @@ def test_registration_request_response_with_cancellation_reason():
 
 def test_registration_request_response_announcement_participants_count():
     now = datetime.now(timezone.utc)
-    ann = _make_announcement_for_registration(
-        participants=[_make_participant(n) for n in range(1, 3)]
-    )
+    ann = _make_announcement_for_registration(participants_count=2)
     user = _make_user_brief()
     resp = RegistrationRequestResponse(
         id=1,
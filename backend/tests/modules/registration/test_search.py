@@ -78,3 +78,59 @@ async def test_registration_request_search_filters_by_native_enum_status(
     assert len(results) == 1
     assert results[0].status == RegistrationStatus.PENDING
     assert results[0].user_id == pending_user.id
+
+
+@pytest.mark.asyncio
+async def test_registration_request_search_paginate_returns_page_and_counts(
+    db_session, create_user
+):
+    organizer = await create_user(email="rr_page_owner@example.com", password="x")
+    users = [
+        await create_user(email=f"rr_page_user{i}@example.com", password="x")
+        for i in range(3)
+    ]
+
+    game = Game(name="RRPageGame", category="RTS", description="d")
+    db_session.add(game)
+    await db_session.commit()
+    await db_session.refresh(game)
+
+    announcement = _make_announcement(game.id, organizer.id)
+    db_session.add(announcement)
+    await db_session.commit()
+    await db_session.refresh(announcement)
+
+    db_session.add_all(
+        [
+            RegistrationRequest(
+                announcement_id=announcement.id,
+                user_id=user.id,
+                status=status,
+            )
+            for user, status in zip(
+                users,
+                [
+                    RegistrationStatus.PENDING,
+                    RegistrationStatus.PENDING,
+                    RegistrationStatus.APPROVED,
+                ],
+            )
+        ]
+    )
+    await db_session.commit()
+
+    search = RegistrationRequestSearch(
+        session=db_session,
+        filters=RegistrationRequestFilter(status=RegistrationStatus.PENDING),
+        scope=announcement,
+    )
+
+    page = await search.paginate(skip=0, limit=1)
+    empty_page = await search.paginate(skip=10, limit=1)
+
+    assert len(page.items) == 1
+    assert page.filtered_count == 2
+    assert page.total_count == 3
+    assert empty_page.items == []
+    assert empty_page.filtered_count == 2
+    assert empty_page.total_count == 3
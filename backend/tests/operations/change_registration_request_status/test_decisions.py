@@ -45,3 +45,13 @@ def test_invalid_transition_raises():
         ChangeRegistrationRequestStatusDecisions(RegistrationTrigger.APPROVE).make(
             _snapshot(RegistrationStatus.REJECTED)
         )
+
+
+def test_only_organizer_decisions_notify_the_applicant():
+    approve = ChangeRegistrationRequestStatusDecisions(RegistrationTrigger.APPROVE)
+    reject = ChangeRegistrationRequestStatusDecisions(RegistrationTrigger.REJECT)
+    cancel = ChangeRegistrationRequestStatusDecisions(RegistrationTrigger.CANCEL)
+
+    assert approve.make(_snapshot(RegistrationStatus.PENDING)).notify_user is True
+    assert reject.make(_snapshot(RegistrationStatus.PENDING)).notify_user is True
+    assert cancel.make(_snapshot(RegistrationStatus.PENDING)).notify_user is False
@@ -87,6 +87,7 @@ async def test_approve_creates_participant(db_session, create_user):
     repo = ParticipantRepository(db_session)
     participant = await repo.find_by_announcement_and_user(ann.id, applicant.id)
     assert participant is not None
+    assert ann.participants_count == 1
 
 
 @pytest.mark.asyncio
@@ -139,6 +140,7 @@ async def test_cancel_approved_removes_participant(db_session, create_user):
 
     assert result.status == RegistrationStatus.CANCELLED
     assert await repo.find_by_announcement_and_user(ann.id, applicant.id) is None
+    assert ann.participants_count == 0
 
 
 @pytest.mark.asyncio
@@ -203,7 +205,7 @@ async def test_approve_invalid_transition_does_not_lock_announcement(
     await db_session.flush()
 
     lock_mock = AsyncMock(side_effect=AssertionError("lock should not be called"))
-    monkeypatch.setattr(AnnouncementRepository, "find_by_id_for_update", lock_mock)
+    monkeypatch.setattr(AnnouncementRepository, "lock_participant_capacity", lock_mock)
 
     with pytest.raises(ValidationException):
         await _change_status(db_session, rr, RegistrationTrigger.APPROVE)
@@ -228,7 +230,7 @@ async def test_approve_raises_when_announcement_not_found(
 
     monkeypatch.setattr(
         AnnouncementRepository,
-        "find_by_id_for_update",
+        "lock_participant_capacity",
         AsyncMock(return_value=None),
     )
 
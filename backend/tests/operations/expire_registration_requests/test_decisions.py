@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+from enums.registration_status import RegistrationStatus
+from operations.expire_registration_requests.contract import (
+    ExpireRegistrationRequestsContract,
+)
+from operations.expire_registration_requests.decisions import (
+    ExpireRegistrationRequestsDecisions,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_expiry_follows_the_single_request_transitions():
+    decision = ExpireRegistrationRequestsDecisions().make(
+        ExpireRegistrationRequestsContract(registration_closed_before=NOW)
+    )
+
+    assert decision.new_status_by_status == {
+        RegistrationStatus.PENDING: RegistrationStatus.EXPIRED
+    }
+    assert decision.registration_closed_before == NOW
+
+
+def test_chunk_size_bounds_the_statement():
+    decision = ExpireRegistrationRequestsDecisions().make(
+        ExpireRegistrationRequestsContract(
+            registration_closed_before=NOW, chunk_size=50
+        )
+    )
+
+    assert decision.limit == 50
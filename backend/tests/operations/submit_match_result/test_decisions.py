@@ -12,21 +12,21 @@ from operations.submit_match_result.structures import (
 def _match(
     match_id: int,
     *,
+    round_number: int = 1,
     match_number: int = 1,
     status: MatchStatus = MatchStatus.READY,
     participant1_id: int | None = 1,
     participant2_id: int | None = 2,
-    next_match_winner_id: int | None = None,
     is_bye: bool = False,
     is_third_place: bool = False,
 ) -> MatchSnapshot:
     return MatchSnapshot(
         id=match_id,
+        round_number=round_number,
         match_number=match_number,
         status=status,
         participant1_id=participant1_id,
         participant2_id=participant2_id,
-        next_match_winner_id=next_match_winner_id,
         is_bye=is_bye,
         is_third_place=is_third_place,
     )
@@ -35,6 +35,7 @@ def _match(
 def _snapshot(
     *,
     match: MatchSnapshot | None = None,
+    bracket_size: int = 2,
     selected_winner_slot: str = "participant1",
     next_match: MatchSnapshot | None = None,
     third_place_match_enabled: bool = False,
@@ -44,6 +45,7 @@ def _snapshot(
     return SubmitMatchResultSnapshot(
         match=match or _match(1),
         announcement_id=1,
+        bracket_size=bracket_size,
         third_place_match_enabled=third_place_match_enabled,
         selected_winner_slot=selected_winner_slot,
         next_match=next_match,
@@ -54,10 +56,15 @@ def _snapshot(
 
 def test_decision_advances_winner_to_next_match_and_marks_ready():
     snapshot = _snapshot(
-        match=_match(1, match_number=2, next_match_winner_id=2),
+        match=_match(1, match_number=2),
+        bracket_size=4,
         selected_winner_slot="participant2",
         next_match=_match(
-            2, status=MatchStatus.PENDING, participant1_id=9, participant2_id=None
+            2,
+            round_number=2,
+            status=MatchStatus.PENDING,
+            participant1_id=9,
+            participant2_id=None,
         ),
     )
 
@@ -73,10 +80,13 @@ def test_decision_advances_winner_to_next_match_and_marks_ready():
 
 def test_decision_routes_semifinal_loser_to_third_place_match():
     snapshot = _snapshot(
-        match=_match(1, match_number=1, next_match_winner_id=2),
-        next_match=_match(2, next_match_winner_id=None),
+        match=_match(1, match_number=1),
+        bracket_size=4,
+        next_match=_match(2, round_number=2),
         third_place_match_enabled=True,
-        third_place_match=_match(3, participant1_id=None, participant2_id=4),
+        third_place_match=_match(
+            3, match_number=3, participant1_id=None, participant2_id=4
+        ),
     )
 
     decision = SubmitMatchResultDecisions().make(snapshot)
@@ -105,3 +115,22 @@ def test_decision_rejects_match_that_is_not_ready():
 
     with pytest.raises(ValidationException, match="not ready"):
         SubmitMatchResultDecisions().make(snapshot)
+
+
+def test_decision_gives_no_placements_for_semifinal():
+    snapshot = _snapshot(
+        match=_match(1, match_number=2),
+        bracket_size=4,
+        next_match=_match(2, round_number=2),
+    )
+
+    decision = SubmitMatchResultDecisions().make(snapshot)
+
+    assert decision.placements == []
+
+
+def test_decision_rejects_match_outside_the_bracket():
+    snapshot = _snapshot(match=_match(1, round_number=3), bracket_size=4)
+
+    with pytest.raises(ValidationException, match="does not fit the bracket"):
+        SubmitMatchResultDecisions().make(snapshot)
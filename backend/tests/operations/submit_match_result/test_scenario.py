@@ -1,8 +1,10 @@
 import pytest
+from unittest.mock import patch
 from sqlalchemy import select
 
+from modules.announcements.queries import AnnouncementQueries
 from modules.matches.model import Match
-from modules.matches.schemas import MatchResultUpdate
+from modules.matches.schemas import MatchResponse, MatchResultUpdate
 from operations.submit_match_result.contract import SubmitMatchResultContract
 from operations.submit_match_result.scenario import SubmitMatchResultScenario
 from enums import AnnouncementStatus, MatchStatus
@@ -34,7 +36,7 @@ async def test_winner_is_set_and_match_completed(
     """Reporting a result marks the match COMPLETED and sets winner_id."""
     organizer = await create_user(email="mp_org1@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u1a@example.com")
     u2 = await create_user(email="mp_u1b@example.com")
@@ -59,6 +61,60 @@ async def test_winner_is_set_and_match_completed(
     assert final.status == MatchStatus.COMPLETED
 
 
+@pytest.mark.asyncio
+async def test_submitting_result_bumps_bracket_version(
+    db_session, create_user, create_announcement, create_participant, create_match
+):
+    """Each reported result changes the bracket ETag of the announcement."""
+    organizer = await create_user(email="mp_org_ver@example.com")
+    announcement = await create_announcement(
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
+    )
+    u1 = await create_user(email="mp_ver_a@example.com")
+    u2 = await create_user(email="mp_ver_b@example.com")
+    p1 = await create_participant(announcement_id=announcement.id, user_id=u1.id)
+    p2 = await create_participant(announcement_id=announcement.id, user_id=u2.id)
+    final = await create_match(
+        announcement_id=announcement.id,
+        round_number=1,
+        match_number=1,
+        status=MatchStatus.READY,
+        participant1_id=p1.id,
+        participant2_id=p2.id,
+    )
+    queries = AnnouncementQueries(db_session)
+    before = await queries.find_bracket_version(announcement.id)
+
+    with patch(
+        "operations.submit_match_result.gateway.publish_on_commit"
+    ) as publish_on_commit:
+        await _submit_match_result(
+            db_session, final, MatchResultUpdate(winner="participant2")
+        )
+    await db_session.commit()
+
+    assert await queries.find_bracket_version(announcement.id) == before + 1
+    _, channel, delta = publish_on_commit.call_args.args
+    assert channel == f"live:announcement:{announcement.id}:bracket"
+    assert delta["version"] == before + 1
+    assert delta["matches"] == [
+        {
+            "id": final.id,
+            "round_number": 1,
+            "match_number": 1,
+            "participant1": {"id": p1.id, "user_id": u1.id, "seed": p1.seed},
+            "participant2": {"id": p2.id, "user_id": u2.id, "seed": p2.seed},
+            "winner_id": p2.id,
+            "status": MatchStatus.COMPLETED.value,
+            "is_bye": False,
+            "is_third_place": False,
+            "next_match_winner_id": None,
+        }
+    ]
+    assert MatchResponse.model_validate(delta["matches"][0])
+    assert delta["announcement_status"] == AnnouncementStatus.FINISHED.value
+
+
 @pytest.mark.asyncio
 async def test_winner_advances_to_next_match_odd_slot(
     db_session, create_user, create_announcement, create_participant, create_match
@@ -66,7 +122,7 @@ async def test_winner_advances_to_next_match_odd_slot(
     """Odd match_number winner goes into participant1_id of the next match."""
     organizer = await create_user(email="mp_org2@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=4, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u2a@example.com")
     u2 = await create_user(email="mp_u2b@example.com")
@@ -108,7 +164,7 @@ async def test_winner_advances_to_next_match_even_slot(
     """Even match_number winner goes into participant2_id of the next match."""
     organizer = await create_user(email="mp_org3@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=4, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u3a@example.com")
     u2 = await create_user(email="mp_u3b@example.com")
@@ -150,7 +206,7 @@ async def test_next_match_becomes_ready_when_both_slots_filled(
     """Next match status becomes READY once both participant slots are filled."""
     organizer = await create_user(email="mp_org4@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=4, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u4a@example.com")
     u2 = await create_user(email="mp_u4b@example.com")
@@ -193,6 +249,7 @@ async def test_semifinal_loser_fills_third_place_odd_slot(
     organizer = await create_user(email="mp_org5@example.com")
     announcement = await create_announcement(
         organizer_id=organizer.id,
+        bracket_size=4,
         status=AnnouncementStatus.LIVE,
         third_place_match=True,
     )
@@ -213,7 +270,7 @@ async def test_semifinal_loser_fills_third_place_odd_slot(
     )
     third_place = await create_match(
         announcement_id=announcement.id,
-        round_number=2,
+        round_number=1,
         match_number=3,
         status=MatchStatus.PENDING,
         is_third_place=True,
@@ -246,6 +303,7 @@ async def test_third_place_match_becomes_ready_after_both_semis(
     organizer = await create_user(email="mp_org6@example.com")
     announcement = await create_announcement(
         organizer_id=organizer.id,
+        bracket_size=4,
         status=AnnouncementStatus.LIVE,
         third_place_match=True,
     )
@@ -265,7 +323,7 @@ async def test_third_place_match_becomes_ready_after_both_semis(
     )
     third_place = await create_match(
         announcement_id=announcement.id,
-        round_number=2,
+        round_number=1,
         match_number=3,
         status=MatchStatus.PENDING,
         is_third_place=True,
@@ -313,7 +371,7 @@ async def test_final_assigns_placements_1_and_2(
     """Winner of the final gets placement=1, loser gets placement=2."""
     organizer = await create_user(email="mp_org7@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u7a@example.com")
     u2 = await create_user(email="mp_u7b@example.com")
@@ -346,7 +404,7 @@ async def test_third_place_match_assigns_placements_3_and_4(
     """Winner of the third-place match gets placement=3, loser gets placement=4."""
     organizer = await create_user(email="mp_org8@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=4, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u8a@example.com")
     u2 = await create_user(email="mp_u8b@example.com")
@@ -355,7 +413,7 @@ async def test_third_place_match_assigns_placements_3_and_4(
 
     third_place = await create_match(
         announcement_id=announcement.id,
-        round_number=2,
+        round_number=1,
         match_number=3,
         status=MatchStatus.READY,
         is_third_place=True,
@@ -389,7 +447,7 @@ async def test_tournament_completes_and_announcement_becomes_finished(
     """After the only match completes, announcement transitions to FINISHED."""
     organizer = await create_user(email="mp_org9@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u9a@example.com")
     u2 = await create_user(email="mp_u9b@example.com")
@@ -420,7 +478,7 @@ async def test_raises_when_match_not_ready(
     """ValidationException when trying to report a result on a PENDING match."""
     organizer = await create_user(email="mp_org10@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u10a@example.com")
     u2 = await create_user(email="mp_u10b@example.com")
@@ -451,7 +509,7 @@ async def test_raises_when_match_is_bye(
     """ValidationException when trying to report a result on a BYE match."""
     organizer = await create_user(email="mp_org12@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u12a@example.com")
     p1 = await create_participant(announcement_id=announcement.id, user_id=u1.id)
@@ -481,7 +539,7 @@ async def test_raises_when_selected_winner_slot_is_empty(
     """ValidationException when selected winner slot has no participant."""
     organizer = await create_user(email="mp_org13@example.com")
     announcement = await create_announcement(
-        organizer_id=organizer.id, status=AnnouncementStatus.LIVE
+        organizer_id=organizer.id, bracket_size=2, status=AnnouncementStatus.LIVE
     )
     u1 = await create_user(email="mp_u13a@example.com")
     p1 = await create_participant(announcement_id=announcement.id, user_id=u1.id)
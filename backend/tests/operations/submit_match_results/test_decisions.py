@@ -0,0 +1,119 @@
+import pytest
+
+from enums import MatchStatus
+from exceptions import ValidationException
+from operations.submit_match_result.structures import MatchSnapshot
+from operations.submit_match_results.decisions import SubmitMatchResultsDecisions
+from operations.submit_match_results.structures import (
+    MatchResultSelection,
+    SubmitMatchResultsSnapshot,
+)
+
+
+def _match(
+    match_id: int,
+    *,
+    round_number: int,
+    match_number: int,
+    status: MatchStatus = MatchStatus.PENDING,
+    participant1_id: int | None = None,
+    participant2_id: int | None = None,
+    is_third_place: bool = False,
+) -> MatchSnapshot:
+    return MatchSnapshot(
+        id=match_id,
+        round_number=round_number,
+        match_number=match_number,
+        status=status,
+        participant1_id=participant1_id,
+        participant2_id=participant2_id,
+        is_bye=False,
+        is_third_place=is_third_place,
+    )
+
+
+def _four_player_bracket() -> list[MatchSnapshot]:
+    return [
+        _match(
+            1,
+            round_number=1,
+            match_number=1,
+            status=MatchStatus.READY,
+            participant1_id=11,
+            participant2_id=14,
+        ),
+        _match(
+            2,
+            round_number=1,
+            match_number=2,
+            status=MatchStatus.READY,
+            participant1_id=12,
+            participant2_id=13,
+        ),
+        _match(3, round_number=1, match_number=3, is_third_place=True),
+        _match(4, round_number=2, match_number=1),
+    ]
+
+
+def _snapshot(*results: tuple[int, str]) -> SubmitMatchResultsSnapshot:
+    return SubmitMatchResultsSnapshot(
+        announcement_id=1,
+        bracket_size=4,
+        third_place_match_enabled=True,
+        matches=_four_player_bracket(),
+        results=[
+            MatchResultSelection(match_id=match_id, selected_winner_slot=slot)
+            for match_id, slot in results
+        ],
+    )
+
+
+def test_batch_decides_dependent_results_in_bracket_order():
+    snapshot = _snapshot(
+        (4, "participant2"),
+        (3, "participant1"),
+        (2, "participant1"),
+        (1, "participant2"),
+    )
+
+    decision = SubmitMatchResultsDecisions().make(snapshot)
+
+    assert [result.match_id for result in decision.results] == [1, 2, 3, 4]
+    assert [result.winner_id for result in decision.results] == [14, 12, 11, 12]
+    assert [
+        (p.participant_id, p.placement)
+        for result in decision.results
+        for p in result.placements
+    ] == [(11, 3), (13, 4), (12, 1), (14, 2)]
+    assert decision.auto_finish_announcement is True
+
+
+def test_batch_marks_next_match_ready_once_both_feeders_are_decided():
+    decision = SubmitMatchResultsDecisions().make(
+        _snapshot((1, "participant1"), (2, "participant2"))
+    )
+
+    final_assignments = [
+        a for result in decision.results for a in result.assignments if a.match_id == 4
+    ]
+    assert [(a.slot, a.participant_id, a.mark_ready) for a in final_assignments] == [
+        ("participant1", 11, False),
+        ("participant2", 13, True),
+    ]
+    assert decision.auto_finish_announcement is False
+
+
+def test_batch_rejects_result_for_match_whose_feeders_are_missing():
+    with pytest.raises(ValidationException, match="Match 4: Match is not ready"):
+        SubmitMatchResultsDecisions().make(
+            _snapshot((1, "participant1"), (4, "participant1"))
+        )
+
+
+def test_batch_rejects_duplicate_and_foreign_matches():
+    with pytest.raises(ValidationException, match="more than once"):
+        SubmitMatchResultsDecisions().make(
+            _snapshot((1, "participant1"), (1, "participant2"))
+        )
+    with pytest.raises(ValidationException, match="does not belong"):
+        SubmitMatchResultsDecisions().make(_snapshot((99, "participant1")))
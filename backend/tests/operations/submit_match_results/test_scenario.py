@@ -0,0 +1,148 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import select
+
+from modules.matches.model import Match
+from modules.matches.schemas import MatchResultEntry, MatchResultsBatchUpdate
+from operations.submit_match_results.contract import SubmitMatchResultsContract
+from operations.submit_match_results.scenario import SubmitMatchResultsScenario
+from enums import AnnouncementStatus, MatchStatus
+from exceptions import ValidationException
+
+
+async def _reload_match(db_session, match_id: int) -> Match:
+    """Reload a match from the DB, bypassing the session identity map."""
+    result = await db_session.execute(
+        select(Match)
+        .where(Match.id == match_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def _submit_match_results(db_session, announcement, *results) -> list[Match]:
+    return await SubmitMatchResultsScenario(db_session).run(
+        SubmitMatchResultsContract(
+            announcement_id=announcement.id,
+            results_in=MatchResultsBatchUpdate(
+                results=[
+                    MatchResultEntry(match_id=match.id, winner=winner)
+                    for match, winner in results
+                ]
+            ),
+        )
+    )
+
+
+async def _four_player_bracket(
+    create_user, create_announcement, create_participant, create_match
+):
+    organizer = await create_user(email="batch_org@example.com")
+    announcement = await create_announcement(
+        organizer_id=organizer.id,
+        bracket_size=4,
+        third_place_match=True,
+        status=AnnouncementStatus.LIVE,
+    )
+    users = [await create_user(email=f"batch_u{i}@example.com") for i in range(4)]
+    ps = [
+        await create_participant(announcement_id=announcement.id, user_id=u.id)
+        for u in users
+    ]
+    final = await create_match(
+        announcement_id=announcement.id,
+        round_number=2,
+        match_number=1,
+        status=MatchStatus.PENDING,
+        participant1_id=None,
+        participant2_id=None,
+    )
+    third_place = await create_match(
+        announcement_id=announcement.id,
+        round_number=1,
+        match_number=3,
+        status=MatchStatus.PENDING,
+        is_third_place=True,
+        participant1_id=None,
+        participant2_id=None,
+    )
+    semi1 = await create_match(
+        announcement_id=announcement.id,
+        round_number=1,
+        match_number=1,
+        status=MatchStatus.READY,
+        participant1_id=ps[0].id,
+        participant2_id=ps[1].id,
+        next_match_winner_id=final.id,
+    )
+    semi2 = await create_match(
+        announcement_id=announcement.id,
+        round_number=1,
+        match_number=2,
+        status=MatchStatus.READY,
+        participant1_id=ps[2].id,
+        participant2_id=ps[3].id,
+        next_match_winner_id=final.id,
+    )
+    return announcement, ps, semi1, semi2, third_place, final
+
+
+@pytest.mark.asyncio
+async def test_batch_completes_whole_bracket_in_one_submission(
+    db_session, create_user, create_announcement, create_participant, create_match
+):
+    """Semifinals, third place and final submitted together finish the bracket."""
+    announcement, ps, semi1, semi2, third_place, final = await _four_player_bracket(
+        create_user, create_announcement, create_participant, create_match
+    )
+
+    with patch(
+        "operations.submit_match_results.gateway.publish_on_commit"
+    ) as publish_on_commit:
+        matches = await _submit_match_results(
+            db_session,
+            announcement,
+            (final, "participant2"),
+            (third_place, "participant1"),
+            (semi1, "participant1"),
+            (semi2, "participant2"),
+        )
+    await db_session.commit()
+
+    assert [m.id for m in matches] == [semi1.id, semi2.id, third_place.id, final.id]
+    final = await _reload_match(db_session, final.id)
+    assert final.participant1_id == ps[0].id
+    assert final.participant2_id == ps[3].id
+    assert final.winner_id == ps[3].id
+    assert final.status == MatchStatus.COMPLETED
+    third_place = await _reload_match(db_session, third_place.id)
+    assert third_place.winner_id == ps[1].id
+
+    for participant in ps:
+        await db_session.refresh(participant)
+    assert [p.placement for p in ps] == [2, 3, 4, 1]
+    await db_session.refresh(announcement)
+    assert announcement.status == AnnouncementStatus.FINISHED
+    assert publish_on_commit.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_is_rejected_as_a_whole(
+    db_session, create_user, create_announcement, create_participant, create_match
+):
+    """An invalid result rejects the batch before anything is written."""
+    announcement, _, semi1, _, _, final = await _four_player_bracket(
+        create_user, create_announcement, create_participant, create_match
+    )
+
+    with pytest.raises(ValidationException, match=f"Match {final.id}"):
+        await _submit_match_results(
+            db_session,
+            announcement,
+            (semi1, "participant1"),
+            (final, "participant1"),
+        )
+
+    semi1 = await _reload_match(db_session, semi1.id)
+    assert semi1.status == MatchStatus.READY
+    assert semi1.winner_id is None
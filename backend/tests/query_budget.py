@@ -0,0 +1,42 @@
+"""Pytest plugin asserting how many SQL statements a block of a test may run."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+
+from core.db.query_stats import QueryStats, track_queries
+
+
+def _format_statements(stats: QueryStats) -> str:
+    return "\n".join(
+        f"  {count}x {' '.join(statement.split())}"
+        for statement, count in stats.by_statement.most_common()
+    )
+
+
+@pytest.fixture
+def query_budget():
+    """Return a context manager failing the test when its block exceeds a budget.
+
+    Counts the statements of every instrumented engine (the test ``engine``
+    fixture included) run inside the block, e.g. around one request::
+
+        with query_budget(4):
+            r = await async_client.get("/api/v1/announcements/1/matches")
+
+    The failure message lists each statement with how often it ran, so an N+1
+    shows up as one statement with a high count.
+    """
+
+    @contextmanager
+    def _budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        if stats.statements > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {stats.statements} statements, "
+                f"budget {max_queries}\n{_format_statements(stats)}"
+            )
+
+    return _budget
@@ -1,7 +1,11 @@
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, AsyncMock
-from tasks.announcement_tasks import update_announcement_statuses
+from unittest.mock import MagicMock, AsyncMock, patch
+from tasks.announcement_tasks import (
+    _schedule_transitions,
+    transition_announcement_status,
+    update_announcement_statuses,
+)
 from modules.announcements.model import Announcement
 from modules.games.model import Game
 from enums import AnnouncementStatus, AnnouncementFormat, SeedMethod
@@ -393,3 +397,89 @@ async def test_update_announcement_statuses_exact_time_boundary(
         assert announcement.status == AnnouncementStatus.REGISTRATION_OPEN
     finally:
         tasks.announcement_tasks.get_db = original_get_db
+
+
+@pytest.mark.asyncio
+async def test_transition_announcement_status_changes_only_that_announcement(
+    db_session, create_user
+):
+    """Test the per-announcement job leaves other due announcements alone."""
+    user = await create_user(email="organizer_transition@example.com")
+    game = Game(name="Transition Game", category="RTS", description="Test")
+    db_session.add(game)
+    await db_session.commit()
+    await db_session.refresh(game)
+
+    now = datetime.now(timezone.utc)
+    announcements = [
+        Announcement(
+            title=f"Due Announcement {i}",
+            content="Content",
+            game_id=game.id,
+            organizer_id=user.id,
+            status=AnnouncementStatus.PRE_REGISTRATION,
+            registration_start_at=now - timedelta(minutes=1),
+            registration_end_at=now + timedelta(hours=1),
+            start_at=now + timedelta(days=1),
+            max_participants=10,
+            format=AnnouncementFormat.SINGLE_ELIMINATION,
+            has_qualification=False,
+            seed_method=SeedMethod.RANDOM,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(announcements)
+    await db_session.commit()
+
+    mock_db = MagicMock()
+    mock_db.session_factory.return_value.__aenter__.return_value = db_session
+    mock_db.session_factory.return_value.__aexit__.return_value = AsyncMock()
+
+    import tasks.announcement_tasks
+
+    original_get_db = tasks.announcement_tasks.get_db
+    tasks.announcement_tasks.get_db = lambda: mock_db
+
+    try:
+        await transition_announcement_status(announcements[0].id)
+
+        for announcement in announcements:
+            await db_session.refresh(announcement)
+        assert announcements[0].status == AnnouncementStatus.REGISTRATION_OPEN
+        assert announcements[1].status == AnnouncementStatus.PRE_REGISTRATION
+    finally:
+        tasks.announcement_tasks.get_db = original_get_db
+
+
+@pytest.mark.asyncio
+async def test_schedule_transitions_replaces_future_schedules_only():
+    """Test each commit replaces the announcement's schedules, skipping past times."""
+    now = datetime.now(timezone.utc)
+    source = MagicMock()
+    source.delete_schedule = AsyncMock()
+    task = MagicMock()
+    kicker = task.kicker.return_value.with_schedule_id.return_value
+    kicker.schedule_by_time = AsyncMock()
+
+    with (
+        patch("tasks.scheduler.get_scheduler") as get_scheduler,
+        patch("tasks.announcement_tasks.transition_announcement_status", task),
+    ):
+        get_scheduler.return_value.sources = [source]
+        await _schedule_transitions(
+            [
+                (7, now + timedelta(hours=1), now + timedelta(hours=2)),
+                (7, now - timedelta(hours=1), now + timedelta(hours=3)),
+            ]
+        )
+
+    assert [c.args[0] for c in source.delete_schedule.await_args_list] == [
+        "announcement:7:registration_open",
+        "announcement:7:registration_closed",
+    ]
+    task.kicker.return_value.with_schedule_id.assert_called_once_with(
+        "announcement:7:registration_closed"
+    )
+    kicker.schedule_by_time.assert_awaited_once_with(
+        source, now + timedelta(hours=3), 7
+    )
@@ -0,0 +1,127 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import select
+
+from core.outbox import REGISTRATION_STATUS_EMAIL_TASK, add_to_outbox, task_name_of
+from modules.outbox.model import OutboxMessage
+from modules.users.model import User
+from tasks.email_tasks import (
+    send_registration_status_email_task,
+    send_verification_email_task,
+)
+from tasks.outbox_tasks import relay_outbox_task
+
+VERIFICATION_EMAIL_TASK = task_name_of(send_verification_email_task)
+
+
+def _mock_db(db_session):
+    """Hand out ``db_session``, rolling it back on exit as closing a session does."""
+
+    async def close(*exc_info) -> bool:
+        await db_session.rollback()
+        return False
+
+    mock_db = MagicMock()
+    mock_db.session_factory.return_value.__aenter__.return_value = db_session
+    mock_db.session_factory.return_value.__aexit__.side_effect = close
+    return mock_db
+
+
+async def _outbox(db_session) -> list[OutboxMessage]:
+    result = await db_session.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+    return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_registration_writes_verification_email_to_outbox(
+    db_session, create_user
+):
+    """Test the verification email is written to the outbox, not sent inline."""
+    user = await create_user(email="outbox@example.com")
+
+    messages = await _outbox(db_session)
+
+    assert [m.task_name for m in messages] == [VERIFICATION_EMAIL_TASK]
+    assert messages[0].kwargs["email"] == user.email
+    assert messages[0].kwargs["token"]
+
+
+def test_registration_status_email_task_name_matches_the_task():
+    assert (
+        task_name_of(send_registration_status_email_task)
+        == REGISTRATION_STATUS_EMAIL_TASK
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_registration_writes_neither_user_nor_outbox(
+    db_session, create_user
+):
+    """Test the user and its verification message commit or roll back together."""
+    with patch(
+        "core.user_manager.UserManager.on_after_request_verify",
+        side_effect=RuntimeError("boom"),
+    ):
+        with pytest.raises(RuntimeError):
+            await create_user(email="atomic@example.com")
+
+    users = await db_session.execute(
+        select(User).where(User.email == "atomic@example.com")
+    )
+    assert users.scalar_one_or_none() is None
+    assert await _outbox(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_relay_sends_messages_in_batches_and_deletes_them(db_session):
+    """Test the relay drains the outbox across several batches."""
+    for i in range(3):
+        add_to_outbox(db_session, VERIFICATION_EMAIL_TASK, email=f"{i}@t")
+    await db_session.commit()
+
+    kicker = MagicMock()
+    kicker.return_value.kiq = AsyncMock()
+
+    with (
+        patch("tasks.outbox_tasks.get_db", return_value=_mock_db(db_session)),
+        patch("tasks.outbox_tasks.AsyncKicker", kicker),
+    ):
+        result = await relay_outbox_task(batch_size=2)
+
+    assert result == 3
+    assert [c.kwargs for c in kicker.return_value.kiq.await_args_list] == [
+        {"email": "0@t"},
+        {"email": "1@t"},
+        {"email": "2@t"},
+    ]
+    assert await _outbox(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_failed_send_keeps_the_batch_for_the_next_run(db_session):
+    """Test a broker failure rolls the batch back and the next run resends it."""
+    add_to_outbox(db_session, VERIFICATION_EMAIL_TASK, email="a@t")
+    add_to_outbox(db_session, VERIFICATION_EMAIL_TASK, email="b@t")
+    await db_session.commit()
+
+    kicker = MagicMock()
+    kicker.return_value.kiq = AsyncMock(side_effect=[None, ConnectionError("down")])
+
+    with (
+        patch("tasks.outbox_tasks.get_db", return_value=_mock_db(db_session)),
+        patch("tasks.outbox_tasks.AsyncKicker", kicker),
+    ):
+        with pytest.raises(ConnectionError):
+            await relay_outbox_task()
+
+        assert len(await _outbox(db_session)) == 2
+
+        kicker.return_value.kiq = AsyncMock()
+        result = await relay_outbox_task()
+
+    assert result == 2
+    assert [c.kwargs for c in kicker.return_value.kiq.await_args_list] == [
+        {"email": "a@t"},
+        {"email": "b@t"},
+    ]
+    assert await _outbox(db_session) == []
@@ -311,3 +311,61 @@ async def test_expire_registration_requests_mixed_statuses(db_session, create_us
         assert rejected_request.status == RegistrationStatus.REJECTED
     finally:
         tasks.registration_request_tasks.get_db = original_get_db
+
+
+@pytest.mark.asyncio
+async def test_expire_registration_requests_in_chunks(db_session, create_user):
+    """Test task expires every request when they span several chunks."""
+    users = [await create_user(email=f"chunk{i}@example.com") for i in range(3)]
+    game = Game(name="Chunk Game", category="RTS", description="Test")
+    db_session.add(game)
+    await db_session.commit()
+    await db_session.refresh(game)
+
+    now = datetime.now()
+    announcement = Announcement(
+        title="Chunk Announcement",
+        content="c",
+        game_id=game.id,
+        organizer_id=users[0].id,
+        registration_start_at=now - timedelta(hours=2),
+        registration_end_at=now - timedelta(hours=1),
+        start_at=now + timedelta(days=1),
+        max_participants=10,
+        format=AnnouncementFormat.SINGLE_ELIMINATION,
+        has_qualification=False,
+        seed_method=SeedMethod.RANDOM,
+    )
+    db_session.add(announcement)
+    await db_session.commit()
+    await db_session.refresh(announcement)
+
+    requests = [
+        RegistrationRequest(
+            announcement_id=announcement.id,
+            user_id=user.id,
+            status=RegistrationStatus.PENDING,
+        )
+        for user in users
+    ]
+    db_session.add_all(requests)
+    await db_session.commit()
+
+    mock_db = MagicMock()
+    mock_db.session_factory.return_value.__aenter__.return_value = db_session
+    mock_db.session_factory.return_value.__aexit__.return_value = AsyncMock()
+
+    import tasks.registration_request_tasks
+
+    original_get_db = tasks.registration_request_tasks.get_db
+    tasks.registration_request_tasks.get_db = lambda: mock_db
+
+    try:
+        result = await expire_registration_requests_task(chunk_size=2)
+
+        assert result == 3
+        for registration_request in requests:
+            await db_session.refresh(registration_request)
+            assert registration_request.status == RegistrationStatus.EXPIRED
+    finally:
+        tasks.registration_request_tasks.get_db = original_get_db
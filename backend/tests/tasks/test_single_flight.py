@@ -0,0 +1,189 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from taskiq import ScheduledTask
+
+from core.locks import LeaseLock, LeaseLostError, _EXTEND_SCRIPT, _RELEASE_SCRIPT
+from tasks.scheduler import register_periodic_tasks
+from tasks.single_flight import ensure_lease, single_flight
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, int] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def incr(self, key):
+        self.store[key] = self.store.get(key, 0) + 1
+        return self.store[key]
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        self.ttls[key] = px
+        return True
+
+    async def get(self, key):
+        value = self.store.get(key)
+        return None if value is None else str(value).encode()
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.store.get(key) != token:
+            return 0
+        if script == _RELEASE_SCRIPT:
+            del self.store[key]
+        elif script == _EXTEND_SCRIPT:
+            self.ttls[key] = args[0]
+        return 1
+
+
+def locks_enabled(redis: FakeRedis):
+    settings = SimpleNamespace(
+        schedule=SimpleNamespace(locks_enabled=True, lock_ttl_seconds=60)
+    )
+    return (
+        patch("tasks.single_flight.get_settings", return_value=settings),
+        patch("tasks.single_flight.get_lock_redis", return_value=redis),
+    )
+
+
+@pytest.mark.asyncio
+async def test_lease_tokens_increase_and_only_the_holder_releases():
+    redis = FakeRedis()
+    first = LeaseLock(redis, "job", ttl_seconds=1)
+    second = LeaseLock(redis, "job", ttl_seconds=1)
+
+    assert await first.acquire() is True
+    assert await second.acquire() is False
+
+    del redis.store["lock:job"]
+    assert await second.acquire() is True
+    assert second.token > first.token
+
+    await first.release()
+    assert await first.is_held() is False
+    assert await first.extend() is False
+    assert await second.is_held() is True
+
+
+@pytest.mark.asyncio
+async def test_overlapping_runs_are_skipped():
+    redis = FakeRedis()
+    started, finish = asyncio.Event(), asyncio.Event()
+    runs = []
+
+    @single_flight()
+    async def job():
+        runs.append(1)
+        started.set()
+        await finish.wait()
+        return "done"
+
+    settings_patch, redis_patch = locks_enabled(redis)
+    with settings_patch, redis_patch:
+        first = asyncio.create_task(job())
+        await started.wait()
+        assert await job() is None
+        finish.set()
+        assert await first == "done"
+        assert await job() == "done"
+
+    assert len(runs) == 2
+    assert "lock:job" not in redis.store
+
+
+@pytest.mark.asyncio
+async def test_ensure_lease_fails_after_a_newer_run_took_over():
+    redis = FakeRedis()
+
+    @single_flight()
+    async def job():
+        await ensure_lease()
+        redis.store["lock:job"] = await redis.incr("lock:job:fence")
+        await ensure_lease()
+
+    settings_patch, redis_patch = locks_enabled(redis)
+    with settings_patch, redis_patch, pytest.raises(LeaseLostError):
+        await job()
+
+    assert redis.store["lock:job"] == 2
+
+
+@pytest.mark.asyncio
+async def test_registration_leaves_one_schedule_per_task():
+    announcements = MagicMock(__name__="update_announcement_statuses")
+    announcements.__module__ = "tasks.announcement_tasks"
+    expiry = MagicMock(__name__="expire_registration_requests_task")
+    expiry.__module__ = "tasks.registration_request_tasks"
+    relay = MagicMock(__name__="relay_outbox_task")
+    relay.__module__ = "tasks.outbox_tasks"
+    for task in (announcements, expiry, relay):
+        task.kicker.return_value.with_schedule_id.return_value.schedule_by_cron = (
+            AsyncMock()
+        )
+
+    def schedule(task_name, schedule_id, cron):
+        return ScheduledTask(
+            task_name=task_name,
+            labels={},
+            args=[],
+            kwargs={},
+            schedule_id=schedule_id,
+            cron=cron,
+        )
+
+    source = MagicMock()
+    source.startup = AsyncMock()
+    source.delete_schedule = AsyncMock()
+    source.get_schedules = AsyncMock(
+        return_value=[
+            schedule(
+                "tasks.announcement_tasks:update_announcement_statuses",
+                "random-1",
+                "* * * * *",
+            ),
+            schedule(
+                "tasks.announcement_tasks:update_announcement_statuses",
+                "random-2",
+                "* * * * *",
+            ),
+            schedule(
+                "tasks.registration_request_tasks:expire_registration_requests_task",
+                "expire_registration_requests_task",
+                "*/5 * * * *",
+            ),
+        ]
+    )
+    settings = SimpleNamespace(
+        schedule=SimpleNamespace(locks_enabled=False, reconcile_cron="*/15 * * * *")
+    )
+
+    with (
+        patch("tasks.announcement_tasks.update_announcement_statuses", announcements),
+        patch(
+            "tasks.registration_request_tasks.expire_registration_requests_task", expiry
+        ),
+        patch("tasks.outbox_tasks.relay_outbox_task", relay),
+        patch("tasks.scheduler.get_scheduler") as get_scheduler,
+        patch("tasks.scheduler.get_settings", return_value=settings),
+        patch("tasks.single_flight.get_settings", return_value=settings),
+    ):
+        get_scheduler.return_value.sources = [source]
+        await register_periodic_tasks()
+
+    assert sorted(c.args[0] for c in source.delete_schedule.await_args_list) == [
+        "random-1",
+        "random-2",
+    ]
+    announcements.kicker.return_value.with_schedule_id.assert_called_once_with(
+        "update_announcement_statuses"
+    )
+    scheduled = announcements.kicker.return_value.with_schedule_id.return_value
+    scheduled.schedule_by_cron.assert_awaited_once_with(source, "*/15 * * * *")
+    expiry.kicker.assert_not_called()
+    relay.kicker.return_value.with_schedule_id.assert_called_once_with(
+        "relay_outbox_task"
+    )
@@ -8,8 +8,10 @@ without a database and complete in milliseconds.
 Invariants enforced:
 - decisions.py in operations must be pure business rules (no SQLAlchemy, no FastAPI)
 - modules must not import from operations (dependency direction: operations → modules, never the reverse)
+- operations and modules must not import tasks (they queue work through commit hooks and the outbox)
 - module service files must not import core.permissions (authorization belongs at entrypoints only)
 - gateway.py in operations must cache loaded entities (load() sets self._<entity>, apply() uses assert)
+- models must not declare eager relationship loading (loader profiles choose it per query)
 """
 
 import ast
@@ -88,6 +90,24 @@ def test_modules_do_not_import_operations():
         )
 
 
+def test_operations_and_modules_do_not_import_tasks():
+    """
+    Operations and domain modules must not import from tasks.
+
+    Tasks import operations and modules, never the reverse. Work that must
+    follow a write is queued with ``core.outbox.add_to_outbox`` or a commit
+    hook that the tasks package registers.
+    """
+    for directory in (OPERATIONS_DIR, MODULES_DIR):
+        for path in directory.rglob("*.py"):
+            imports = _collect_imports(path)
+            violations = [i for i in imports if i == "tasks" or i.startswith("tasks.")]
+            assert not violations, (
+                f"{path.relative_to(BACKEND_DIR)}: must not import from tasks, "
+                f"found: {violations}"
+            )
+
+
 def test_module_services_do_not_import_permissions():
     """
     Module service files must not perform authorization.
@@ -208,3 +228,33 @@ def test_gateway_apply_uses_cached_entity():
                 f"cached attributes {missing} in __init__ but does not assert them — "
                 f"add `assert self.{next(iter(missing))} is not None` at the top of apply()."
             )
+
+
+EAGER_LAZY_STRATEGIES = {"selectin", "joined", "subquery", "immediate"}
+
+
+def test_models_do_not_declare_eager_relationships():
+    """
+    Relationships must not load eagerly by default.
+
+    A ``lazy="selectin"`` default turns every load of the parent, even a
+    primary-key ``session.get``, into extra queries that most callers never
+    read. Queries pick what they need from the module's ``LoaderProfiles``.
+    """
+    for path in MODULES_DIR.rglob("model*.py"):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Call)
+                and getattr(node.func, "id", None) == "relationship"
+            ):
+                continue
+            for keyword in node.keywords:
+                assert not (
+                    keyword.arg == "lazy"
+                    and isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value in EAGER_LAZY_STRATEGIES
+                ), (
+                    f"{path.relative_to(BACKEND_DIR)}:{node.lineno}: relationship "
+                    f"declares lazy={keyword.value.value!r}; use a loader profile"
+                )